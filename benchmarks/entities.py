@@ -0,0 +1,63 @@
+"""Mémoire par entité et coût d'accès à rect (obstacles, médailles).
+
+Usage : python benchmarks/entities.py [--count N]
+
+Mémoire mesurée avec tracemalloc en créant N objets ; rect est lu trois
+fois par objet et par tick (collision, ramassage, rendu), une fois après
+un changement de y (cache à recalculer) et deux fois en cache.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from game.core import settings  # noqa: E402
+from game.models.entities import Medal, Obstacle  # noqa: E402
+
+KINDS = {
+    "Obstacle": lambda i: Obstacle(lane=i % settings.LANES, y=float(i), obstacle_type="tree"),
+    "Medal": lambda i: Medal(kind="gold", lane=i % settings.LANES, y=float(i)),
+}
+
+
+def _bytes_per_entity(make, count):
+    """(octets par objet, octets du cache de rect) ; la liste n'est pas comptée."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [make(i) for i in range(count)]
+    created = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(entities)
+    for entity in entities:
+        entity.rect
+    cached = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(entities)
+    tracemalloc.stop()
+    return created / count, (cached - created) / count
+
+
+def _ns_per_access(entities, fresh):
+    start = time.perf_counter()
+    for entity in entities:
+        if fresh:
+            entity.y = entity.y  # Invalide le cache
+        entity.rect
+    return (time.perf_counter() - start) * 1e9 / len(entities)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for name, make in KINDS.items():
+        size, rect_size = _bytes_per_entity(make, args.count)
+        entities = [make(i) for i in range(args.count)]
+        fresh = min(_ns_per_access(entities, True) for _ in range(5))
+        cached = min(_ns_per_access(entities, False) for _ in range(5))
+        print(f"{name:<9} {size:5.0f} octets/objet (+{rect_size:.0f} haut du rect en cache)   "
+              f"rect recalculé {fresh:5.0f} ns   en cache {cached:5.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
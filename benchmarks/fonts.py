@@ -0,0 +1,87 @@
+"""Micro-benchmark des polices : compte à rebours et écran de game over.
+
+Usage : python benchmarks/fonts.py [--frames N]
+
+Compare le coût d'une frame quand les polices sont recréées à chaque
+frame (comportement avant FontRegistry) et quand elles sont en cache.
+Seule la construction des polices diffère : les textes déjà rendus
+(TextCache) restent en cache dans les deux cas.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pygame  # noqa: E402
+
+from game.core import settings  # noqa: E402
+from game.core.fonts import FontRegistry  # noqa: E402
+from game.views.renderer import Renderer, COUNTDOWN_ASSETS  # noqa: E402
+
+
+def _countdown(renderer, screen, i, frames):
+    # Sans image de compteur pour passer par le rendu texte animé
+    renderer.draw_countdown(screen, 3 - (i * 3 // frames), (i % 60) / 60)
+
+
+def _game_over(renderer, screen, i, frames):
+    renderer.draw_game_over(screen, 1234, 56, 789, 2000, min(1.0, i / 60))
+
+
+def _fonts_per_frame(draw, renderer, screen, frames):
+    """Polices (police, taille, gras) demandées à chaque frame ; remplit aussi les caches."""
+    used = []
+    original = FontRegistry.__dict__["get"]
+    get = FontRegistry.get
+
+    def recording(face, size, bold=False):
+        used[-1].append((face, size, bold))
+        return get(face, size, bold)
+
+    FontRegistry.get = recording
+    try:
+        for i in range(frames):
+            used.append([])
+            draw(renderer, screen, i, frames)
+    finally:
+        FontRegistry.get = original
+    return used
+
+
+def _measure(draw, renderer, screen, frames, fonts=None):
+    """fonts : polices à construire avant chaque frame (None : registre seul)."""
+    start = time.perf_counter()
+    for i in range(frames):
+        if fonts is not None:
+            for face, size, bold in fonts[i]:
+                pygame.font.SysFont(face, size, bold=bold)
+        draw(renderer, screen, i, frames)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    renderer = Renderer()
+    renderer.countdown_images = {step: None for step in COUNTDOWN_ASSETS}
+
+    for name, draw in (("countdown", _countdown), ("game over", _game_over)):
+        fonts = _fonts_per_frame(draw, renderer, screen, args.frames)
+        before = _measure(draw, renderer, screen, args.frames, fonts)
+        after = _measure(draw, renderer, screen, args.frames)
+        print(f"{name:10s} per-frame fonts: {before:7.3f} ms   registry: {after:7.3f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Temps de frame du hockey : stade redessiné à chaque frame vs calque pré-composé.
+
+Usage : python benchmarks/hockey_frame.py [--frames N]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pygame  # noqa: E402
+
+from game.core import settings  # noqa: E402
+from game.core.game import Game  # noqa: E402
+from game.core.headless import VirtualClock  # noqa: E402
+from game.hockey.scene import HockeyScene  # noqa: E402
+
+
+def _measure(scene, screen, frames, baked):
+    renderer = scene.renderer
+    start = time.perf_counter()
+    for _ in range(frames):
+        if not baked:
+            renderer._rink_layers.clear()  # Force la recomposition, comme avant le calque
+        scene.update(1000 / settings.FPS)
+        scene.render(screen)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    game = Game(headless=True, clock=VirtualClock())
+    game.wait_until_loaded()
+    screen = game.screen
+    scene = HockeyScene(game)
+    game.change_scene(scene)
+
+    before = _measure(scene, screen, args.frames, baked=False)
+    after = _measure(scene, screen, args.frames, baked=True)
+    print(f"hockey frame  redrawn stadium: {before:7.3f} ms   baked layer: {after:7.3f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
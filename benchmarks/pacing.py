@@ -0,0 +1,77 @@
+"""Compare les stratégies de cadence : histogrammes de latence entrée -> image et de jitter.
+
+Usage : python benchmarks/pacing.py [--seconds N] [--strategies sleep hybrid vsync] [--dummy]
+
+Ouvre une vraie fenêtre (la synchro verticale n'existe qu'avec un écran) ;
+--dummy force le driver SDL sans affichage. Pour chaque stratégie, une
+descente de ski tourne pendant N secondes avec des appuis de touches
+simulés, passés par la file d'événements de pygame.
+"""
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _press_keys(frame):
+    import pygame
+
+    if frame % random.randint(7, 13) == 0:
+        key = random.choice((pygame.K_LEFT, pygame.K_RIGHT))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+
+
+def _run(game, strategy, seconds):
+    from game.core.latency import LatencyMonitor
+    from game.scenes.ski import SkiScene
+
+    game.set_pacing(strategy)
+    game.change_scene(SkiScene(game))
+    LatencyMonitor.reset()
+    for frame in range(int(seconds * 60)):
+        if type(game.scene).__name__ != "SkiScene":
+            game.change_scene(SkiScene(game))
+        _press_keys(frame)
+        game.step()
+    label = strategy if game.pacing == strategy else f"{strategy} (remplacée par {game.pacing})"
+    print(LatencyMonitor.report(label))
+    print()
+
+
+def main():
+    from game.core.pacing import STRATEGIES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--dummy", action="store_true", help="sans affichage (pas de vsync)")
+    args = parser.parse_args()
+
+    if args.dummy:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import pygame
+
+    from game.core import settings
+    from game.core.game import Game
+    from game.core.latency import LatencyMonitor
+    from game.core.loader import AssetLoader
+
+    settings.FULLSCREEN = False
+    settings.SAVE_BEST_SCORE = False
+    random.seed(0)
+    LatencyMonitor.enabled = True
+    game = Game()
+    game.wait_until_loaded()
+    for strategy in args.strategies:
+        _run(game, strategy, args.seconds)
+
+    AssetLoader.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Pauses du GC pendant une longue descente, avec et sans recyclage des objets.
+
+Usage : python benchmarks/pools.py [--frames N]
+
+Une descente de ski jouée par le bot (simulation seule, assets chargés)
+tourne N frames avec settings.POOLING activé puis désactivé ; pour chaque
+mode : pauses du ramasse-miettes (GCMonitor) et objets créés / réutilisés
+par les pools.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pygame  # noqa: E402
+
+from game.core import settings  # noqa: E402
+from game.core.game import Game  # noqa: E402
+from game.core.gcstats import GCMonitor  # noqa: E402
+from game.core.headless import BotInput, VirtualClock  # noqa: E402
+from game.core.loader import AssetLoader  # noqa: E402
+from game.core.pool import Pool  # noqa: E402
+from game.models.world import World  # noqa: E402
+from game.scenes.ski import SkiScene  # noqa: E402
+
+
+def _run(game, bot, frames, pooling):
+    settings.POOLING = pooling
+    for pool in Pool.instances:
+        pool._free.clear()
+        pool.created = pool.reused = 0
+    scene = SkiScene(game, world=World(seed=0))
+    # Descente sans fin : ni phase de tir, ni game over
+    scene.time_to_shooting = float("inf")
+    scene.player.invincible_timer = float("inf")
+    game.change_scene(scene)
+    GCMonitor.reset()
+    start = time.perf_counter()
+    for _ in range(frames):
+        bot.before_frame(scene)
+        game.step(render=False)
+    elapsed = time.perf_counter() - start
+    label = "avec pools" if pooling else "sans pools"
+    print(f"{label} : {frames} frames en {elapsed:.2f} s")
+    print(f"  {GCMonitor.report()}")
+    for name, stats in Pool.report().items():
+        print(f"  {name:<13} créés {stats['created']:6d}  réutilisés {stats['reused']:6d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=settings.SIM_HZ * 600)
+    args = parser.parse_args()
+
+    settings.SAVE_BEST_SCORE = False
+    game = Game(headless=True, clock=VirtualClock())
+    game.wait_until_loaded()
+    bot = BotInput()
+    game.key_state = bot.keys
+    GCMonitor.install()
+    for pooling in (False, True):
+        _run(game, bot, args.frames, pooling)
+
+    AssetLoader.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
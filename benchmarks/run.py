@@ -0,0 +1,394 @@
+"""Suite de benchmarks avec baseline JSON et détection des régressions.
+
+Usage :
+    python benchmarks/run.py [-k FILTRE] [--repeat N]          # mesurer et afficher
+    python benchmarks/run.py --save [FICHIER]                  # enregistrer la baseline
+    python benchmarks/run.py --compare [FICHIER] [--threshold 0.15] [--min-delta 0.05]
+
+--compare sort avec le code 1 si un cas est plus lent que la baseline
+au-delà du seuil (15 % par défaut) et d'au moins --min-delta ms.
+La baseline (benchmarks/baseline.json) dépend de la machine : la générer
+avec --save sur la machine qui fera les comparaisons.
+
+Tout tourne avec les drivers SDL "dummy", écran 1920x1080.
+Les temps sont en ms par appel (meilleure des répétitions).
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pygame  # noqa: E402
+
+from game.core import settings  # noqa: E402
+from game.hockey.renderer import HockeyRenderer  # noqa: E402
+from game.views.renderer import Renderer  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DENSITIES = (5, 20, 50, 100)
+MIN_DELTA_MS = 0.05  # En dessous, un écart est considéré comme du bruit
+
+_cases = []
+
+
+def case(name, number=200):
+    """Déclare un cas : fn(ctx) prépare et retourne la fonction à chronométrer (None : ignoré)."""
+    def register(fn):
+        _cases.append((name, number, fn))
+        return fn
+    return register
+
+
+# Contexte partagé
+
+class Context:
+    """Jeu headless prêt (assets chargés) et objets de test communs."""
+
+    def __init__(self):
+        from game.core.headless import VirtualClock
+        from game.core.game import Game
+
+        settings.SAVE_BEST_SCORE = False
+        self.game = Game(headless=True, clock=VirtualClock())
+        self.game.wait_until_loaded()
+        self.screen = self.game.screen
+
+    def ski_scene(self, obstacles=0, medals=0):
+        from game.models.entities import Medal, Obstacle
+        from game.models.world import World
+        from game.scenes.ski import SkiScene
+
+        scene = SkiScene(self.game, world=World(seed=0))
+        lanes = settings.LANES
+        # Répartis loin au-dessus du joueur : ni collision ni sortie d'écran
+        scene.world.obstacles = [
+            Obstacle(lane=i % lanes, y=-40 - i * 200) for i in range(obstacles)
+        ]
+        scene.world.medals = [
+            Medal(kind="gold", lane=i % lanes, y=-140 - i * 200) for i in range(medals)
+        ]
+        return scene
+
+
+# Simulation
+
+def _with_backend(backend, setup):
+    """setup construit son World avec settings.ENTITY_BACKEND = backend."""
+    def build(ctx):
+        default, settings.ENTITY_BACKEND = settings.ENTITY_BACKEND, backend
+        try:
+            return setup(ctx)
+        finally:
+            settings.ENTITY_BACKEND = default
+    return build
+
+
+for _density in DENSITIES:
+    def _world_update(ctx, density=_density):
+        from game.models.entities import Obstacle
+        from game.models.world import World
+
+        world = World(seed=0)
+        world.obstacles = [
+            Obstacle(lane=i % settings.LANES, y=-40 - i * 200) for i in range(density)
+        ]
+        step = 1000 / settings.SIM_HZ
+        return lambda: world.update(step)
+
+    def _spawn_clear(ctx, density=_density):
+        from game.models.entities import Obstacle
+        from game.models.world import World
+
+        world = World()
+        world.obstacles = [
+            Obstacle(lane=i % settings.LANES, y=1000 - i * 200) for i in range(density)
+        ]
+        return lambda: world._is_obstacle_spawn_clear(1, -100)
+
+    def _collisions(ctx, density=_density):
+        scene = ctx.ski_scene(obstacles=density)
+        return scene._check_collisions
+
+    def _medals(ctx, density=_density):
+        scene = ctx.ski_scene(medals=density)
+        return scene._handle_medal_pickups
+
+    for _backend, _suffix in (("lists", ""), ("numpy", ".numpy")):
+        case(f"world.update{_suffix}[{_density}]")(_with_backend(_backend, _world_update))
+        case(f"world.spawn_clear{_suffix}[{_density}]", number=1000)(_with_backend(_backend, _spawn_clear))
+        case(f"ski.check_collisions{_suffix}[{_density}]", number=1000)(_with_backend(_backend, _collisions))
+        case(f"ski.medal_pickups{_suffix}[{_density}]", number=1000)(_with_backend(_backend, _medals))
+
+
+@case("entity.rect[100]", number=1000)
+def _entity_rect(ctx):
+    from game.models.entities import Obstacle
+
+    obstacles = [Obstacle(lane=i % settings.LANES, y=i * 10.5) for i in range(100)]
+
+    def run():
+        # Une tick puis les lectures d'une frame : collision, ramassage, rendu
+        for obstacle in obstacles:
+            obstacle.update(0.0, 0.0)
+            obstacle.rect
+            obstacle.rect
+            obstacle.rect_at(0.5)
+    return run
+
+
+@case("hockey.update", number=600)
+def _hockey_update(ctx):
+    from game.hockey.scene import HockeyScene
+
+    scene = HockeyScene(ctx.game, seed=0)
+    scene.serve_timer = 0
+    step = 1000 / settings.SIM_HZ
+
+    def run():
+        scene.update(step)
+        if scene.goal_timer or scene.serve_timer:
+            scene.goal_timer = scene.serve_timer = 0
+            scene.puck.vx, scene.puck.vy = scene.serve_vx, scene.serve_vy
+        if scene.player_score or scene.ai_score:
+            scene.player_score = scene.ai_score = 0
+    return run
+
+
+# Rendu 1080p : un cas par méthode draw_*
+
+def _renderer_args(ctx):
+    from game.models.entities import FloatingText, Player, Sight, Target, HockeyPlayer, Puck
+    from game.views.renderer import COUNTDOWN_ASSETS
+
+    scene = ctx.ski_scene(obstacles=12, medals=6)
+    for item in [*scene.world.obstacles, *scene.world.medals]:
+        item.y += 900
+    buttons = [(pygame.Rect(830, 300 + i * 200, 260, 185), i == 1, label)
+               for i, label in enumerate(("BIATHLON", "HOCKEY", "SETTINGS", "QUITTER"))]
+    targets = [Target(x=200 + i * 380) for i in range(settings.NUM_TARGETS)]
+    texts = [FloatingText("+5", 600 + i * 80, 500, (255, 215, 0), alpha=200, scale=1.2) for i in range(4)]
+    rink = pygame.Rect(140, 120, settings.WIDTH - 280, settings.HEIGHT - 260)
+    countdown_step = next(iter(COUNTDOWN_ASSETS))
+    return {
+        "draw_background": (450.0,),
+        "draw_player": (Player(),),
+        "draw_obstacles": (scene.world.obstacles,),
+        "draw_medals": (scene.world.medals,),
+        "draw_ui": (120, 14, 7.5),
+        "draw_menu": (buttons,),
+        "draw_title": ("Winter Sprint", "Appuyez sur ESPACE"),
+        "draw_lane_marker": (1,),
+        "draw_shooting_background": (),
+        "draw_targets": (targets,),
+        "draw_sight": (Sight(x=700),),
+        "draw_gun": (Sight(x=700), 6),
+        "draw_countdown": (countdown_step, 0.4),
+        "draw_shooting_ui": (3, 2, 120, 1),
+        "draw_lives": (3,),
+        "draw_ski_ui": (120, 14, 3, 4200),
+        "draw_circular_timer": (4200, settings.SHOOTING_INTERVAL),
+        "draw_player_blinking": (Player(),),
+        "draw_hockey_background": (rink,),
+        "draw_hockey_player": (HockeyPlayer(600, 500), (80, 180, 255)),
+        "draw_hockey_puck": (Puck(900, 500), [(900 - i * 8, 500) for i in range(12)]),
+        "draw_hockey_ui": (2, 1, 0),
+        "draw_hockey_goal_text": ("BUT !",),
+        "draw_hockey_over": ("VICTOIRE !", 3, 1),
+        "draw_flash": ((255, 0, 0), 120),
+        "draw_floating_text": (texts,),
+        "draw_game_over": (1234, 56, 789, 2000, 1.0),
+        "draw_game_over_prompts": (),
+    }
+
+
+def _hockey_renderer_args(ctx):
+    from game.hockey.scene import HockeyScene
+
+    scene = HockeyScene(ctx.game)
+    trail = [(scene.puck.x - i * 8, scene.puck.y) for i in range(12)]
+    return {
+        "draw_background": (scene.rink_rect,),
+        "draw_player": (scene.player, settings.HOCKEY_PLAYER_COLOR, scene.renderer.player_sprite, True),
+        "draw_puck": (scene.puck, trail),
+        "draw_ui": (2, 1),
+        "draw_goal_text": ("BUT !",),
+        "draw_over": ("VICTOIRE !", 3, 1),
+    }
+
+
+def _draw_cases(klass, args_for):
+    prepared = {}
+
+    def declare(method):
+        @case(f"{klass.__name__}.{method}", number=100)
+        def _draw(ctx):
+            if not prepared:
+                prepared.update(args_for(ctx))
+            if method not in prepared:
+                return None  # Pas d'arguments de test pour cette méthode
+            args = prepared[method]
+            draw = getattr(klass(), method)
+            return lambda: draw(ctx.screen, *args)
+
+    for method in sorted(n for n in vars(klass) if n.startswith("draw_")):
+        declare(method)
+
+
+_draw_cases(Renderer, _renderer_args)
+_draw_cases(HockeyRenderer, _hockey_renderer_args)
+
+
+# Démarrage et transitions
+
+@case("startup.cold", number=1)
+def _startup_cold(ctx):
+    import startup
+    from game.core.asset_cache import DiskCache
+
+    def run():
+        DiskCache.clear()
+        startup._launch()
+    return run
+
+
+@case("startup.warm", number=1)
+def _startup_warm(ctx):
+    import startup
+    return startup._launch
+
+
+def _transition(build):
+    def setup(ctx):
+        def run():
+            scene = build(ctx)
+            ctx.game.change_scene(scene)
+            scene.render(ctx.screen)
+        return run
+    return setup
+
+
+def _scene(module, name, *args):
+    return lambda ctx: getattr(__import__(module, fromlist=[name]), name)(ctx.game, *args)
+
+
+def _with_run(module, name):
+    def build(ctx):
+        from game.models.entities import Player
+        from game.models.world import World
+        return getattr(__import__(module, fromlist=[name]), name)(ctx.game, Player(), World())
+    return build
+
+
+for _name, _build in (
+    ("menu", _scene("game.scenes.menu", "MenuScene")),
+    ("countdown", _scene("game.scenes.countdown", "CountdownScene", True)),
+    ("ski", _scene("game.scenes.ski", "SkiScene")),
+    ("shooting", _with_run("game.scenes.shooting", "ShootingScene")),
+    ("game_over", _scene("game.scenes.gameover", "GameOverScene", 120, 14, 300)),
+    ("hockey", _scene("game.hockey.scene", "HockeyScene")),
+    ("hockey_over", _scene("game.hockey.scene", "HockeyOverScene", 3, 1)),
+):
+    case(f"transition.{_name}", number=5)(_transition(_build))
+
+
+# Exécution
+
+def _measure(fn, number, repeat):
+    fn()  # Échauffement (caches, imports)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+def run_suite(pattern="*", repeat=5):
+    ctx = Context()
+
+    results = {}
+    for name, number, setup in _cases:
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        slow = name.startswith("startup.")
+        fn = setup(ctx)
+        if fn is None:
+            print(f"{name:44s} (pas d'arguments de test, ignoré)")
+            continue
+        results[name] = _measure(fn, number, 3 if slow else repeat)
+        print(f"{name:44s} {results[name]:10.4f} ms")
+    return results
+
+
+def _metadata():
+    return {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "resolution": [settings.WIDTH, settings.HEIGHT],
+    }
+
+
+def compare(results, baseline, threshold, min_delta=MIN_DELTA_MS):
+    """Affiche les écarts ; retourne la liste des cas en régression."""
+    regressions = []
+    for name, ms in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:44s} {ms:10.4f} ms   (nouveau)")
+            continue
+        ratio = ms / before if before > 0 else float("inf")
+        flag = ""
+        if ratio > 1 + threshold and ms - before > min_delta:
+            flag = "  <-- RÉGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold and before - ms > min_delta:
+            flag = "  (plus rapide)"
+        print(f"{name:44s} {before:10.4f} -> {ms:10.4f} ms  {ratio - 1:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="*", help="motif des cas à lancer (fnmatch)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", nargs="?", const=BASELINE, type=Path, metavar="FICHIER")
+    parser.add_argument("--compare", nargs="?", const=BASELINE, type=Path, metavar="FICHIER")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="ralentissement toléré avant de signaler une régression (0.15 = 15 %%)")
+    parser.add_argument("--min-delta", type=float, default=MIN_DELTA_MS,
+                        help="écart absolu minimal (ms) pour signaler une régression")
+    args = parser.parse_args()
+
+    results = run_suite(args.filter, args.repeat)
+
+    if args.save:
+        args.save.write_text(json.dumps({"meta": _metadata(), "results": results}, indent=2) + "\n")
+        print(f"baseline écrite : {args.save}")
+
+    status = 0
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        print(f"\ncomparaison avec {args.compare} (seuil {args.threshold:.0%})")
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"{len(regressions)} régression(s) : {', '.join(regressions)}")
+            status = 1
+
+    pygame.quit()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
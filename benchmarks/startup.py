@@ -0,0 +1,69 @@
+"""Mesure du temps de démarrage (première frame, puis première frame du menu), à froid et à chaud.
+
+Usage : python benchmarks/startup.py [--runs N]
+
+Le démarrage "froid" vide d'abord le cache disque des images,
+le démarrage "chaud" réutilise les blobs déjà construits.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_CHILD = """
+import os, sys, time
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, {root!r})
+from game.core.startup import StartupTrace
+from game.core import settings
+settings.FULLSCREEN = False
+from game.core.game import Game
+from game.core.loader import AssetLoader
+game = Game()
+while type(game.scene).__name__ != "MenuScene":
+    game.step()
+game.step()
+print(StartupTrace.first_frame_ms / 1000, StartupTrace.elapsed_ms() / 1000)
+AssetLoader.shutdown()
+"""
+
+
+def _launch():
+    """Retourne (première frame, première frame du menu) en secondes."""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(root=str(ROOT))],
+        capture_output=True, text=True, check=True, env=env,
+    )
+    first_frame, menu = out.stdout.strip().splitlines()[-1].split()
+    return float(first_frame), float(menu)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    from game.core.asset_cache import DiskCache
+
+    cold = []
+    warm = []
+    for _ in range(args.runs):
+        DiskCache.clear()
+        cold.append(_launch())
+        warm.append(_launch())
+
+    for label, runs in (("cold", cold), ("warm", warm)):
+        first_frame = min(run[0] for run in runs)
+        menu = min(run[1] for run in runs)
+        print(f"{label} start: first frame {first_frame * 1000:8.1f} ms   "
+              f"menu {menu * 1000:8.1f} ms (best of {args.runs})")
+
+
+if __name__ == "__main__":
+    main()
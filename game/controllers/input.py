@@ -1,5 +1,7 @@
 ﻿import pygame
 
+from game.core.latency import LatencyMonitor
+
 
 class InputController:
     def __init__(self):
@@ -10,6 +12,7 @@ class InputController:
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
+            LatencyMonitor.input_event()
             if event.key in (pygame.K_LEFT, pygame.K_a):
                 self.left = True
             if event.key in (pygame.K_RIGHT, pygame.K_d):
@@ -0,0 +1,96 @@
+import hashlib
+import mmap
+import struct
+
+import pygame
+
+from game.core import settings
+
+# En-tête d'un blob : magic, version, largeur, hauteur, format de pixels
+_MAGIC = b"WSAC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBHH4s")
+
+_FORMATS = {
+    "alpha": "RGBA",
+    "colorkey": "RGBA",
+    "opaque": "RGBX",
+}
+
+
+class DiskCache:
+    """Cache disque des images déjà redimensionnées.
+
+    Chaque surface est stockée en pixels bruts. La clé dépend du fichier
+    source (mtime, taille), de la taille cible et du format : si l'image
+    source change, l'ancien blob est ignoré puis remplacé au chargement
+    suivant.
+    """
+
+    @staticmethod
+    def _digest(*parts):
+        return hashlib.sha1("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def _blob_path(cls, path, size, mode):
+        stat = path.stat()
+        asset_key = cls._digest(path.resolve(), size, mode)
+        version_key = cls._digest(stat.st_mtime_ns, stat.st_size, _FORMATS[mode], _VERSION)
+        return settings.ASSET_CACHE_DIR / f"{asset_key}-{version_key}.bin"
+
+    @classmethod
+    def read(cls, path, size, mode):
+        """Retourne la surface brute (non convertie) ou None si absente / périmée.
+
+        Les pixels sont copiés hors du blob mappé, fermé aussitôt : le fichier
+        reste libre d'être remplacé (Windows). Utilisable depuis un thread de
+        chargement.
+        """
+        if not settings.ASSET_DISK_CACHE:
+            return None
+        try:
+            blob = cls._blob_path(path, size, mode)
+            if not blob.exists():
+                return None
+            with open(blob, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, version, w, h, fmt = _HEADER.unpack_from(data)
+                fmt = fmt.decode("ascii")
+                if magic != _MAGIC or version != _VERSION or fmt != _FORMATS[mode]:
+                    return None
+                if len(data) - _HEADER.size != w * h * 4:
+                    return None
+                pixels = data[_HEADER.size:]
+        except (OSError, struct.error, ValueError, UnicodeDecodeError):
+            return None
+        return pygame.image.frombuffer(pixels, (w, h), fmt)
+
+    @classmethod
+    def store(cls, path, size, mode, surface):
+        if not settings.ASSET_DISK_CACHE:
+            return
+        fmt = _FORMATS[mode]
+        try:
+            blob = cls._blob_path(path, size, mode)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+
+            # Supprimer les versions périmées de la même image
+            prefix = blob.name.split("-")[0]
+            for old in blob.parent.glob(f"{prefix}-*.bin"):
+                if old != blob:
+                    old.unlink(missing_ok=True)
+
+            w, h = surface.get_size()
+            header = _HEADER.pack(_MAGIC, _VERSION, w, h, fmt.encode("ascii"))
+            tmp = blob.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                f.write(header)
+                f.write(pygame.image.tobytes(surface, fmt))
+            tmp.replace(blob)
+        except OSError:
+            pass  # Pas grave : l'image sera simplement redécodée
+
+    @classmethod
+    def clear(cls):
+        if settings.ASSET_CACHE_DIR.exists():
+            for blob in settings.ASSET_CACHE_DIR.glob("*.bin"):
+                blob.unlink(missing_ok=True)
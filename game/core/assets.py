@@ -0,0 +1,141 @@
+import pygame
+
+from game.core.asset_cache import DiskCache
+
+
+class AssetStore:
+    """Cache d'images et de sons partagé par tout le processus.
+
+    Une image est identifiée par (chemin, taille cible, mode de conversion) :
+    elle n'est décodée et redimensionnée qu'une seule fois, quelle que soit
+    la scène qui la demande.
+
+    size : None (taille d'origine), (w, h), (w, None) ou (None, h).
+           Avec une dimension à None, le ratio de l'image est conservé.
+    mode : "alpha" (convert_alpha), "opaque" (convert) ou
+           "colorkey" (convert_alpha + transparence sur le pixel (0, 0)).
+    """
+
+    _surfaces = {}
+    _sounds = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def image(cls, path, size=None, mode="alpha"):
+        key = (str(path), size, mode)
+        if key in cls._surfaces:
+            cls.hits += 1
+            return cls._surfaces[key]
+
+        cls.misses += 1
+        return cls.finish_image(path, size, mode, cls.decode_image(path, size, mode))
+
+    @classmethod
+    def has_image(cls, path, size=None, mode="alpha"):
+        return (str(path), size, mode) in cls._surfaces
+
+    @staticmethod
+    def decode_image(path, size, mode):
+        """Partie lente du chargement, sans conversion (utilisable depuis un thread).
+
+        Retourne (surface brute, déjà_redimensionnée) ou None si le fichier manque.
+        """
+        if not path.exists():
+            return None
+        cached = DiskCache.read(path, size, mode)
+        if cached is not None:
+            return cached, True
+        return pygame.image.load(str(path)), False
+
+    @classmethod
+    def finish_image(cls, path, size, mode, decoded):
+        """Convertit au format de l'écran (thread principal) et met en cache."""
+        key = (str(path), size, mode)
+        if key in cls._surfaces:
+            return cls._surfaces[key]
+
+        image = None
+        if decoded is not None:
+            raw, scaled = decoded
+            image = raw.convert() if mode == "opaque" else raw.convert_alpha()
+            if not scaled:
+                target = cls._target_size(image.get_size(), size)
+                if target != image.get_size():
+                    image = pygame.transform.smoothscale(image, target)
+                DiskCache.store(path, size, mode, image)
+
+            if mode == "colorkey":
+                try:
+                    image.set_colorkey(image.get_at((0, 0)))
+                except Exception:
+                    pass
+
+        cls._surfaces[key] = image
+        return image
+
+    @staticmethod
+    def _target_size(source_size, size):
+        """Calcule la taille finale à partir d'une spécification (w, h)."""
+        if size is None:
+            return source_size
+        src_w, src_h = source_size
+        w, h = size
+        if w is None:
+            w = max(1, int(src_w * h / src_h))
+        elif h is None:
+            h = max(1, int(src_h * w / src_w))
+        return (w, h)
+
+    @classmethod
+    def sound(cls, path):
+        """Retourne un pygame.mixer.Sound partagé, ou None (fichier absent / pas d'audio)."""
+        key = str(path)
+        if key in cls._sounds:
+            cls.hits += 1
+            return cls._sounds[key]
+
+        cls.misses += 1
+        return cls.finish_sound(path, cls.decode_sound(path))
+
+    @classmethod
+    def has_sound(cls, path):
+        return str(path) in cls._sounds
+
+    @staticmethod
+    def decode_sound(path):
+        if not path.exists() or not pygame.mixer.get_init():
+            return None
+        try:
+            return pygame.mixer.Sound(str(path))
+        except pygame.error:
+            return None
+
+    @classmethod
+    def finish_sound(cls, path, sound):
+        return cls._sounds.setdefault(str(path), sound)
+
+    @classmethod
+    def invalidate(cls, path=None):
+        """Oublie une image (toutes tailles confondues) ou tout le cache."""
+        if path is None:
+            cls._surfaces.clear()
+            cls._sounds.clear()
+            return
+        path = str(path)
+        for key in [k for k in cls._surfaces if k[0] == path]:
+            del cls._surfaces[key]
+        cls._sounds.pop(path, None)
+
+    @classmethod
+    def stats(cls):
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "entries": len(cls._surfaces) + len(cls._sounds),
+        }
+
+    @classmethod
+    def reset_stats(cls):
+        cls.hits = 0
+        cls.misses = 0
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Cache LRU borné, avec compteurs de hits / misses.
+
+    La limite porte sur le nombre d'entrées (max_items) et/ou sur un coût
+    total (max_cost, par ex. des octets) ; les entrées les moins récemment
+    utilisées sont évincées en premier.
+    """
+
+    def __init__(self, max_items=None, max_cost=None):
+        self.max_items = max_items
+        self.max_cost = max_cost
+        self._entries = OrderedDict()
+        self.cost = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, cost=1):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.cost -= old[1]
+        self._entries[key] = (value, cost)
+        self.cost += cost
+        self._evict()
+        return value
+
+    def _evict(self):
+        while len(self._entries) > 1 and (
+            (self.max_items is not None and len(self._entries) > self.max_items)
+            or (self.max_cost is not None and self.cost > self.max_cost)
+        ):
+            _, (_, cost) = self._entries.popitem(last=False)
+            self.cost -= cost
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.cost = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "cost": self.cost,
+            "evictions": self.evictions,
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,36 @@
+import pygame
+
+from game.core import settings
+
+
+class FontRegistry:
+    """Polices partagées par tout le processus.
+
+    Un seul objet Font est créé par (police, taille, gras). Les tailles
+    animées passent par bucket() pour limiter le nombre de polices en cache.
+    """
+
+    _fonts = {}
+
+    @classmethod
+    def get(cls, face, size, bold=False):
+        key = (face, size, bold)
+        font = cls._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(face, size, bold=bold)
+            cls._fonts[key] = font
+        return font
+
+    @staticmethod
+    def bucket(size):
+        """Arrondit une taille animée au multiple de FONT_SIZE_STEP le plus proche."""
+        step = settings.FONT_SIZE_STEP
+        return max(step, int(round(size / step)) * step)
+
+    @classmethod
+    def animated(cls, face, size, bold=False):
+        return cls.get(face, cls.bucket(size), bold)
+
+    @classmethod
+    def clear(cls):
+        cls._fonts.clear()
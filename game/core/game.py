@@ -1,41 +1,214 @@
-﻿import pygame
+﻿import logging
+import os
+import time
+
+import pygame
 
 from game.core import settings
-from game.scenes.menu import MenuScene
+from game.core.latency import LatencyMonitor
+from game.core.loader import AssetLoader
+from game.core.pacing import make_clock, vsync_available
+from game.core.prewarm import Prewarmer
+from game.core.profiler import Profiler
+from game.core.quality import QualityGovernor
+from game.core.replay import Replay
+from game.core.startup import StartupTrace
+from game.scenes.loading import LoadingScene
+
+logger = logging.getLogger(__name__)
 
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, headless=False, clock=None):
+        """headless : pas de fenêtre ni de son (drivers SDL "dummy").
+        clock : horloge à utiliser à la place de pygame.time.Clock (ex. VirtualClock).
+        """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        # Seuls l'affichage et les polices servent au premier écran ; le son
+        # est initialisé après la première frame (voir init_audio)
+        pygame.display.init()
+        pygame.font.init()
+        StartupTrace.mark("pygame : affichage + polices")
         pygame.display.set_caption("Runner 2D")
-        self.fullscreen = settings.FULLSCREEN
+        self.fullscreen = settings.FULLSCREEN and not headless
+        self.pacing = self._resolve_pacing(settings.FRAME_PACING)
         self.screen = self._set_display()
-        self.clock = pygame.time.Clock()
-        self.scene = MenuScene(self)
+        StartupTrace.mark("fenêtre")
+        self.clock = clock or make_clock(self.pacing)
+        self.key_state = pygame.key.get_pressed  # Touches maintenues (remplaçable par un bot)
+        self._deferred = []  # Travail repoussé après la première frame (voir defer)
+        self.defer(self.init_audio)
+        self.scene = LoadingScene(self)
+        StartupTrace.mark("scène de chargement")
         self.running = True
+        self.idle = False
+        self.alpha = 1.0  # Position du rendu entre les deux dernières ticks
+        self._accumulator = 0.0
+        if settings.PROFILER:
+            Profiler.enable()
 
     def change_scene(self, scene):
-        self.scene = scene
+        start = time.perf_counter()
+        previous, self.scene = self.scene, scene
+        scene.enter()
+        Prewarmer.schedule(scene)
+        switch_ms = (time.perf_counter() - start) * 1000
+        # Création (Scene.create) et changement seuls ; le premier rendu est celui d'une frame normale
+        created = "?" if scene.create_ms is None else f"{scene.create_ms:.3f} ms"
+        logger.info("transition %s -> %s : création %s, changement %.3f ms (%s)",
+                    type(previous).__name__, type(scene).__name__, created, switch_ms,
+                    "instance préparée" if scene.prepared else "construite")
+
+    def defer(self, fn):
+        """Exécute fn à la fin de la première frame (chargements non urgents)."""
+        self._deferred.append(fn)
+
+    def _run_deferred(self):
+        deferred, self._deferred = self._deferred, []
+        for fn in deferred:
+            fn()
+
+    def init_audio(self):
+        if pygame.mixer.get_init():
+            return
+        try:
+            pygame.mixer.pre_init(44100, -16, 2, 256)  # Petit tampon : moins de latence
+            pygame.mixer.init()
+        except pygame.error:
+            pass  # Pas de sortie audio : les sons restent muets
+        StartupTrace.mark("audio")
+
+    def wait_until_loaded(self):
+        """Sans passer par la boucle : termine le démarrage et attend tous les assets."""
+        self._run_deferred()
+        while AssetLoader.progress() < 1.0:
+            AssetLoader.pump()
+            time.sleep(0.001)
+        StartupTrace.mark("attente des assets")
+
+    def _present(self, rects):
+        """Affiche la frame. Retourne False si rien n'a changé à l'écran."""
+        if rects is None or not settings.DIRTY_RECTS:
+            pygame.display.flip()
+            return True
+        if not rects:
+            return False
+
+        dirty_area = sum(r.width * r.height for r in rects)
+        if dirty_area > settings.WIDTH * settings.HEIGHT * settings.DIRTY_FULL_THRESHOLD:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        return True
 
     def _set_display(self):
+        size = (settings.WIDTH, settings.HEIGHT)
+        if self.headless:
+            return pygame.display.set_mode(size)
         flags = pygame.SCALED
         if self.fullscreen:
             flags |= pygame.FULLSCREEN
-        return pygame.display.set_mode((settings.WIDTH, settings.HEIGHT), flags)
+        return self._set_mode(size, flags)
+
+    def _set_mode(self, size, flags):
+        if self.pacing == "vsync":
+            try:
+                return pygame.display.set_mode(size, flags, vsync=1)
+            except pygame.error:
+                logger.warning("vsync refusée par le pilote : cadence hybrid")
+                self.pacing = "hybrid"
+        return pygame.display.set_mode(size, flags)
+
+    def _resolve_pacing(self, strategy):
+        if strategy == "vsync" and (self.headless or not vsync_available()):
+            logger.warning("vsync indisponible : cadence hybrid")
+            return "hybrid"
+        return strategy
+
+    def set_pacing(self, strategy):
+        """Change la stratégie d'attente entre frames (voir pacing.STRATEGIES)."""
+        strategy = self._resolve_pacing(strategy)
+        vsync_changed = (strategy == "vsync") != (self.pacing == "vsync")
+        self.pacing = strategy
+        if vsync_changed and not self.headless:
+            self.screen = self._set_display()
+            self.scene.invalidate()
+        self.clock = make_clock(self.pacing)
+
+    def _simulate(self, frame_ms):
+        """Avance la scène par ticks fixes de 1/SIM_HZ s.
+
+        Le temps écoulé s'accumule ; au-delà de MAX_SIM_STEPS ticks par frame
+        le retard est abandonné (le jeu ralentit au lieu de geler).
+        """
+        step_ms = 1000.0 / settings.SIM_HZ
+        self._accumulator = min(self._accumulator + frame_ms, step_ms * settings.MAX_SIM_STEPS)
+        scene = self.scene
+        while self._accumulator >= step_ms:
+            self.scene.update(step_ms)
+            self._accumulator -= step_ms
+            if self.scene is not scene:
+                self._accumulator = 0.0  # La nouvelle scène démarre sans rattrapage
+                break
+        self.alpha = self._accumulator / step_ms
+
+    def step(self, render=True):
+        """Une frame : événements, simulation, puis (si render) rendu et présentation."""
+        dt = self.clock.tick(settings.IDLE_FPS if self.idle else settings.FPS)
+        work_start = time.perf_counter()
+        waited_ms = 0.0  # Attente de la synchro verticale dans display.flip (vsync)
+        Profiler.begin_frame()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+                self.fullscreen = not self.fullscreen
+                self.screen = self._set_display()
+                self.scene.invalidate()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                Profiler.toggle()
+                self.scene.invalidate()
+            self.scene.handle_event(event)
+        Profiler.mark("events")
+
+        AssetLoader.pump()
+        Profiler.mark("loader")
+        self._simulate(dt)
+        Profiler.mark("update")
+        if render:
+            rects = self.scene.render(self.screen)
+            Profiler.mark("render")
+            hud = Profiler.draw(self.screen, type(self.scene).__name__)
+            if hud is not None and rects is not None:
+                rects = rects + [hud]
+            Profiler.mark("profiler")
+            present_start = time.perf_counter()
+            self.idle = not self._present(rects)
+            if self.pacing == "vsync":
+                waited_ms = (time.perf_counter() - present_start) * 1000
+            Profiler.mark("present")
+            LatencyMonitor.frame_end(not self.idle)
+            if not StartupTrace.finished:
+                loaded = AssetLoader.progress() >= 1.0 and not isinstance(self.scene, LoadingScene)
+                StartupTrace.frame_rendered(type(self.scene).__name__, loaded)
+        # Temps de travail de la frame, hors attente de l'écran
+        work_ms = (time.perf_counter() - work_start) * 1000 - waited_ms
+        if render and not self.idle:
+            QualityGovernor.observe(work_ms)
+        if self._deferred:
+            self._run_deferred()
+        else:
+            Prewarmer.run(self, 1000 / settings.FPS - work_ms)
+        Profiler.end_frame(type(self.scene).__name__)
 
     def run(self):
         while self.running:
-            dt = self.clock.tick(settings.FPS)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
-                    self.fullscreen = not self.fullscreen
-                    self.screen = self._set_display()
-                self.scene.handle_event(event)
-
-            self.scene.update(dt)
-            self.scene.render(self.screen)
-            pygame.display.flip()
+            self.step()
 
+        Replay.end_run()
+        Profiler.export()
+        AssetLoader.shutdown()
         pygame.quit()
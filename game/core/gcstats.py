@@ -0,0 +1,55 @@
+import gc
+import time
+
+
+class GCMonitor:
+    """Compte les passages du ramasse-miettes et leur durée (--gc-stats).
+
+    Branché sur gc.callbacks : chaque collecte est une pause du jeu, d'autant
+    plus longue que la génération est haute.
+    """
+
+    enabled = False
+    collections = [0, 0, 0]   # par génération
+    pause_ms = [0.0, 0.0, 0.0]
+    worst_ms = 0.0
+    _start = None
+
+    @classmethod
+    def install(cls):
+        cls.enabled = True
+        if cls._callback not in gc.callbacks:
+            gc.callbacks.append(cls._callback)
+
+    @classmethod
+    def uninstall(cls):
+        cls.enabled = False
+        if cls._callback in gc.callbacks:
+            gc.callbacks.remove(cls._callback)
+
+    @classmethod
+    def _callback(cls, phase, info):
+        if phase == "start":
+            cls._start = time.perf_counter()
+            return
+        if cls._start is None:
+            return
+        ms = (time.perf_counter() - cls._start) * 1000
+        cls._start = None
+        generation = info["generation"]
+        cls.collections[generation] += 1
+        cls.pause_ms[generation] += ms
+        cls.worst_ms = max(cls.worst_ms, ms)
+
+    @classmethod
+    def reset(cls):
+        cls.collections = [0, 0, 0]
+        cls.pause_ms = [0.0, 0.0, 0.0]
+        cls.worst_ms = 0.0
+
+    @classmethod
+    def report(cls):
+        per_generation = "  ".join(
+            f"gen{g} {n} ({ms:.1f} ms)" for g, (n, ms) in enumerate(zip(cls.collections, cls.pause_ms))
+        )
+        return f"GC : {sum(cls.collections)} pauses, {sum(cls.pause_ms):.1f} ms, pire {cls.worst_ms:.2f} ms  [{per_generation}]"
@@ -0,0 +1,258 @@
+import time
+
+import pygame
+
+from game.core import settings
+from game.core.game import Game
+from game.core.gcstats import GCMonitor
+from game.core.loader import AssetLoader
+from game.core.replay import Replay
+
+SCENES = ("ski", "shooting", "hockey")
+MAX_RUN_FRAMES = settings.SIM_HZ * 600  # Une partie est coupée après 10 min simulées
+
+
+class VirtualClock:
+    """Remplace pygame.time.Clock : chaque frame dure 1/fps s, sans attendre."""
+
+    def __init__(self):
+        self.frames = 0
+        self.elapsed_ms = 0.0
+
+    def tick(self, framerate=0):
+        dt = 1000.0 / (framerate or settings.FPS)
+        self.frames += 1
+        self.elapsed_ms += dt
+        return dt
+
+    def get_fps(self):
+        return settings.FPS
+
+
+class KeyState:
+    """Touches maintenues, indexable comme le résultat de pygame.key.get_pressed()."""
+
+    def __init__(self):
+        self.down = set()
+
+    def __getitem__(self, key):
+        return key in self.down
+
+    def __call__(self):
+        return self
+
+
+class BotInput:
+    """Joueur automatique : esquive au ski, tire sur la cible, suit le palet au hockey."""
+
+    LOOKAHEAD = 520  # px surveillés au-dessus du skieur (au minimum)
+
+    def __init__(self):
+        self.keys = KeyState()
+
+    def before_frame(self, scene):
+        self.keys.down.clear()
+        handler = getattr(self, f"_play_{type(scene).__name__}", None)
+        if handler:
+            handler(scene)
+
+    @staticmethod
+    def _press(key):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+
+    def _play_SkiScene(self, scene):
+        player = scene.player
+        if scene.paused:
+            return
+        lookahead = max(self.LOOKAHEAD, scene.world.speed * 0.6)
+
+        def blocked(lane):
+            top = player.y - player.height - lookahead
+            return any(
+                o.lane == lane and o.y > top and o.y - o.height < player.y
+                for o in scene.world.obstacles
+            )
+
+        lane = player.target_lane
+        if not blocked(lane):
+            return
+        for other in (lane - 1, lane + 1):
+            if 0 <= other < settings.LANES and not blocked(other):
+                self._press(pygame.K_LEFT if other < lane else pygame.K_RIGHT)
+                return
+        if player.on_ground:
+            self._press(pygame.K_SPACE)
+
+    def _play_ShootingScene(self, scene):
+        index = scene.current_target_index
+        if index < len(scene.targets) and scene.sight.is_on_target(scene.targets[index]):
+            self._press(pygame.K_SPACE)
+
+    def _play_HockeyScene(self, scene):
+        puck, player = scene.puck, scene.player
+        # Se placer derrière le palet pour le pousser vers le but de droite
+        dx = puck.x - 40 - player.x
+        dy = puck.y - player.y
+        if dx < -10:
+            self.keys.down.add(pygame.K_LEFT)
+        elif dx > 10:
+            self.keys.down.add(pygame.K_RIGHT)
+        if dy < -10:
+            self.keys.down.add(pygame.K_UP)
+        elif dy > 10:
+            self.keys.down.add(pygame.K_DOWN)
+        if abs(dx) < 80 and abs(dy) < 80:
+            self.keys.down.add(pygame.K_SPACE)
+
+
+def _new_scene(game, name):
+    from game.models.entities import Player
+    from game.models.world import World
+    from game.views.renderer import Renderer
+
+    Renderer.reset_background_index()
+    if name == "ski":
+        from game.scenes.ski import SkiScene
+        return SkiScene(game)
+    if name == "shooting":
+        from game.scenes.shooting import ShootingScene
+        return ShootingScene(game, Player(), World())
+    from game.hockey.scene import HockeyScene
+    return HockeyScene(game)
+
+
+def _run_over(name, scene):
+    scene_class = type(scene).__name__
+    if name == "ski":
+        return scene_class == "GameOverScene"  # le tir fait partie de la partie
+    if name == "shooting":
+        return scene_class != "ShootingScene"
+    return scene_class != "HockeyScene"
+
+
+def _describe(name, first_scene, frames):
+    if name == "hockey":
+        return f"{frames} frames, {first_scene.player_score}-{first_scene.ai_score}"
+    world = first_scene.world
+    return f"{frames} frames, score {world.score}, distance {int(world.distance)}"
+
+
+def run_headless(scene="ski", frames=None, runs=None, render=True, bot=True):
+    """Enchaîne des frames sans fenêtre aussi vite que possible.
+
+    S'arrête après `frames` frames ou `runs` parties (par défaut 3600 frames).
+    Retourne un dict de mesures, aussi affiché sur la sortie standard.
+    """
+    if not frames and not runs:
+        frames = settings.FPS * 60
+    settings.SAVE_BEST_SCORE = False
+
+    clock = VirtualClock()
+    game = Game(headless=True, clock=clock)
+    game.wait_until_loaded()
+
+    player = BotInput() if bot else None
+    if player:
+        game.key_state = player.keys
+
+    current = _new_scene(game, scene)
+    game.change_scene(current)
+    GCMonitor.reset()  # Seulement les pauses pendant le jeu, pas le chargement
+    results = []
+    total = run_frames = 0
+    start = time.perf_counter()
+    while game.running:
+        if player:
+            player.before_frame(game.scene)
+        game.step(render=render)
+        total += 1
+        run_frames += 1
+
+        if _run_over(scene, game.scene) or run_frames >= MAX_RUN_FRAMES:
+            results.append(_describe(scene, current, run_frames))
+            if runs and len(results) >= runs:
+                break
+            current = _new_scene(game, scene)
+            game.change_scene(current)
+            run_frames = 0
+        if frames and total >= frames:
+            break
+    elapsed = time.perf_counter() - start
+    Replay.end_run()
+
+    AssetLoader.shutdown()
+    pygame.quit()
+
+    stats = {
+        "scene": scene,
+        "render": render,
+        "frames": total,
+        "runs": len(results),
+        "wall_s": elapsed,
+        "simulated_s": clock.elapsed_ms / 1000,
+        "fps": total / elapsed if elapsed > 0 else 0.0,
+    }
+    mode = "simulation + rendu" if render else "simulation seule"
+    print(
+        f"{scene} ({mode}) : {total} frames, {stats['simulated_s']:.1f} s simulées "
+        f"en {elapsed:.2f} s -> {stats['fps']:.0f} frames/s"
+    )
+    for i, line in enumerate(results, 1):
+        print(f"  partie {i} : {line}")
+    if GCMonitor.enabled:
+        print(f"  {GCMonitor.report()}")
+    return stats
+
+
+def run_replay(path):
+    """Rejoue un enregistrement de Replay tick par tick, sans rendu.
+
+    Retourne True si toutes les sommes de contrôle concordent.
+    """
+    run = Replay.load(path)
+    settings.SAVE_BEST_SCORE = False
+    if run["sim_hz"] != settings.SIM_HZ:
+        settings.SIM_HZ = run["sim_hz"]
+
+    game = Game(headless=True, clock=VirtualClock())
+    game.wait_until_loaded()
+    if run["kind"] == "ski":
+        from game.models.world import World
+        from game.scenes.ski import SkiScene
+
+        scene = SkiScene(game, world=World(run["seed"]))
+        world, player = scene.world, scene.player
+        state = lambda: SkiScene.replay_state(world, player)  # noqa: E731
+    else:
+        from game.hockey.scene import HockeyScene
+
+        scene = HockeyScene(game, seed=run["seed"])
+        state = scene.replay_state
+    game.change_scene(scene)
+    Replay.play(run, state)
+
+    step_ms = 1000.0 / settings.SIM_HZ
+    updates = 0
+    start = time.perf_counter()
+    # Une entrée par tick ; une scène qui n'en lit plus (partie finie trop tôt) arrête la relecture
+    while Replay.remaining() > 0 and updates < 2 * run["ticks"]:
+        game.scene.update(step_ms)
+        updates += 1
+    elapsed = time.perf_counter() - start
+    final_ok = Replay.remaining() == 0 and Replay.final_checksum() == run["final"]
+    Replay.mode = None
+
+    AssetLoader.shutdown()
+    pygame.quit()
+
+    simulated = run["ticks"] / settings.SIM_HZ
+    print(
+        f"replay {run['kind']} (graine {run['seed']}) : {run['ticks']} ticks, {simulated:.1f} s simulées "
+        f"en {elapsed:.2f} s (x{simulated / elapsed if elapsed > 0 else 0:.0f})"
+    )
+    checkpoints = len(run["checksums"])
+    print(f"  sommes de contrôle : {checkpoints - len(Replay.mismatches)}/{checkpoints} identiques, "
+          f"état final {'identique' if final_ok else 'DIFFÉRENT'}")
+    for tick, expected, value in Replay.mismatches[:5]:
+        print(f"  divergence au tick {tick} : {expected:08x} attendu, {value:08x} obtenu")
+    return final_ok and not Replay.mismatches
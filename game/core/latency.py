@@ -0,0 +1,81 @@
+import time
+
+from game.core import settings
+
+
+class LatencyMonitor:
+    """Latence entrée -> image et régularité des frames (--measure-latency).
+
+    InputController.handle_event horodate chaque touche ; Game signale la fin
+    de chaque frame rendue. La latence va de la prise en compte de
+    l'événement au retour de la présentation (flip / update) de la frame
+    suivante : le balayage de l'écran lui-même n'est pas compté. Une touche
+    sans effet visible (frame au repos) n'est pas mesurée.
+
+    Le jitter est l'écart entre l'intervalle de deux présentations
+    consécutives et la période visée (1000 / FPS).
+    """
+
+    enabled = False
+    LATENCY_BOUNDS = (2, 4, 8, 12, 16, 20, 25, 33, 50, 100)   # ms, bornes hautes des barres
+    JITTER_BOUNDS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16)
+
+    latencies = []
+    jitters = []
+    _pending = []
+    _last_present = None
+
+    @classmethod
+    def input_event(cls):
+        if cls.enabled:
+            cls._pending.append(time.perf_counter())
+
+    @classmethod
+    def frame_end(cls, presented):
+        if not cls.enabled:
+            return
+        now = time.perf_counter()
+        if not presented:
+            cls._pending.clear()
+            cls._last_present = None
+            return
+        cls.latencies.extend((now - t) * 1000 for t in cls._pending)
+        cls._pending.clear()
+        if cls._last_present is not None:
+            cls.jitters.append(abs((now - cls._last_present) * 1000 - 1000 / settings.FPS))
+        cls._last_present = now
+
+    @classmethod
+    def reset(cls):
+        cls.latencies = []
+        cls.jitters = []
+        cls._pending.clear()
+        cls._last_present = None
+
+    @classmethod
+    def report(cls, label):
+        lines = [f"== {label} =="]
+        lines += cls._histogram("latence entrée -> image", cls.latencies, cls.LATENCY_BOUNDS)
+        lines += cls._histogram("jitter (écart à la période)", cls.jitters, cls.JITTER_BOUNDS)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _histogram(title, values, bounds):
+        if not values:
+            return [f"{title} : aucune mesure"]
+        ordered = sorted(values)
+
+        def pct(p):
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+        lines = [f"{title} : {len(ordered)} mesures, p50 {pct(0.5):.2f}  p95 {pct(0.95):.2f}  "
+                 f"p99 {pct(0.99):.2f}  max {ordered[-1]:.2f} ms"]
+        counts = [0] * (len(bounds) + 1)
+        for value in ordered:
+            counts[next((i for i, bound in enumerate(bounds) if value <= bound), len(bounds))] += 1
+        labels = [f"<= {bound:g}" for bound in bounds] + [f"> {bounds[-1]:g}"]
+        widest = max(counts)
+        for label, count in zip(labels, counts):
+            bar = "#" * round(40 * count / widest)
+            lines.append(f"  {label:>8} ms {count:6d} {bar}")
+        return lines
@@ -0,0 +1,89 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from game.core import settings
+from game.core.assets import AssetStore
+
+logger = logging.getLogger(__name__)
+
+
+class AssetLoader:
+    """Chargement des assets en tâche de fond.
+
+    Les fichiers sont lus et décodés (PNG, blobs du cache disque, mp3) par un
+    pool de threads. La conversion au format de l'écran et l'ajout dans
+    l'AssetStore se font dans le thread principal via pump(), appelé à chaque
+    frame par Game.run.
+
+    Les assets sont regroupés ("menu", "ski", "hockey"...) pour pouvoir
+    attendre uniquement ce dont une scène a besoin.
+    """
+
+    _executor = None
+    _jobs = []
+    _totals = {}
+    _done = {}
+
+    @classmethod
+    def _submit(cls, group, fn, finish, *args):
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.LOADER_WORKERS, thread_name_prefix="assets"
+            )
+        cls._totals[group] = cls._totals.get(group, 0) + 1
+        cls._done.setdefault(group, 0)
+        cls._jobs.append((group, finish, args, cls._executor.submit(fn, *args)))
+
+    @classmethod
+    def queue_images(cls, group, specs):
+        """specs : liste de (chemin, taille, mode), voir AssetStore.image."""
+        for path, size, mode in specs:
+            if not AssetStore.has_image(path, size, mode):
+                cls._submit(group, AssetStore.decode_image, AssetStore.finish_image, path, size, mode)
+
+    @classmethod
+    def queue_sounds(cls, group, paths):
+        for path in paths:
+            if not AssetStore.has_sound(path):
+                cls._submit(group, AssetStore.decode_sound, AssetStore.finish_sound, path)
+
+    @classmethod
+    def pump(cls, budget_ms=8):
+        """Termine les chargements prêts, dans la limite du budget (au moins un)."""
+        deadline = time.perf_counter() + budget_ms / 1000
+        remaining = []
+        finished = 0
+        for job in cls._jobs:
+            group, finish, args, future = job
+            out_of_time = finished and time.perf_counter() > deadline
+            if out_of_time or not future.done():
+                remaining.append(job)
+                continue
+            try:
+                finish(*args, future.result())
+            except Exception:
+                # L'asset sera rechargé de façon synchrone au premier accès
+                logger.exception("chargement de %s échoué", args[0])
+            cls._done[group] += 1
+            finished += 1
+        cls._jobs = remaining
+
+    @classmethod
+    def progress(cls, group=None):
+        """Avancement entre 0.0 et 1.0 (d'un groupe ou de tous)."""
+        groups = [group] if group else list(cls._totals)
+        total = sum(cls._totals.get(g, 0) for g in groups)
+        done = sum(cls._done.get(g, 0) for g in groups)
+        return done / total if total else 1.0
+
+    @classmethod
+    def is_ready(cls, group):
+        return cls._done.get(group, 0) >= cls._totals.get(group, 0)
+
+    @classmethod
+    def shutdown(cls):
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+        cls._jobs = []
@@ -0,0 +1,77 @@
+import time
+from collections import deque
+
+import pygame
+
+from game.core import settings
+
+STRATEGIES = ("sleep", "hybrid", "vsync")
+
+
+class HybridClock:
+    """Remplace pygame.time.Clock avec une attente plus précise.
+
+    Dort jusqu'à PACING_SPIN_MS avant l'échéance (la granularité du sleep de
+    l'OS), puis attend activement. Chaque échéance part de la précédente,
+    pour ne pas dériver ; après un retard, on repart de l'instant présent.
+    """
+
+    def __init__(self):
+        self._last = time.perf_counter()
+        self._deadline = self._last
+        self._frame_times = deque(maxlen=10)
+
+    def tick(self, framerate=0):
+        if framerate:
+            self._deadline += 1.0 / framerate
+            if time.perf_counter() > self._deadline:
+                self._deadline = time.perf_counter()  # En retard : pas de rattrapage
+            else:
+                self._wait(self._deadline)
+        else:
+            # Sans cadence (frames vsync) : la prochaine échéance part d'ici
+            self._deadline = time.perf_counter()
+        now = time.perf_counter()
+        dt = (now - self._last) * 1000
+        self._last = now
+        self._frame_times.append(dt)
+        return dt
+
+    @staticmethod
+    def _wait(deadline):
+        remaining = deadline - time.perf_counter() - settings.PACING_SPIN_MS / 1000
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < deadline:
+            pass
+
+    def get_fps(self):
+        if not self._frame_times:
+            return 0.0
+        return 1000 * len(self._frame_times) / sum(self._frame_times)
+
+
+class VsyncClock(HybridClock):
+    """Cadence donnée par la synchro verticale : display.flip() bloque
+    jusqu'au rafraîchissement de l'écran, tick() n'attend donc pas.
+
+    Les frames au repos (IDLE_FPS) ne présentent rien : là, l'attente
+    hybride reprend pour ne pas tourner à vide.
+    """
+
+    def tick(self, framerate=0):
+        return super().tick(framerate if framerate < settings.FPS else 0)
+
+
+def vsync_available():
+    # Le driver "dummy" accepte vsync=1 sans rien synchroniser
+    return pygame.display.get_driver() != "dummy"
+
+
+def make_clock(strategy):
+    """Horloge de la boucle pour une stratégie de STRATEGIES."""
+    if strategy == "vsync":
+        return VsyncClock()
+    if strategy == "hybrid":
+        return HybridClock()
+    return pygame.time.Clock()
@@ -0,0 +1,59 @@
+from game.core import settings
+
+
+class Pool:
+    """Objets réutilisés au lieu d'être recréés (entités, textes flottants).
+
+    acquire() ressort un objet libéré, réinitialisé par son __init__, ou en
+    crée un ; release() le rend quand il quitte le jeu. Au plus
+    POOL_MAX_FREE objets libres sont gardés par pool. Avec POOLING = False,
+    release ne garde rien (pour comparer la pression sur le GC).
+    """
+
+    instances = []
+
+    def __init__(self, cls):
+        self.cls = cls
+        self._free = []
+        self.created = 0
+        self.reused = 0
+        Pool.instances.append(self)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.__init__(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        if settings.POOLING and len(self._free) < settings.POOL_MAX_FREE:
+            self._free.append(obj)
+
+    def stats(self):
+        return {"created": self.created, "reused": self.reused, "free": len(self._free)}
+
+    @classmethod
+    def report(cls):
+        return {pool.cls.__name__: pool.stats() for pool in cls.instances}
+
+
+def swap_remove(items, dead, pool=None):
+    """Retire sur place les éléments pour lesquels dead(item) est vrai.
+
+    Le dernier élément prend la place de chaque retiré : aucune liste n'est
+    recréée, mais l'ordre n'est pas conservé. Les retirés vont dans pool.
+    """
+    i = 0
+    while i < len(items):
+        item = items[i]
+        if dead(item):
+            last = items.pop()
+            if i < len(items):
+                items[i] = last
+            if pool is not None:
+                pool.release(item)
+        else:
+            i += 1
@@ -0,0 +1,89 @@
+import importlib
+import logging
+import time
+from collections import deque
+
+import pygame
+
+from game.core import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Prewarmer:
+    """Prépare à l'avance les scènes qui vont probablement suivre.
+
+    A chaque changement de scène, Game appelle schedule() : les classes
+    listées dans scene.successors ("module:Classe") sont mises en file. run()
+    est appelé en fin de frame avec le temps encore libre : s'il reste au
+    moins PREWARM_MIN_SPARE_MS et que la scène courante le permet
+    (can_prewarm), une étape du générateur Scene.prewarm avance, en
+    dessinant dans un brouillon hors écran.
+
+    Les caches remplis (textes, sprites, calques) sont partagés par toutes
+    les instances. L'instance retournée par prewarm est gardée : Scene.create
+    la reprend (take) au lieu de construire la scène pendant la frame du
+    changement. Une fois reprise, elle est à nouveau préparée au prochain
+    schedule.
+    """
+
+    _queue = deque()
+    _ready = {}       # chemin -> instance prête
+    _current = None   # (chemin, générateur, temps cumulé en s)
+    _scratch = None
+
+    @classmethod
+    def schedule(cls, scene):
+        for path in scene.successors:
+            current = cls._current and cls._current[0]
+            if path not in cls._ready and path not in cls._queue and path != current:
+                cls._queue.append(path)
+
+    @staticmethod
+    def _path(scene_class):
+        return f"{scene_class.__module__}:{scene_class.__name__}"
+
+    @classmethod
+    def take(cls, scene_class, game):
+        """Instance préparée de scene_class (retirée), ou None."""
+        scene = cls._ready.pop(cls._path(scene_class), None)
+        if scene is not None and scene.game is not game:
+            return None
+        return scene
+
+    @classmethod
+    def run(cls, game, spare_ms):
+        """Avance la préparation d'une étape si le temps libre le permet."""
+        if cls._current is None and not cls._queue:
+            return False
+        if spare_ms < settings.PREWARM_MIN_SPARE_MS or not game.scene.can_prewarm():
+            return False
+
+        start = time.perf_counter()
+        if cls._current is None:
+            path = cls._queue.popleft()
+            module, name = path.split(":")
+            scene_class = getattr(importlib.import_module(module), name)
+            cls._current = (path, scene_class.prewarm(game, cls._scratch_surface(game.screen)), 0.0)
+        path, steps, spent = cls._current
+        try:
+            next(steps)
+            done = False
+        except StopIteration as stop:
+            done = True
+            if stop.value is not None:
+                cls._ready[path] = stop.value
+        spent += time.perf_counter() - start
+        cls._current = (path, steps, spent)
+        if done:
+            cls._current = None
+            logger.debug("scène %s préparée : %.1f ms", path, spent * 1000)
+            if not cls._queue:
+                cls._scratch = None  # Le brouillon (taille écran) n'est gardé que le temps de la file
+        return True
+
+    @classmethod
+    def _scratch_surface(cls, screen):
+        if cls._scratch is None or cls._scratch.get_size() != screen.get_size():
+            cls._scratch = pygame.Surface(screen.get_size()).convert()
+        return cls._scratch
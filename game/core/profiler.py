@@ -0,0 +1,267 @@
+import csv
+import functools
+import json
+import time
+from collections import deque
+
+import pygame
+
+from game.core import settings
+from game.core.fonts import FontRegistry
+from game.core.quality import QualityGovernor
+
+PHASES = ("events", "loader", "update", "render", "profiler", "present")
+
+
+class Profiler:
+    """Mesure du temps de frame, affichée avec F3.
+
+    Game.run découpe chaque frame en phases (mark) ; les méthodes draw_* des
+    classes enregistrées avec register() sont chronométrées une à une, mais
+    seulement pendant que le profiler est actif (aucun coût sinon), hors
+    temps des draw_* qu'elles appellent.
+
+    Les frames sont gardées dans une trace exportée en CSV et JSON à la
+    fermeture du jeu, dans settings.PROFILE_DIR.
+    """
+
+    enabled = False
+    visible = False
+
+    _classes = []
+    _originals = {}
+    _frame_start = None
+    _last_mark = 0.0
+    _phases = {}
+    _draws = {}
+    _nested = []    # temps des draw_* enfants, par appel draw_* en cours
+    _frame_index = 0
+
+    _windows = {}   # scène -> deque des derniers temps de frame (ms)
+    _worst = {}     # scène -> pire frame (enregistrement complet)
+    _graph = deque(maxlen=240)
+    _trace = deque(maxlen=settings.PROFILER_TRACE_FRAMES)
+
+    _panel = None
+    _panel_time = 0.0
+
+    # Activation
+
+    @classmethod
+    def register(cls, klass):
+        """Chronométrer les méthodes draw_* de klass quand le profiler est actif."""
+        if klass not in cls._classes:
+            cls._classes.append(klass)
+            if cls.enabled:
+                cls._instrument(klass)
+        return klass
+
+    @classmethod
+    def toggle(cls):
+        cls.visible = not cls.visible
+        if cls.visible:
+            cls.enable()
+        elif not settings.PROFILER:
+            cls.disable()  # HUD masqué : plus de chronométrage (sauf trace demandée par settings)
+
+    @classmethod
+    def enable(cls):
+        if cls.enabled:
+            return
+        cls.enabled = True
+        for klass in cls._classes:
+            cls._instrument(klass)
+
+    @classmethod
+    def disable(cls):
+        cls.enabled = False
+        cls.visible = False
+        cls._frame_start = None
+        for (klass, name), fn in cls._originals.items():
+            setattr(klass, name, fn)
+        cls._originals.clear()
+
+    @classmethod
+    def _instrument(cls, klass):
+        for name, fn in list(vars(klass).items()):
+            if name.startswith("draw_") and callable(fn):
+                cls._originals[(klass, name)] = fn
+                setattr(klass, name, cls._timed(f"{klass.__name__}.{name}", fn))
+
+    @classmethod
+    def _timed(cls, label, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            # Temps propre : sans les draw_* appelés dedans, comptés à part
+            nested = cls._nested
+            nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = nested.pop()
+                cls._draws[label] = cls._draws.get(label, 0.0) + elapsed - children
+                if nested:
+                    nested[-1] += elapsed
+        return timed
+
+    # Mesure
+
+    @classmethod
+    def begin_frame(cls):
+        if not cls.enabled:
+            return
+        cls._frame_start = cls._last_mark = time.perf_counter()
+        cls._phases = {}
+        cls._draws = {}
+
+    @classmethod
+    def mark(cls, phase):
+        """Fin de la phase en cours (temps écoulé depuis le mark précédent)."""
+        if cls._frame_start is None:
+            return
+        now = time.perf_counter()
+        cls._phases[phase] = cls._phases.get(phase, 0.0) + (now - cls._last_mark) * 1000
+        cls._last_mark = now
+
+    @classmethod
+    def end_frame(cls, scene_name):
+        if cls._frame_start is None:
+            return  # Profiler activé en cours de frame
+        total = (time.perf_counter() - cls._frame_start) * 1000
+        cls._frame_start = None
+        record = {
+            "frame": cls._frame_index,
+            "scene": scene_name,
+            "total_ms": round(total, 3),
+            "quality": QualityGovernor.tier,
+            "phases": {k: round(v, 3) for k, v in cls._phases.items()},
+            "draws": {k: round(v * 1000, 3) for k, v in cls._draws.items()},
+        }
+        cls._frame_index += 1
+        cls._trace.append(record)
+        cls._graph.append(total)
+
+        window = cls._windows.get(scene_name)
+        if window is None:
+            window = cls._windows[scene_name] = deque(maxlen=settings.PROFILER_WINDOW)
+        window.append(total)
+        worst = cls._worst.get(scene_name)
+        if worst is None or total > worst["total_ms"]:
+            cls._worst[scene_name] = record
+
+    @staticmethod
+    def _percentile(ordered, p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    @classmethod
+    def summary(cls, scene_name):
+        """p50 / p95 / p99 / pire frame (ms) sur la fenêtre glissante d'une scène."""
+        window = cls._windows.get(scene_name)
+        if not window:
+            return None
+        ordered = sorted(window)
+        return {
+            "frames": len(ordered),
+            "p50": cls._percentile(ordered, 0.50),
+            "p95": cls._percentile(ordered, 0.95),
+            "p99": cls._percentile(ordered, 0.99),
+            "worst": cls._worst[scene_name]["total_ms"],
+        }
+
+    # Affichage
+
+    @classmethod
+    def draw(cls, screen, scene_name):
+        """Dessine le HUD ; retourne la zone couverte (None si masqué)."""
+        if not cls.visible:
+            return None
+        now = time.perf_counter()
+        if cls._panel is None or now - cls._panel_time > 0.25:
+            cls._panel = cls._build_panel(scene_name)
+            cls._panel_time = now
+        rect = screen.blit(cls._panel, (10, 10))
+        cls._draw_graph(screen, pygame.Rect(rect.left, rect.bottom, rect.width, 90))
+        return rect.union(pygame.Rect(rect.left, rect.bottom, rect.width, 90))
+
+    @classmethod
+    def _build_panel(cls, scene_name):
+        font = FontRegistry.get("consolas", 16)
+        lines = [f"{scene_name}  qualité {QualityGovernor.tier} ({QualityGovernor.name()})  (F3)"]
+        stats = cls.summary(scene_name)
+        if stats:
+            lines.append(
+                f"p50 {stats['p50']:5.2f}  p95 {stats['p95']:5.2f}  "
+                f"p99 {stats['p99']:5.2f}  max {stats['worst']:6.2f} ms"
+            )
+        if cls._trace:
+            last = cls._trace[-1]
+            lines.append("  ".join(f"{p} {last['phases'].get(p, 0.0):.2f}" for p in PHASES))
+            slowest = sorted(last["draws"].items(), key=lambda item: item[1], reverse=True)[:6]
+            lines.extend(f"  {name:<38}{ms:6.2f} ms" for name, ms in slowest)
+
+        line_h = font.get_linesize()
+        panel = pygame.Surface((460, 12 + line_h * 10)).convert()
+        panel.fill((12, 14, 20))
+        pygame.draw.rect(panel, (90, 110, 140), panel.get_rect(), 1)
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, (220, 230, 240)), (8, 6 + i * line_h))
+        return panel
+
+    @classmethod
+    def _draw_graph(cls, screen, area):
+        screen.fill((12, 14, 20), area)
+        scale = area.height / 50.0  # 50 ms en haut du graphe
+        for budget in (1000 / 60, 1000 / 30):
+            y = area.bottom - int(budget * scale)
+            pygame.draw.line(screen, (60, 70, 90), (area.left, y), (area.right - 1, y))
+        bar_w = area.width / cls._graph.maxlen
+        for i, ms in enumerate(cls._graph):
+            h = min(area.height, int(ms * scale))
+            color = (90, 200, 120) if ms <= 1000 / 60 else (230, 190, 70) if ms <= 1000 / 30 else (230, 80, 80)
+            x = area.left + int(i * bar_w)
+            pygame.draw.line(screen, color, (x, area.bottom - 1), (x, area.bottom - h))
+
+    # Export
+
+    @classmethod
+    def export(cls):
+        """Ecrit la trace (CSV + JSON) ; retourne le chemin JSON ou None."""
+        if not cls._trace:
+            return None
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = settings.PROFILE_DIR / f"trace-{stamp}"
+        trace = list(cls._trace)
+        try:
+            settings.PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            report = {
+                "summary": {scene: cls.summary(scene) for scene in cls._windows},
+                "worst_frames": cls._worst,
+                "frames": trace,
+            }
+            with open(base.with_suffix(".json"), "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=1)
+
+            draw_names = sorted({name for record in trace for name in record["draws"]})
+            with open(base.with_suffix(".csv"), "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", "scene", "quality", "total_ms", *PHASES, *draw_names])
+                for record in trace:
+                    writer.writerow([
+                        record["frame"], record["scene"], record["quality"], record["total_ms"],
+                        *(record["phases"].get(p, 0.0) for p in PHASES),
+                        *(record["draws"].get(name, 0.0) for name in draw_names),
+                    ])
+        except OSError:
+            return None
+        return base.with_suffix(".json")
+
+    @classmethod
+    def reset(cls):
+        cls._windows.clear()
+        cls._worst.clear()
+        cls._graph.clear()
+        cls._trace.clear()
+        cls._frame_index = 0
+        cls._panel = None
@@ -0,0 +1,74 @@
+import logging
+from collections import deque
+
+from game.core import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QualityGovernor:
+    """Baisse (ou remonte) le niveau d'effets selon le temps de frame mesuré.
+
+    Game.step appelle observe() avec le temps de travail de chaque frame
+    (hors attente de l'horloge). Toutes les QUALITY_WINDOW frames, le 90e
+    percentile est comparé au budget 1000 / FPS :
+    - au-dessus de QUALITY_DOWNGRADE x budget : un niveau de moins ;
+    - sous QUALITY_UPGRADE x budget pendant QUALITY_UPGRADE_WINDOWS fenêtres
+      d'affilée : un niveau de plus.
+    L'écart entre les deux seuils évite d'osciller entre deux niveaux.
+
+    Les renderers comparent QualityGovernor.tier aux niveaux ci-dessous.
+    """
+
+    FULL = 0       # Tous les effets
+    NO_TRAIL = 1   # Plus de traînée derrière le palet
+    NO_GLOW = 2    # Plus de halos ni d'ombres (palet, compte à rebours)
+    MINIMAL = 3    # Flashs réduits aux bords de l'écran
+    NAMES = ("complet", "sans traînée", "sans halo", "minimal")
+
+    tier = settings.QUALITY_TIER
+    changes = 0
+    _samples = deque(maxlen=settings.QUALITY_WINDOW)
+    _calm_windows = 0
+
+    @classmethod
+    def name(cls):
+        return cls.NAMES[cls.tier]
+
+    @classmethod
+    def observe(cls, work_ms):
+        if not settings.QUALITY_AUTO:
+            return
+        cls._samples.append(work_ms)
+        if len(cls._samples) < cls._samples.maxlen:
+            return
+
+        ordered = sorted(cls._samples)
+        p90 = ordered[int(len(ordered) * 0.9)]
+        cls._samples.clear()
+        budget = 1000 / settings.FPS
+
+        if p90 > budget * settings.QUALITY_DOWNGRADE:
+            cls._calm_windows = 0
+            if cls.tier < cls.MINIMAL:
+                cls._set(cls.tier + 1, p90, budget)
+        elif p90 < budget * settings.QUALITY_UPGRADE:
+            cls._calm_windows += 1
+            if cls._calm_windows >= settings.QUALITY_UPGRADE_WINDOWS and cls.tier > cls.FULL:
+                cls._calm_windows = 0
+                cls._set(cls.tier - 1, p90, budget)
+        else:
+            cls._calm_windows = 0
+
+    @classmethod
+    def _set(cls, tier, p90, budget):
+        logger.info("qualité : %s -> %s (p90 %.1f ms pour un budget de %.1f ms)",
+                    cls.name(), cls.NAMES[tier], p90, budget)
+        cls.tier = tier
+        cls.changes += 1
+
+    @classmethod
+    def reset(cls, tier=None):
+        cls.tier = settings.QUALITY_TIER if tier is None else tier
+        cls._samples.clear()
+        cls._calm_windows = 0
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import logging
+import random
+import time
+import zlib
+
+from game.core import settings
+
+logger = logging.getLogger(__name__)
+
+REPLAY_VERSION = 1
+
+# Réglages sans effet sur la simulation (affichage, caches, mesures) : hors empreinte
+_PRESENTATION = {
+    "FPS", "IDLE_FPS", "PACING_SPIN_MS", "DIRTY_FULL_THRESHOLD", "MAX_SIM_STEPS",
+    "FONT_SIZE_STEP", "TEXT_CACHE_SIZE", "SPRITE_CACHE_BYTES", "POOL_MAX_FREE", "QUALITY_TIER",
+    "QUALITY_WINDOW", "QUALITY_DOWNGRADE", "QUALITY_UPGRADE", "QUALITY_UPGRADE_WINDOWS",
+    "PREWARM_MIN_SPARE_MS", "LOADER_WORKERS", "PROFILER_WINDOW", "PROFILER_TRACE_FRAMES",
+    "REPLAY_CHECKPOINT_TICKS", "RUN_SEED", "PLAYER_RENDER_HEIGHT", "HEART_SIZE", "HEART_Y", "GUN_WIDTH",
+    "GUN_Y_OFFSET", "MENU_BUTTON_WIDTH", "MENU_BUTTON_HEIGHT", "MENU_BUTTON_SPACING",
+    "MENU_BUTTON_BOTTOM_MARGIN", "TILT_FACTOR", "BACKGROUND_IMAGES",
+}
+
+
+def new_seed():
+    """Graine d'une nouvelle partie : settings.RUN_SEED, sinon tirée au hasard."""
+    if settings.RUN_SEED is not None:
+        return settings.RUN_SEED
+    return random.SystemRandom().getrandbits(32)
+
+
+def settings_hash():
+    """Empreinte des réglages de gameplay (nombres, tailles, tables)."""
+    values = []
+    for name in sorted(vars(settings)):
+        value = getattr(settings, name)
+        if (not name.isupper() or name in _PRESENTATION or name.endswith(("_COLOR", "_LINE", "_SHADOW"))
+                or isinstance(value, bool) or not isinstance(value, (int, float, tuple, dict))):
+            continue
+        values.append((name, value))
+    return hashlib.sha1(repr(values).encode()).hexdigest()[:12]
+
+
+def checksum(state):
+    return zlib.crc32(repr(state).encode())
+
+
+class Replay:
+    """Enregistrement et relecture exacte d'une partie (--record, --replay).
+
+    Chaque partie tire ses aléas d'un random.Random à elle (World,
+    HockeyScene) : avec la même graine et les mêmes entrées, la simulation
+    refait exactement les mêmes calculs. Les scènes font passer les entrées
+    de chaque tick par inputs() : enregistrées en mode "record", remplacées
+    par celles du fichier en mode "play". Toutes les
+    REPLAY_CHECKPOINT_TICKS ticks, une somme de contrôle de l'état de la
+    partie est notée, puis comparée à la relecture.
+
+    Format : JSON, entrées en bits (une touche par bit), compressées par
+    plages [bits, nombre de ticks].
+    """
+
+    mode = None          # None, "record" ou "play"
+    _run = None          # partie en cours (dict au format du fichier)
+    _state = None        # fonction -> état de la partie à contrôler
+    _ticks = 0
+    _inputs = []         # "play" : bits de chaque tick
+    _expected = []       # "play" : sommes de contrôle enregistrées
+    _every = 0           # ticks entre deux sommes de contrôle
+    mismatches = []      # "play" : (tick, attendu, obtenu)
+
+    @classmethod
+    def start_run(cls, kind, seed, state):
+        """Début d'une partie ; state() donne l'état comparé aux points de contrôle."""
+        if cls.mode != "record":
+            return
+        cls.end_run()
+        cls._run = {
+            "version": REPLAY_VERSION,
+            "kind": kind,
+            "seed": seed,
+            "settings": settings_hash(),
+            "sim_hz": settings.SIM_HZ,
+            "checkpoint_every": settings.REPLAY_CHECKPOINT_TICKS,
+            "ticks": 0,
+            "inputs": [],
+            "checksums": [],
+        }
+        cls._state = state
+        cls._every = settings.REPLAY_CHECKPOINT_TICKS
+        cls._ticks = 0
+
+    @classmethod
+    def inputs(cls, keys):
+        """Entrées d'un tick (tuple de booléens) : enregistrées ou relues."""
+        if cls.mode == "play":
+            if cls._ticks >= len(cls._inputs):
+                return (False,) * len(keys)
+            bits = cls._inputs[cls._ticks]
+            keys = tuple(bool(bits >> i & 1) for i in range(len(keys)))
+        elif cls._run is not None:
+            bits = sum(1 << i for i, pressed in enumerate(keys) if pressed)
+            runs = cls._run["inputs"]
+            if runs and runs[-1][0] == bits:
+                runs[-1][1] += 1
+            else:
+                runs.append([bits, 1])
+        else:
+            return keys
+        cls._checkpoint()
+        cls._ticks += 1
+        return keys
+
+    @classmethod
+    def _checkpoint(cls):
+        # Etat avant les effets du tick : identique à l'enregistrement et à la relecture
+        every = cls._every
+        if cls._ticks == 0 or cls._ticks % every:
+            return
+        value = checksum(cls._state())
+        if cls.mode == "record":
+            cls._run["checksums"].append(value)
+            return
+        index = cls._ticks // every - 1
+        if index < len(cls._expected) and cls._expected[index] != value:
+            cls.mismatches.append((cls._ticks, cls._expected[index], value))
+
+    @classmethod
+    def end_run(cls):
+        """Fin de la partie enregistrée : écrit le fichier ; retourne son chemin."""
+        run, cls._run = cls._run, None
+        if run is None or cls._ticks == 0:
+            return None
+        run["ticks"] = cls._ticks
+        run["final"] = checksum(cls._state())
+        cls._state = None
+        name = f"{run['kind']}-{time.strftime('%Y%m%d-%H%M%S')}-{run['seed']}"
+        try:
+            settings.REPLAY_DIR.mkdir(parents=True, exist_ok=True)
+            f, path = cls._create(name)
+            with f:
+                json.dump(run, f, separators=(",", ":"))
+        except OSError:
+            logger.warning("replay non enregistré : %s", name)
+            return None
+        logger.info("replay enregistré : %s (%d ticks)", path, run["ticks"])
+        return path
+
+    @staticmethod
+    def _create(name):
+        """Nouveau fichier name.json, ou name-2.json... s'il existe déjà (même seconde, même graine)."""
+        n = 1
+        while True:
+            path = settings.REPLAY_DIR / (f"{name}.json" if n == 1 else f"{name}-{n}.json")
+            try:
+                return open(path, "x", encoding="utf-8"), path
+            except FileExistsError:
+                n += 1
+
+    # Relecture
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            run = json.load(f)
+        if run.get("version") != REPLAY_VERSION:
+            raise ValueError(f"{path} : version de replay {run.get('version')} non gérée")
+        return run
+
+    @classmethod
+    def play(cls, run, state):
+        """Passe en mode relecture des entrées de run."""
+        cls.mode = "play"
+        cls._inputs = [bits for bits, count in run["inputs"] for _ in range(count)]
+        cls._expected = run["checksums"]
+        cls._every = run["checkpoint_every"]
+        cls._state = state
+        cls._ticks = 0
+        cls.mismatches = []
+        if run["settings"] != settings_hash():
+            logger.warning("réglages différents de l'enregistrement : la relecture peut diverger")
+
+    @classmethod
+    def remaining(cls):
+        return len(cls._inputs) - cls._ticks
+
+    @classmethod
+    def final_checksum(cls):
+        return checksum(cls._state())
@@ -4,9 +4,33 @@ from pathlib import Path
 WIDTH = 1920
 HEIGHT = 1080
 FPS = 60
+IDLE_FPS = 20  # cadence quand rien ne change à l'écran (menus au repos)
+FRAME_PACING = "sleep"  # Attente entre frames : "sleep", "hybrid" (sleep + attente active) ou "vsync"
+PACING_SPIN_MS = 2      # "hybrid" : attente active pendant les dernières ms avant l'échéance
+DIRTY_RECTS = True  # présenter seulement les zones modifiées quand la scène les fournit
+DIRTY_FULL_THRESHOLD = 0.5  # au-delà de cette part de l'écran, flip complet
 FULLSCREEN = True
+SIM_HZ = 60                    # Fréquence fixe de la simulation (ticks/s)
+MAX_SIM_STEPS = 5              # Ticks rattrapés au plus par frame
+FONT_SIZE_STEP = 4             # Pas des tailles de police animées
+TEXT_CACHE_SIZE = 256          # Textes rendus gardés en cache (LRU)
+SPRITE_CACHE_BYTES = 64 * 1024 * 1024  # Sprites redimensionnés / tournés (LRU)
+POOLING = True                 # Recycler obstacles, médailles et textes flottants (voir Pool)
+POOL_MAX_FREE = 256            # Objets libres gardés au plus par pool
+
+# Qualité adaptative des effets (voir QualityGovernor)
+QUALITY_AUTO = True            # Ajuster le niveau selon le temps de frame
+QUALITY_TIER = 0               # Niveau de départ (0 = complet ... 3 = minimal)
+QUALITY_WINDOW = 60            # Frames par mesure
+QUALITY_DOWNGRADE = 0.85       # p90 > 85 % du budget : on retire des effets
+QUALITY_UPGRADE = 0.5          # p90 < 50 % du budget ...
+QUALITY_UPGRADE_WINDOWS = 4    # ... pendant 4 mesures d'affilée : on en remet
+
+# Préparation des scènes suivantes (voir Prewarmer)
+PREWARM_MIN_SPARE_MS = 6       # Temps libre minimum dans la frame pour préparer une scène
 
 # Phase de   Ski
+ENTITY_BACKEND = "lists"       # Obstacles / médailles : "lists" (listes par voie) ou "numpy" (colonnes)
 LANES = 3
 LANE_PADDING = 360
 PLAYER_Y = HEIGHT - 150
@@ -17,18 +41,18 @@ MEDAL_SIZE = (72, 72)
 OBSTACLE_MIN_GAP = 200
 MEDAL_MIN_GAP = 250
 
-# Physique
-GRAVITY = 1.2
-JUMP_VELOCITY = -22
+# Physique (unités par seconde)
+GRAVITY = 4320                 # px/s²
+JUMP_VELOCITY = -1320          # px/s
 HORIZONTAL_SPEED = 1400
 TILT_FACTOR = 0.08
 PLAYER_INVINCIBILITY_MS = 1500
 PLAYER_START_LIVES = 0
 
 # Vitesse et spawn
-BASE_SCROLL_SPEED = 7          # Vitesse de départ (augmenter pour aller plus vite)
-MAX_SCROLL_SPEED = 50         # Vitesse max
-SPEED_GROWTH = 0.18            # Accélération progressive
+BASE_SCROLL_SPEED = 420        # Vitesse de départ en px/s (augmenter pour aller plus vite)
+MAX_SCROLL_SPEED = 3000        # Vitesse max (px/s)
+SPEED_GROWTH = 10.8            # Accélération progressive (px/s gagnés par unité de distance)
 
 SPAWN_INTERVAL = 700           # Intervalle spawn arbres (ms)
 SPAWN_VARIATION = 200
@@ -56,6 +80,22 @@ ICICLE_IMG = ASSETS_DIR / "glacons.png"       # Obstacle glaçon
 ICICLE_SIZE = (170, 120)              # Taille des glaçons
 MENU_BG_IMG = ASSETS_DIR / "accueil.png"
 
+# Cache disque des images redimensionnées (reconstruit automatiquement)
+ASSET_DISK_CACHE = True
+ASSET_CACHE_DIR = ASSETS_DIR.parent / ".asset_cache"
+LOADER_WORKERS = 4             # Threads de décodage des assets
+
+# Profiler (F3) : percentiles par scène et trace exportée à la fermeture
+PROFILER = False               # Mesurer dès le lancement (sinon au premier F3)
+PROFILER_WINDOW = 600          # Frames prises en compte pour p50 / p95 / p99
+PROFILER_TRACE_FRAMES = 36000  # Frames gardées dans la trace exportée
+PROFILE_DIR = ASSETS_DIR.parent / "profiles"
+
+# Parties rejouables (voir Replay)
+RUN_SEED = None                # Graine imposée à chaque partie (None : tirée au hasard)
+REPLAY_CHECKPOINT_TICKS = 60   # Somme de contrôle de l'état toutes les N ticks
+REPLAY_DIR = ASSETS_DIR.parent / "replays"
+
 # Maps (detection auto des fondrun*.png ou jpg)
 def get_background_images():
     backgrounds = []
@@ -66,8 +106,19 @@ def get_background_images():
     backgrounds = sorted(set(backgrounds), key=lambda x: x.name)
     return backgrounds if backgrounds else [ASSETS_DIR / "fondrun.jpg"]
 
-BACKGROUND_IMAGES = get_background_images()
-BACKGROUND_IMG = BACKGROUND_IMAGES[0]
+
+def __getattr__(name):
+    # BACKGROUND_IMAGES / BACKGROUND_IMG : le dossier n'est parcouru qu'au
+    # premier accès, pas à l'import des settings
+    if name == "BACKGROUND_IMAGES":
+        value = get_background_images()
+    elif name == "BACKGROUND_IMG":
+        value = __getattr__("BACKGROUND_IMAGES")[0]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 MENU_BUTTON_IMG = ASSETS_DIR / "bouttonAccueil.png"
 BUTTON_BIATHLON_IMG = ASSETS_DIR / "bouton_biathlon.png"
 BUTTON_HOCKEY_IMG = ASSETS_DIR / "bouton_hockey.png"
@@ -88,6 +139,7 @@ HEART_Y = 15
 MUSIC_MENU = ASSETS_DIR / "son_menu.mp3"
 MUSIC_GAME = ASSETS_DIR / "son_jeu.mp3"
 SOUND_COIN = ASSETS_DIR / "coin.mp3"
+SAVE_BEST_SCORE = True         # False : le meilleur score n'est pas écrit (mode headless)
 
 MEDAL_BRONZE_IMG = ASSETS_DIR / "bronze.png"
 MEDAL_SILVER_IMG = ASSETS_DIR / "argent.png"
@@ -142,7 +194,7 @@ GUN_Y_OFFSET = 30              # Distance du bas de l'écran
 SIGHT_SIZE = (150, 130)
 SIGHT_MIN_X = 100
 SIGHT_MAX_X = WIDTH - 220
-SIGHT_SPEED = 12
+SIGHT_SPEED = 720              # px/s
 SIGHT_Y = TARGET_Y - 5
 TARGET_TOLERANCE = 60
 TARGET_SPACING = (WIDTH - 300) // (NUM_TARGETS - 1)
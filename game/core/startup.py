@@ -0,0 +1,58 @@
+import time
+
+# Origine du chronométrage : index.py importe ce module avant tout le reste
+_ORIGIN = time.perf_counter()
+
+
+class StartupTrace:
+    """Chronologie du démarrage, affichée avec index.py --trace-startup.
+
+    mark() clôt une phase (durée depuis la phase précédente). Game.step
+    signale chaque frame rendue : la première donne le temps jusqu'à la
+    première frame (first_frame_ms), toujours mesuré. La trace se termine
+    quand tous les assets sont chargés et que l'écran de chargement a laissé
+    place au jeu.
+    """
+
+    enabled = False
+    finished = False
+    first_frame_ms = None
+
+    _phases = []          # (phase, durée ms, depuis le lancement ms)
+    _last = _ORIGIN
+    _scenes_seen = set()
+
+    @classmethod
+    def elapsed_ms(cls):
+        return (time.perf_counter() - _ORIGIN) * 1000
+
+    @classmethod
+    def mark(cls, phase):
+        if cls.finished:
+            return
+        now = time.perf_counter()
+        cls._phases.append((phase, (now - cls._last) * 1000, (now - _ORIGIN) * 1000))
+        cls._last = now
+
+    @classmethod
+    def frame_rendered(cls, scene_name, loaded):
+        if cls.finished:
+            return
+        if cls.first_frame_ms is None:
+            cls.first_frame_ms = cls.elapsed_ms()
+        if scene_name not in cls._scenes_seen:
+            cls._scenes_seen.add(scene_name)
+            cls.mark(f"1re frame {scene_name}")
+        if loaded:
+            cls.mark("tous les assets chargés")
+            cls.finished = True
+            if cls.enabled:
+                print(cls.report())
+
+    @classmethod
+    def report(cls):
+        lines = ["Démarrage :"]
+        lines.extend(f"  {phase:<36}{ms:9.1f} ms  (t = {at:8.1f} ms)" for phase, ms, at in cls._phases)
+        if cls.first_frame_ms is not None:
+            lines.append(f"  {'première frame':<36}{cls.first_frame_ms:9.1f} ms après le lancement")
+        return "\n".join(lines)
@@ -1,42 +1,56 @@
 import pygame
 
 from game.core import settings
+from game.core.assets import AssetStore
+from game.core.fonts import FontRegistry
+from game.core.loader import AssetLoader
+from game.core.profiler import Profiler
+from game.core.quality import QualityGovernor
+from game.views.glyphs import GlyphAtlas
+from game.views.overlays import Overlays
+from game.views.sprites import SpriteCache
+from game.views.text import TextCache
+
+# Images du mode hockey : (chemin, taille, mode), voir AssetStore.image
+PLAYER_SPRITE = (settings.ASSETS_DIR / "player_hockey.png", None, "colorkey")
+AI_SPRITE = (settings.ASSETS_DIR / "player_hockey2.png", None, "colorkey")
+LOGO = (settings.ASSETS_DIR / "logo.png", None, "alpha")
 
 
 class HockeyRenderer:
+    _rink_layers = {}  # (patinoire, largeur, hauteur) -> stade pré-composé
+
     def __init__(self):
-        self.font_big = pygame.font.SysFont("consolas", 56)
-        self.font_medium = pygame.font.SysFont("consolas", 42)
-        self.font_small = pygame.font.SysFont("consolas", 32)
-        self.font_tiny = pygame.font.SysFont("consolas", 24)
-        self.player_sprite = self._load_player_sprite("player_hockey.png")
-        self.ai_sprite = self._load_player_sprite("player_hockey2.png")
-        self.logo = self._load_logo()
+        self.font_big = FontRegistry.get("consolas", 56)
+        self.font_medium = FontRegistry.get("consolas", 42)
+        self.font_small = FontRegistry.get("consolas", 32)
+        self.font_tiny = FontRegistry.get("consolas", 24)
+        self.player_sprite = AssetStore.image(*PLAYER_SPRITE)
+        self.ai_sprite = AssetStore.image(*AI_SPRITE)
+        self.logo = AssetStore.image(*LOGO)
         self.banner_height = 70
-    def _load_logo(self):
-        path = settings.ASSETS_DIR / "logo.png"
-        if path.exists():
-            image = pygame.image.load(path).convert_alpha()
-            return image
-        return None
+        self._puck_sprites = {}
 
-
-    def _load_player_sprite(self, filename):
-        path = settings.ASSETS_DIR / filename
-        if path.exists():
-            image = pygame.image.load(path).convert_alpha()
-            try:
-                bg_color = image.get_at((0, 0))
-                image.set_colorkey(bg_color)
-            except Exception:
-                pass
-            return image
-        return None
+    @staticmethod
+    def preload():
+        AssetLoader.queue_images("hockey", [PLAYER_SPRITE, AI_SPRITE, LOGO])
 
     def _load_banner(self):
         return None
 
     def draw_background(self, screen, rink_rect):
+        # Le stade ne change pas d'une frame à l'autre : il est composé une
+        # seule fois puis blitté. Le calque est partagé entre les instances
+        # (nouveau match, écran de fin) et refait si la géométrie change.
+        key = (tuple(rink_rect), settings.WIDTH, settings.HEIGHT)
+        layer = self._rink_layers.get(key)
+        if layer is None:
+            layer = pygame.Surface((settings.WIDTH, settings.HEIGHT)).convert()
+            self._draw_stadium(layer, rink_rect)
+            self._rink_layers[key] = layer
+        screen.blit(layer, (0, 0))
+
+    def _draw_stadium(self, screen, rink_rect):
         # Fond du stade (bleu nuit)
         screen.fill((10, 14, 24))
 
@@ -47,7 +61,7 @@ class HockeyRenderer:
         pygame.draw.line(screen, (25, 28, 36), (0, top_band_h - 2), (settings.WIDTH, top_band_h - 2), 2)
 
         # Texte à gauche
-        title = self.font_medium.render("HOCKEY 1V1", True, (230, 235, 245))
+        title = TextCache.render(self.font_medium, "HOCKEY 1V1", (230, 235, 245))
         screen.blit(title, (24, (top_band_h - title.get_height()) // 2))
 
         # Logo en haut à droite sans déformation
@@ -147,13 +161,13 @@ class HockeyRenderer:
                              (rink_rect.right + i, goal_top + 3),
                              (rink_rect.right + i, goal_top + goal_h - 3), 1)
 
-    def draw_player(self, screen, player, color, sprite=None, active=False):
-        x, y, w, h = player.rect
+    def draw_player(self, screen, player, color, sprite=None, active=False, alpha=1.0):
+        x, y, w, h = player.rect_at(alpha)
         if sprite:
             scale = h / sprite.get_height()
             new_w = max(1, int(sprite.get_width() * scale))
             new_h = max(1, int(sprite.get_height() * scale))
-            img = pygame.transform.smoothscale(sprite, (new_w, new_h))
+            img = SpriteCache.get(sprite, size=(new_w, new_h))
             sx = x + w // 2 - new_w // 2
             sy = y + h // 2 - new_h // 2
             screen.blit(img, (sx, sy))
@@ -175,27 +189,65 @@ class HockeyRenderer:
         pygame.draw.polygon(screen, (255, 215, 0), points)
         pygame.draw.polygon(screen, (30, 30, 30), points, 2)
 
-    def draw_puck(self, screen, puck, trail=None):
-        if trail:
-            for i, (tx, ty) in enumerate(trail):
-                alpha = max(0, 180 - i * 12)
-                radius = max(2, puck.radius - i // 3)
-                surf = pygame.Surface((radius * 2 + 6, radius * 2 + 6), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (255, 150, 50, alpha), (radius + 3, radius + 3), radius + 2)
-                pygame.draw.circle(surf, (255, 220, 100, alpha), (radius + 3, radius + 3), radius)
-                screen.blit(surf, (int(tx - radius - 3), int(ty - radius - 3)))
-
-        shadow_surf = pygame.Surface((puck.radius * 2 + 8, puck.radius * 2 + 8), pygame.SRCALPHA)
-        pygame.draw.circle(shadow_surf, (0, 0, 0, 100), (puck.radius + 4, puck.radius + 6), puck.radius + 2)
-        screen.blit(shadow_surf, (int(puck.x - puck.radius - 4), int(puck.y - puck.radius - 4)))
-
-        glow_surf = pygame.Surface((puck.radius * 2 + 10, puck.radius * 2 + 10), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (255, 200, 50, 60), (puck.radius + 5, puck.radius + 5), puck.radius + 4)
-        screen.blit(glow_surf, (int(puck.x - puck.radius - 5), int(puck.y - puck.radius - 5)))
-
-        pygame.draw.circle(screen, (30, 30, 35), (int(puck.x), int(puck.y)), puck.radius)
-        pygame.draw.circle(screen, (255, 255, 255), (int(puck.x), int(puck.y)), puck.radius, 3)
-        pygame.draw.circle(screen, (255, 150, 50), (int(puck.x), int(puck.y)), puck.radius // 3)
+    def _trail_sprite(self, puck_radius, i):
+        # Les points de la traînée ne dépendent que de leur rang : dessinés une fois
+        key = ("trail", puck_radius, i)
+        surf = self._puck_sprites.get(key)
+        if surf is None:
+            fade = max(0, 180 - i * 12)
+            radius = max(2, puck_radius - i // 3)
+            surf = pygame.Surface((radius * 2 + 6, radius * 2 + 6), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (255, 150, 50, fade), (radius + 3, radius + 3), radius + 2)
+            pygame.draw.circle(surf, (255, 220, 100, fade), (radius + 3, radius + 3), radius)
+            self._puck_sprites[key] = surf
+        return surf
+
+    def _puck_halo(self, radius):
+        key = ("halo", radius)
+        halo = self._puck_sprites.get(key)
+        if halo is None:
+            shadow_surf = pygame.Surface((radius * 2 + 8, radius * 2 + 8), pygame.SRCALPHA)
+            pygame.draw.circle(shadow_surf, (0, 0, 0, 100), (radius + 4, radius + 6), radius + 2)
+            glow_surf = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (255, 200, 50, 60), (radius + 5, radius + 5), radius + 4)
+            halo = self._puck_sprites[key] = (shadow_surf, glow_surf)
+        return halo
+
+    def draw_puck(self, screen, puck, trail=None, alpha=1.0):
+        px, py = puck.lerp(alpha)
+        tier = QualityGovernor.tier
+        if trail and tier < QualityGovernor.NO_TRAIL:
+            for i, (tx, ty) in enumerate(self._trail_at(puck, trail, alpha)):
+                surf = self._trail_sprite(puck.radius, i)
+                offset = surf.get_width() // 2
+                screen.blit(surf, (int(tx - offset), int(ty - offset)))
+
+        if tier < QualityGovernor.NO_GLOW:
+            shadow_surf, glow_surf = self._puck_halo(puck.radius)
+            screen.blit(shadow_surf, (int(px - puck.radius - 4), int(py - puck.radius - 4)))
+            screen.blit(glow_surf, (int(px - puck.radius - 5), int(py - puck.radius - 5)))
+
+        pygame.draw.circle(screen, (30, 30, 35), (int(px), int(py)), puck.radius)
+        pygame.draw.circle(screen, (255, 255, 255), (int(px), int(py)), puck.radius, 3)
+        pygame.draw.circle(screen, (255, 150, 50), (int(px), int(py)), puck.radius // 3)
+
+    @staticmethod
+    def _trail_at(puck, trail, alpha):
+        """Points de la traînée décalés comme le palet interpolé.
+
+        Seulement si les deux derniers points sont les positions courante et
+        précédente du palet : chaque point est alors placé entre lui et le
+        suivant (la tick d'avant).
+        """
+        if (alpha >= 1.0 or len(trail) < 2 or trail[0] != (puck.x, puck.y)
+                or trail[1] != (puck.prev_x, puck.prev_y)):
+            return trail
+        points = [
+            (ox + (tx - ox) * alpha, oy + (ty - oy) * alpha)
+            for (tx, ty), (ox, oy) in zip(trail, trail[1:])
+        ]
+        points.append(trail[-1])
+        return points
 
     def draw_ui(self, screen, player_score, ai_score):
         panel_width = 500
@@ -208,37 +260,37 @@ class HockeyRenderer:
         pygame.draw.rect(panel_surf, (255, 215, 0), (0, 0, panel_width, panel_height), 3, border_radius=15)
         screen.blit(panel_surf, (panel_x, panel_y))
 
-        score_text = self.font_big.render(f"{player_score}  -  {ai_score}", True, (255, 215, 0))
-        screen.blit(score_text, (settings.WIDTH // 2 - score_text.get_width() // 2, panel_y + 15))
+        score = f"{player_score}  -  {ai_score}"
+        score_glyphs = GlyphAtlas.get(self.font_big, (255, 215, 0))
+        score_glyphs.blit(screen, score, (settings.WIDTH // 2 - score_glyphs.width(score) // 2, panel_y + 15))
 
-        player_label = self.font_tiny.render("JOUEUR", True, (100, 200, 255))
-        ai_label = self.font_tiny.render("IA", True, (255, 100, 100))
+        player_label = TextCache.render(self.font_tiny, "JOUEUR", (100, 200, 255))
+        ai_label = TextCache.render(self.font_tiny, "IA", (255, 100, 100))
         screen.blit(player_label, (panel_x + 50, panel_y + 65))
         screen.blit(ai_label, (panel_x + panel_width - 80, panel_y + 65))
 
-        hint_bg = pygame.Surface((settings.WIDTH, 50), pygame.SRCALPHA)
-        hint_bg.fill((0, 0, 0, 160))
-        screen.blit(hint_bg, (0, settings.HEIGHT - 50))
+        Overlays.darken(screen, 160, (0, settings.HEIGHT - 50, settings.WIDTH, 50))
 
-        hint = self.font_tiny.render("ZQSD/FLÈCHES: Bouger  |  ESPACE: Tirer  |  M: Menu", True, (220, 230, 240))
+        hint = TextCache.render(self.font_tiny, "ZQSD/FLÈCHES: Bouger  |  ESPACE: Tirer  |  M: Menu", (220, 230, 240))
         screen.blit(hint, (settings.WIDTH // 2 - hint.get_width() // 2, settings.HEIGHT - 35))
 
     def draw_goal_text(self, screen, text):
-        msg = self.font_big.render(text, True, (255, 215, 0))
+        msg = TextCache.render(self.font_big, text, (255, 215, 0))
         screen.blit(msg, (settings.WIDTH // 2 - msg.get_width() // 2, settings.HEIGHT // 2 - 40))
 
     def draw_over(self, screen, result_text, player_score, ai_score):
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        Overlays.darken(screen, 180)
 
-        title = self.font_big.render(result_text, True, (255, 215, 0))
+        title = TextCache.render(self.font_big, result_text, (255, 215, 0))
         screen.blit(title, (settings.WIDTH // 2 - title.get_width() // 2, settings.HEIGHT // 2 - 120))
 
-        score = self.font_medium.render(f"JOUEUR {player_score}  -  {ai_score} IA", True, (240, 240, 245))
+        score = TextCache.render(self.font_medium, f"JOUEUR {player_score}  -  {ai_score} IA", (240, 240, 245))
         screen.blit(score, (settings.WIDTH // 2 - score.get_width() // 2, settings.HEIGHT // 2 - 30))
 
-        replay = self.font_small.render("ENTER pour rejouer", True, (200, 200, 210))
-        menu = self.font_small.render("M pour menu", True, (200, 200, 210))
+        replay = TextCache.render(self.font_small, "ENTER pour rejouer", (200, 200, 210))
+        menu = TextCache.render(self.font_small, "M pour menu", (200, 200, 210))
         screen.blit(replay, (settings.WIDTH // 2 - replay.get_width() // 2, settings.HEIGHT // 2 + 60))
         screen.blit(menu, (settings.WIDTH // 2 - menu.get_width() // 2, settings.HEIGHT // 2 + 110))
+
+
+Profiler.register(HockeyRenderer)
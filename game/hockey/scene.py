@@ -4,36 +4,42 @@ import random
 import pygame
 
 from game.core import settings
+from game.core.replay import Replay, new_seed
 from game.scenes.base import Scene
 from game.models.entities import HockeyPlayer, Puck
 from game.hockey.renderer import HockeyRenderer
 from game.hockey.sound import HockeySound
+from game.views.overlays import Overlays
+from game.views.text import TextCache
 
 
 class HockeyScene(Scene):
     """Mode Hockey 1v1 contre l'IA."""
 
-    def __init__(self, game):
-        super().__init__(game)
-        pygame.mixer.music.stop()  # Couper la musique du menu
+    successors = ("game.hockey.scene:HockeyOverScene",)
 
+    def __init__(self, game, seed=None):
+        super().__init__(game)
         self.renderer = HockeyRenderer()
         self.sfx = HockeySound()
 
         # Patinoire
-        margin = settings.HOCKEY_RINK_MARGIN
-        top_margin = max(margin, min(self.renderer.banner_height + 10, 120))
-        self.rink_rect = pygame.Rect(
-            margin, top_margin,
-            settings.WIDTH - 2 * margin,
-            settings.HEIGHT - top_margin - margin
-        )
+        self.rink_rect = self.rink_for(self.renderer)
 
         # Positions de départ
         cx, cy = self.rink_rect.center
         self.player_start = (self.rink_rect.left + 120, cy)
         self.ai_start = (self.rink_rect.right - 120, cy)
 
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        # Aléas propres au match : rejouable avec la même graine
+        self.seed = new_seed() if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self._run_started = False
+
+        cx, cy = self.rink_rect.center
         self.player = HockeyPlayer(*self.player_start)
         self.ai = HockeyPlayer(*self.ai_start)
         self.puck = Puck(cx, cy)
@@ -44,6 +50,7 @@ class HockeyScene(Scene):
         self.goal_timer = 0
         self.goal_text = None
         self.paused = False
+        self._pause_drawn = False
         self.puck_trail = []
 
         # Cooldowns
@@ -54,21 +61,78 @@ class HockeyScene(Scene):
         self.serve_vx = 0
         self.serve_vy = 0
 
-        self._serve_puck()
+        self._serve_puck(whistle=False)  # Sifflé par enter() : l'instance peut être préparée à l'avance
+
+    @staticmethod
+    def rink_for(renderer):
+        """Rectangle de la patinoire, sous le bandeau du renderer."""
+        margin = settings.HOCKEY_RINK_MARGIN
+        top_margin = max(margin, min(renderer.banner_height + 10, 120))
+        return pygame.Rect(
+            margin, top_margin,
+            settings.WIDTH - 2 * margin,
+            settings.HEIGHT - top_margin - margin
+        )
+
+    def enter(self):
+        pygame.mixer.music.stop()  # Couper la musique du menu
+        self.sfx.start()
+        self.sfx.play_whistle()
+
+    @classmethod
+    def prewarm(cls, game, surface):
+        scene = cls(game)
+        yield
+        # Le stade, le plus long à composer, puis le reste de la première frame
+        scene.renderer.draw_background(surface, scene.rink_rect)
+        yield
+        scene.render(surface)
+        return scene
+
+    def can_prewarm(self):
+        # Pendant le match, seulement en pause ou après un but
+        return self.paused or self.goal_timer > 0
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.paused = not self.paused
             elif event.key == pygame.K_m:
+                Replay.end_run()
                 self.sfx.stop()
                 from game.scenes.menu import MenuScene
-                self.game.change_scene(MenuScene(self.game))
+                self.game.change_scene(MenuScene.create(self.game))
+
+    def replay_state(self):
+        """Etat du match contrôlé par Replay."""
+        return (
+            self.player_score, self.ai_score, self.goal_timer, self.serve_timer,
+            self.player.x, self.player.y, self.ai.x, self.ai.y,
+            self.puck.x, self.puck.y, self.puck.vx, self.puck.vy,
+            self.shoot_cooldown, self.ai_shoot_cooldown, self.ai_react_timer,
+        )
+
+    def _read_keys(self):
+        """(gauche, droite, haut, bas, tir) : flèches / ZQSD et espace."""
+        keys = self.game.key_state()
+        return (
+            keys[pygame.K_LEFT] or keys[pygame.K_q],
+            keys[pygame.K_RIGHT] or keys[pygame.K_d],
+            keys[pygame.K_UP] or keys[pygame.K_z],
+            keys[pygame.K_DOWN] or keys[pygame.K_s],
+            keys[pygame.K_SPACE],
+        )
 
     def update(self, dt):
         if self.paused:
             return
 
+        if not self._run_started:
+            self._run_started = True
+            Replay.start_run("hockey", self.seed, self.replay_state)
+        # Lues à chaque tick, même après un but ou avant le service : une entrée par tick enregistré
+        keys = Replay.inputs(self._read_keys())
+
         # Pause après un but
         if self.goal_timer > 0:
             self.goal_timer -= dt
@@ -89,11 +153,13 @@ class HockeyScene(Scene):
 
         # Fin du match ?
         if self.player_score >= settings.HOCKEY_MAX_SCORE or self.ai_score >= settings.HOCKEY_MAX_SCORE:
+            Replay.end_run()
             self.sfx.stop()
-            self.game.change_scene(HockeyOverScene(self.game, self.player_score, self.ai_score))
+            self.game.change_scene(HockeyOverScene.create(self.game, self.player_score, self.ai_score))
             return
 
         dt_sec = min(dt / 1000.0, 0.05)
+        self._save_positions()
 
         # Mise à jour des cooldowns
         if self.shoot_cooldown > 0:
@@ -103,28 +169,31 @@ class HockeyScene(Scene):
         if self.ai_react_timer > 0:
             self.ai_react_timer -= dt
 
-        shoot_pressed = self._update_player(dt_sec)
+        shoot_pressed = self._update_player(dt_sec, keys)
         ai_should_shoot = self._update_ai(dt_sec)
 
         self.puck.update(dt_sec)
-        self._update_trail()
 
         self._handle_walls()
         self._handle_collision(self.player, shoot_pressed, is_ai=False)
         self._handle_collision(self.ai, ai_should_shoot, is_ai=True)
+        # Position de fin de tick : celle entre lesquelles le rendu interpole
+        self._update_trail()
 
         self._check_goals()
 
-    def _serve_puck(self):
+    def _serve_puck(self, whistle=True):
         cx, cy = self.rink_rect.center
         self.puck.x = cx
         self.puck.y = cy
-        self.serve_vx = random.choice([-580, 580])
-        self.serve_vy = random.uniform(-120, 120)
+        self.serve_vx = self.rng.choice([-580, 580])
+        self.serve_vy = self.rng.uniform(-120, 120)
         self.puck.vx = 0
         self.puck.vy = 0
         self.puck_trail = []
-        self.sfx.play_whistle()
+        self.puck.save_previous()
+        if whistle:
+            self.sfx.play_whistle()
         self.serve_timer = settings.HOCKEY_SERVE_DELAY_MS
 
     def _reset_positions(self):
@@ -134,18 +203,25 @@ class HockeyScene(Scene):
         self.puck.vx = 0
         self.puck.vy = 0
         self.puck_trail = []
+        self._save_positions()
+
+    def _save_positions(self):
+        """Début de tick : mémorise les positions pour l'interpolation du rendu."""
+        self.player.save_previous()
+        self.ai.save_previous()
+        self.puck.save_previous()
 
-    def _update_player(self, dt_sec):
-        keys = pygame.key.get_pressed()
+    def _update_player(self, dt_sec, keys):
+        left, right, up, down, shoot = keys
         dx, dy = 0, 0
 
-        if keys[pygame.K_LEFT] or keys[pygame.K_q]:
+        if left:
             dx -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if right:
             dx += 1
-        if keys[pygame.K_UP] or keys[pygame.K_z]:
+        if up:
             dy -= 1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if down:
             dy += 1
 
         # Normaliser la direction
@@ -166,7 +242,7 @@ class HockeyScene(Scene):
         self.player.x = new_x
         self.player.y = new_y
 
-        return keys[pygame.K_SPACE]
+        return shoot
 
     def _update_ai(self, dt_sec):
         center_x = self.rink_rect.centerx
@@ -281,7 +357,7 @@ class HockeyScene(Scene):
                 if is_ai and self.ai_shoot_cooldown <= 0:
                     # IA tire vers le but du joueur
                     target_x = self.rink_rect.left + 10
-                    target_y = self.rink_rect.centery + random.uniform(-60, 60)
+                    target_y = self.rink_rect.centery + self.rng.uniform(-60, 60)
                     shoot_power = settings.HOCKEY_AI_SHOOT_POWER
                     self.ai_shoot_cooldown = settings.HOCKEY_AI_SHOOT_COOLDOWN_MS
                     self.ai_react_timer = 150
@@ -346,46 +422,75 @@ class HockeyScene(Scene):
                 self.puck_trail.pop()
 
     def render(self, screen):
+        # En pause l'image est figée : on la dessine une fois
+        if self.paused and self._pause_drawn and not self.full_redraw:
+            return []
+
+        alpha = self.game.alpha
         self.renderer.draw_background(screen, self.rink_rect)
-        self.renderer.draw_puck(screen, self.puck, self.puck_trail)
+        self.renderer.draw_puck(screen, self.puck, self.puck_trail, alpha)
         self.renderer.draw_player(screen, self.player, settings.HOCKEY_PLAYER_COLOR,
-                                  sprite=self.renderer.player_sprite, active=True)
+                                  sprite=self.renderer.player_sprite, active=True, alpha=alpha)
         self.renderer.draw_player(screen, self.ai, settings.HOCKEY_AI_COLOR,
-                                  sprite=self.renderer.ai_sprite, active=False)
+                                  sprite=self.renderer.ai_sprite, active=False, alpha=alpha)
         self.renderer.draw_ui(screen, self.player_score, self.ai_score)
 
         if self.goal_text:
             self.renderer.draw_goal_text(screen, self.goal_text)
 
         if self.paused:
-            overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 140))
-            screen.blit(overlay, (0, 0))
-            pause_text = self.renderer.font_big.render("Pause", True, (255, 255, 255))
+            Overlays.darken(screen, 140)
+            pause_text = TextCache.render(self.renderer.font_big, "Pause", (255, 255, 255))
             screen.blit(pause_text, (settings.WIDTH // 2 - pause_text.get_width() // 2, settings.HEIGHT // 2))
 
+        self._pause_drawn = self.paused
+        self.full_redraw = False
+        return None
+
 
 class HockeyOverScene(Scene):
     """Ecran de fin de match Hockey."""
 
+    successors = ("game.hockey.scene:HockeyScene",)
+
     def __init__(self, game, player_score, ai_score):
         super().__init__(game)
+        self.renderer = HockeyRenderer()
+        self.reset(player_score, ai_score)
+
+    def reset(self, player_score, ai_score):
         self.player_score = player_score
         self.ai_score = ai_score
-        self.renderer = HockeyRenderer()
+        self._backdrop = None
+
+    @classmethod
+    def prewarm(cls, game, surface):
+        scene = cls(game, 0, 0)
+        yield
+        scene.render(surface)
+        return scene
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE):
-                self.game.change_scene(HockeyScene(self.game))
+                self.game.change_scene(HockeyScene.create(self.game))
             elif event.key == pygame.K_m:
                 from game.scenes.menu import MenuScene
-                self.game.change_scene(MenuScene(self.game))
+                self.game.change_scene(MenuScene.create(self.game))
 
     def update(self, dt):
         pass
 
     def render(self, screen):
+        if not self.full_redraw:
+            return []
+        # Dernière image du match, gardée pour pouvoir redessiner l'écran (F11)
+        if self._backdrop is None:
+            self._backdrop = screen.copy()
+        else:
+            screen.blit(self._backdrop, (0, 0))
+        self.full_redraw = False
+
         if self.player_score > self.ai_score:
             result = "VICTOIRE !"
         elif self.player_score < self.ai_score:
@@ -393,3 +498,4 @@ class HockeyOverScene(Scene):
         else:
             result = "EGALITE"
         self.renderer.draw_over(screen, result, self.player_score, self.ai_score)
+        return None
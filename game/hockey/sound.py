@@ -3,6 +3,10 @@ from pathlib import Path
 import pygame
 
 from game.core import settings
+from game.core.assets import AssetStore
+from game.core.loader import AssetLoader
+
+SOUNDS_DIR = Path(settings.ASSETS_DIR) / "sounds"
 
 
 class HockeySound:
@@ -22,28 +26,27 @@ class HockeySound:
             self.enabled = False
             return
 
-        sounds_dir = Path(settings.ASSETS_DIR) / "sounds"
-
-        self.hit = self._load_sound(sounds_dir / "hit.mp3")
-        self.goal = self._load_sound(sounds_dir / "goal.mp3")
-        self.whistle = self._load_sound(sounds_dir / "whistle.mp3")
-        self.crowd = self._load_sound(sounds_dir / "crowd.mp3")
+        self.hit = self._load_sound(SOUNDS_DIR / "hit.mp3")
+        self.goal = self._load_sound(SOUNDS_DIR / "goal.mp3")
+        self.whistle = self._load_sound(SOUNDS_DIR / "whistle.mp3")
+        self.crowd = self._load_sound(SOUNDS_DIR / "crowd.mp3")
 
-        if self.crowd:
+    def start(self):
+        """Lance la foule en boucle (au début du match)."""
+        if self.enabled and self.crowd:
             try:
                 self.crowd.set_volume(0.25)
                 self.crowd.play(loops=-1)
             except Exception:
                 pass
 
+    @staticmethod
+    def preload():
+        names = ("hit.mp3", "goal.mp3", "whistle.mp3", "crowd.mp3")
+        AssetLoader.queue_sounds("hockey", [SOUNDS_DIR / name for name in names])
+
     def _load_sound(self, path: Path):
-        if path.exists():
-            try:
-                snd = pygame.mixer.Sound(str(path))
-                return snd
-            except Exception:
-                return None
-        return None
+        return AssetStore.sound(path)
 
     def play_hit(self):
         if self.enabled and self.hit:
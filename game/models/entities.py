@@ -2,12 +2,75 @@ from dataclasses import dataclass
 from enum import Enum
 
 from game.core import settings
+from game.core.pool import Pool
+
+
+def _lane_centers():
+    lane_width = (settings.WIDTH - 2 * settings.LANE_PADDING) // settings.LANES
+    return tuple(settings.LANE_PADDING + lane_width * i + lane_width // 2 for i in range(settings.LANES))
+
+
+LANE_X = _lane_centers()  # Centre X de chaque voie, calculé une fois
 
 
 def lane_x(lane_index):
     """Retourne la position X du centre d'une voie."""
-    lane_width = (settings.WIDTH - 2 * settings.LANE_PADDING) // settings.LANES
-    return settings.LANE_PADDING + lane_width * lane_index + lane_width // 2
+    return LANE_X[lane_index]
+
+
+class Interpolated:
+    """Garde la position de la tick précédente pour lisser le rendu.
+
+    La simulation avance par ticks fixes ; le rendu affiche l'état entre la
+    tick précédente et la courante (alpha entre 0.0 et 1.0).
+    """
+
+    __slots__ = ()
+    prev_x = None
+    prev_y = None
+
+    def save_previous(self):
+        self.prev_x = getattr(self, "x", None)
+        self.prev_y = self.y
+
+    def lerp(self, alpha):
+        """Position (x, y) interpolée ; x vaut None pour les objets sur une voie."""
+        x = getattr(self, "x", None)
+        y = self.y
+        if self.prev_x is not None:
+            x = self.prev_x + (x - self.prev_x) * alpha
+        if self.prev_y is not None:
+            y = self.prev_y + (y - self.prev_y) * alpha
+        return x, y
+
+    def rect_at(self, alpha):
+        """Comme rect, mais à la position interpolée."""
+        x, y, w, h = self.rect
+        ix, iy = self.lerp(alpha)
+        if self.prev_x is not None:
+            x += int(round(ix - self.x))
+        if self.prev_y is not None:
+            y += int(round(iy - self.y))
+        return (x, y, w, h)
+
+
+class ObstacleKind(str, Enum):
+    TREE = "tree"
+    ICICLE = "icicle"
+
+
+class MedalKind(str, Enum):
+    BRONZE = "bronze"
+    SILVER = "silver"
+    GOLD = "gold"
+
+
+# Taille par défaut de chaque type d'objet sur les voies
+KIND_SIZES = {
+    ObstacleKind.TREE: settings.OBSTACLE_SIZE,
+    ObstacleKind.ICICLE: settings.ICICLE_SIZE,
+    **{kind: settings.MEDAL_SIZE for kind in MedalKind},
+}
 
 
 class TargetState(Enum):
@@ -17,7 +80,7 @@ class TargetState(Enum):
 
 
 @dataclass
-class Player:
+class Player(Interpolated):
     lane: int = 1
     target_lane: int = 1
     y: float = settings.PLAYER_Y
@@ -32,7 +95,7 @@ class Player:
     invincible_timer: float = 0.0
 
     def __post_init__(self):
-        self.x = float(lane_x(self.lane))
+        self.x = float(LANE_X[self.lane])
 
     def move_left(self):
         self.target_lane = max(0, self.target_lane - 1)
@@ -47,6 +110,7 @@ class Player:
 
     def update(self, dt):
         dt_sec = max(0.0, dt / 1000.0)
+        self.save_previous()
 
         # Timer invincibilité
         if self.invincible_timer > 0:
@@ -54,15 +118,15 @@ class Player:
 
         # Saut / gravité
         if not self.on_ground:
-            self.velocity_y += settings.GRAVITY
-            self.y += self.velocity_y
+            self.velocity_y += settings.GRAVITY * dt_sec
+            self.y += self.velocity_y * dt_sec
             if self.y >= settings.PLAYER_Y:
                 self.y = settings.PLAYER_Y
                 self.velocity_y = 0.0
                 self.on_ground = True
 
         # Déplacement horizontal fluide vers la voie cible
-        target_x = float(lane_x(self.target_lane))
+        target_x = float(LANE_X[self.target_lane])
         delta = target_x - self.x
         max_step = settings.HORIZONTAL_SPEED * dt_sec
         step = max(-max_step, min(max_step, delta))
@@ -94,50 +158,105 @@ class Player:
         return (x, y, self.width, self.height)
 
 
-@dataclass
-class Obstacle:
-    lane: int
-    y: float
-    obstacle_type: str = "tree"  # "tree" ou "icicle"
-    width: int = None
-    height: int = None
-    passed: bool = False
+class LaneEntity(Interpolated):
+    """Objet qui descend sur une voie (obstacle, médaille).
 
-    def __post_init__(self):
-        # Taille selon le type d'obstacle
-        if self.obstacle_type == "icicle":
-            self.width = self.width or settings.ICICLE_SIZE[0]
-            self.height = self.height or settings.ICICLE_SIZE[1]
-        else:
-            self.width = self.width or settings.OBSTACLE_SIZE[0]
-            self.height = self.height or settings.OBSTACLE_SIZE[1]
+    Compact : __slots__, type en enum (instances partagées). La voie et la
+    taille sont fixes ; seul le haut entier du rect est gardé en cache
+    jusqu'au prochain changement de y.
+    """
 
-    def update(self, speed):
-        self.y += speed
+    __slots__ = ("kind", "lane", "_y", "width", "height", "prev_y", "_top")
+
+    def __init__(self, kind, lane, y, width=None, height=None):
+        self.kind = kind
+        self.lane = lane
+        self._y = y
+        self.width = width or KIND_SIZES[kind][0]
+        self.height = height or KIND_SIZES[kind][1]
+        self.prev_y = None
+        self._top = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(kind={self.kind.value!r}, lane={self.lane}, y={self._y})"
 
     @property
-    def rect(self):
-        x = lane_x(self.lane) - self.width // 2
-        y = int(self.y) - self.height
-        return (x, y, self.width, self.height)
+    def y(self):
+        return self._y
 
+    @y.setter
+    def y(self, value):
+        self._y = value
+        self._top = None
 
-@dataclass
-class Medal:
-    kind: str  # bronze, silver, gold
-    lane: int
-    y: float
-    width: int = settings.MEDAL_SIZE[0]
-    height: int = settings.MEDAL_SIZE[1]
+    def save_previous(self):
+        self.prev_y = self._y
 
-    def update(self, speed):
-        self.y += speed
+    def update(self, speed, dt):
+        """speed en px/s, dt en ms."""
+        self.prev_y = self._y
+        self._y += speed * dt / 1000.0
+        self._top = None
 
     @property
     def rect(self):
-        x = lane_x(self.lane) - self.width // 2
-        y = int(self.y) - self.height
-        return (x, y, self.width, self.height)
+        top = self._top
+        if top is None:
+            top = self._top = int(self._y) - self.height
+        width = self.width
+        return (LANE_X[self.lane] - width // 2, top, width, self.height)
+
+    def rect_at(self, alpha):
+        x, y, w, h = self.rect
+        if self.prev_y is not None:
+            y += int(round(self.prev_y + (self._y - self.prev_y) * alpha - self._y))
+        return (x, y, w, h)
+
+
+class Obstacle(LaneEntity):
+    __slots__ = ("passed",)
+
+    def __init__(self, lane, y, obstacle_type="tree", width=None, height=None, passed=False):
+        super().__init__(ObstacleKind(obstacle_type), lane, y, width, height)
+        self.passed = passed
+
+    @property
+    def obstacle_type(self):
+        return self.kind
+
+
+class Medal(LaneEntity):
+    __slots__ = ()
+
+    def __init__(self, kind, lane, y, width=None, height=None):
+        super().__init__(MedalKind(kind), lane, y, width, height)
+
+
+class FloatingText:
+    """Texte qui monte et s'efface ("+5" d'une médaille, d'une cible)."""
+
+    __slots__ = ("text", "x", "y", "color", "alpha", "scale")
+
+    def __init__(self, text, x, y, color, alpha=255, scale=1.0):
+        self.text = text
+        self.x = x
+        self.y = y
+        self.color = color
+        self.alpha = alpha
+        self.scale = scale
+
+    def update(self, dt):
+        self.y -= dt * 0.05
+        self.alpha -= dt * 0.15
+
+    def faded(self):
+        return self.alpha <= 0
+
+
+# Objets recyclés entre spawns et entre parties (voir Pool)
+OBSTACLE_POOL = Pool(Obstacle)
+MEDAL_POOL = Pool(Medal)
+FLOATING_TEXT_POOL = Pool(FloatingText)
 
 
 @dataclass
@@ -159,7 +278,7 @@ class Target:
 
 
 @dataclass
-class Sight:
+class Sight(Interpolated):
     """Viseur qui oscille pour la phase de tir."""
     x: float = settings.SIGHT_MIN_X
     y: float = settings.SIGHT_Y
@@ -167,8 +286,9 @@ class Sight:
     height: int = settings.SIGHT_SIZE[1]
     direction: int = 1  # 1 = droite, -1 = gauche
 
-    def update(self):
-        self.x += settings.SIGHT_SPEED * self.direction
+    def update(self, dt):
+        self.save_previous()
+        self.x += settings.SIGHT_SPEED * dt / 1000.0 * self.direction
 
         # Rebondir aux bords
         if self.x >= settings.SIGHT_MAX_X:
@@ -189,7 +309,7 @@ class Sight:
 # Hockey
 
 @dataclass
-class HockeyPlayer:
+class HockeyPlayer(Interpolated):
     x: float
     y: float
     width: int = settings.HOCKEY_PLAYER_SIZE[0]
@@ -210,7 +330,7 @@ class HockeyPlayer:
 
 
 @dataclass
-class Puck:
+class Puck(Interpolated):
     x: float
     y: float
     vx: float = 0.0
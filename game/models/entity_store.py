@@ -0,0 +1,321 @@
+import logging
+from bisect import bisect_left, bisect_right, insort
+
+from game.core import settings
+from game.models.entities import LANE_X
+
+try:
+    import numpy as np
+except ImportError:  # numpy est optionnel : LaneIndex sinon
+    np = None
+
+logger = logging.getLogger(__name__)
+_warned = False
+
+
+def _y_of(entity):
+    return entity.y
+
+
+class LaneIndex:
+    """Stockage par défaut : les Obstacle / Medal rangés par voie, triés par y.
+
+    Tout descend à la même vitesse, l'ordre d'une voie ne change donc
+    jamais : les spawns arrivent en haut (y petit), le nettoyage retire par
+    le bas. Les requêtes (écart au spawn, collisions, ramassage) ne
+    regardent que les voies concernées et, par bisection, la tranche de y
+    utile : leur coût ne dépend pas du nombre d'objets à l'écran.
+
+    EntityArrays expose les mêmes opérations ; World ne passe que par elles.
+    Les objets qui sortent du jeu retournent dans pool.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.lanes = [[] for _ in range(settings.LANES)]
+        self._count = 0
+        self._max_width = 0
+        self._max_height = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for bucket in self.lanes:
+            yield from bucket
+
+    def append(self, entity):
+        insort(self.lanes[entity.lane], entity, key=_y_of)
+        self._count += 1
+        self._max_width = max(self._max_width, entity.width)
+        self._max_height = max(self._max_height, entity.height)
+
+    def spawn(self, *args, **kwargs):
+        self.append(self.pool.acquire(*args, **kwargs))
+
+    def replace(self, entities):
+        self.clear()
+        for entity in entities:
+            self.append(entity)
+
+    def clear(self):
+        for bucket in self.lanes:
+            for entity in bucket:
+                self.pool.release(entity)
+            bucket.clear()
+        self._count = 0
+
+    def recycle(self, entities):
+        """Rend au pool des objets retirés par take_hits, une fois utilisés."""
+        for entity in entities:
+            self.pool.release(entity)
+
+    def advance(self, speed, dt):
+        for bucket in self.lanes:
+            for entity in bucket:
+                entity.update(speed, dt)
+
+    def cull(self, limit):
+        """Retire les objets dont le haut dépasse limit (bas de l'écran)."""
+        for bucket in self.lanes:
+            # Seul le bas de la voie peut sortir ; les hauteurs diffèrent, d'où le test par objet
+            i = len(bucket) - 1
+            while i >= 0 and bucket[i].y >= limit:
+                entity = bucket[i]
+                if entity.y - entity.height >= limit:
+                    del bucket[i]
+                    self._count -= 1
+                    self.pool.release(entity)
+                i -= 1
+
+    def _window(self, bucket, low, high):
+        """Indices des objets de bucket avec low < y < high."""
+        return bisect_right(bucket, low, key=_y_of), bisect_left(bucket, high, key=_y_of)
+
+    def near(self, lane, y, gap):
+        """Un objet à moins de gap px, sur la même voie ou une voisine ?"""
+        for bucket in self.lanes[max(0, lane - 1):lane + 2]:
+            start, stop = self._window(bucket, y - gap, y + gap)
+            if start < stop:
+                return True
+        return False
+
+    def mark_passed(self, line_y):
+        """Marque les objets qui viennent de dépasser line_y ; retourne leur nombre."""
+        count = 0
+        for bucket in self.lanes:
+            for i in range(len(bucket) - 1, -1, -1):
+                entity = bucket[i]
+                if entity.y <= line_y:
+                    break
+                if not entity.passed:
+                    entity.passed = True
+                    count += 1
+        return count
+
+    def _touching(self, rect):
+        """(voie, indice) des objets qui touchent rect, du bas vers le haut."""
+        px, py, pw, ph = rect
+        center = px + pw / 2
+        reach = (pw + self._max_width) / 2 + 1
+        found = []
+        for lane, bucket in enumerate(self.lanes):
+            if not bucket or abs(LANE_X[lane] - center) >= reach:
+                continue
+            # rect d'un objet : de int(y) - height à int(y)
+            start, stop = self._window(bucket, py - 1, py + ph + self._max_height + 1)
+            for i in range(stop - 1, start - 1, -1):
+                ox, oy, ow, oh = bucket[i].rect
+                # Test AABB classique
+                if px < ox + ow and px + pw > ox and py < oy + oh and py + ph > oy:
+                    found.append((lane, i))
+        return found
+
+    def hits(self, rect):
+        return bool(self._touching(rect))
+
+    def take_hits(self, rect):
+        """Retire et retourne les objets qui touchent rect (à rendre avec recycle)."""
+        taken = []
+        for lane, i in self._touching(rect):  # Indices décroissants par voie : del sans décalage
+            taken.append(self.lanes[lane].pop(i))
+        self._count -= len(taken)
+        return taken
+
+
+class EntityView:
+    """Lecture seule d'une ligne d'EntityArrays, pour le rendu et le bot.
+
+    Les valeurs sont copiées à l'itération : une vue ne suit pas les ticks
+    suivantes.
+    """
+
+    __slots__ = ("lane", "y", "prev_y", "width", "height", "passed", "kind", "_x")
+
+    def __init__(self, lane, y, prev_y, width, height, passed, kind, x):
+        self.lane = lane
+        self.y = y
+        self.prev_y = prev_y
+        self.width = width
+        self.height = height
+        self.passed = passed
+        self.kind = kind
+        self._x = x
+
+    @property
+    def obstacle_type(self):
+        return self.kind
+
+    @property
+    def rect(self):
+        return (self._x, int(self.y) - self.height, self.width, self.height)
+
+    def rect_at(self, alpha):
+        x, y, w, h = self.rect
+        if self.prev_y == self.prev_y:  # NaN : pas encore de tick précédente
+            y += int(round(self.prev_y + (self.y - self.prev_y) * alpha - self.y))
+        return (x, y, w, h)
+
+
+class EntityArrays:
+    """Stockage en colonnes NumPy (ENTITY_BACKEND = "numpy").
+
+    Une colonne par champ (voie, y, y précédent, type, taille, dépassé) ;
+    défilement, nettoyage, score et tests AABB se font en une opération sur
+    toutes les lignes. Le défilement y gagne quand les objets se comptent
+    par centaines ; les requêtes locales restent plus rapides avec LaneIndex.
+    """
+
+    def __init__(self, pool, kind_attr, kinds, capacity=32):
+        self.pool = pool
+        self._kind_attr = kind_attr
+        self.kinds = list(kinds)
+        self._lane_x = np.array(LANE_X, dtype=np.int64)
+        self.count = 0
+        self.lane = np.zeros(capacity, dtype=np.int64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_y = np.full(capacity, np.nan)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.width = np.zeros(capacity, dtype=np.int64)
+        self.height = np.zeros(capacity, dtype=np.int64)
+        self.passed = np.zeros(capacity, dtype=bool)
+
+    _COLUMNS = ("lane", "y", "prev_y", "kind", "width", "height", "passed")
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        n = self.count
+        kinds = self.kinds
+        x = self._lane_x[self.lane[:n]] - self.width[:n] // 2
+        rows = zip(self.lane[:n].tolist(), self.y[:n].tolist(), self.prev_y[:n].tolist(),
+                   self.width[:n].tolist(), self.height[:n].tolist(), self.passed[:n].tolist(),
+                   self.kind[:n].tolist(), x.tolist())
+        return (EntityView(lane, y, prev_y, w, h, passed, kinds[kind], x)
+                for lane, y, prev_y, w, h, passed, kind, x in rows)
+
+    def append(self, entity):
+        if self.count == len(self.y):
+            self._grow()
+        kind = getattr(entity, self._kind_attr)
+        if kind not in self.kinds:
+            self.kinds.append(kind)
+        i = self.count
+        self.lane[i] = entity.lane
+        self.y[i] = entity.y
+        self.prev_y[i] = np.nan if entity.prev_y is None else entity.prev_y
+        self.kind[i] = self.kinds.index(kind)
+        self.width[i] = entity.width
+        self.height[i] = entity.height
+        self.passed[i] = entity.passed if hasattr(entity, "passed") else False
+        self.count += 1
+
+    def _grow(self):
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, np.resize(column, len(column) * 2))
+
+    def spawn(self, *args, **kwargs):
+        # L'objet ne sert qu'à remplir la ligne : il retourne aussitôt au pool
+        entity = self.pool.acquire(*args, **kwargs)
+        self.append(entity)
+        self.pool.release(entity)
+
+    def replace(self, entities):
+        self.clear()
+        for entity in entities:
+            self.append(entity)
+
+    def recycle(self, entities):
+        for entity in entities:
+            self.pool.release(entity)
+
+    def clear(self):
+        self.count = 0
+
+    def advance(self, speed, dt):
+        n = self.count
+        self.prev_y[:n] = self.y[:n]
+        self.y[:n] += speed * dt / 1000.0
+
+    def cull(self, limit):
+        n = self.count
+        self._keep(self.y[:n] - self.height[:n] < limit)
+
+    def near(self, lane, y, gap):
+        n = self.count
+        close = (np.abs(self.y[:n] - y) < gap) & (np.abs(self.lane[:n] - lane) <= 1)
+        return bool(close.any())
+
+    def mark_passed(self, line_y):
+        n = self.count
+        fresh = ~self.passed[:n] & (self.y[:n] > line_y)
+        self.passed[:n] |= fresh
+        return int(np.count_nonzero(fresh))
+
+    def hits(self, rect):
+        return bool(self._overlap(rect).any())
+
+    def take_hits(self, rect):
+        touching = self._overlap(rect)
+        if not touching.any():
+            return []
+        taken = [self._entity(i) for i in np.flatnonzero(touching)]
+        self._keep(~touching)
+        return taken
+
+    def _overlap(self, rect):
+        px, py, pw, ph = rect
+        n = self.count
+        w, h = self.width[:n], self.height[:n]
+        ox = self._lane_x[self.lane[:n]] - w // 2
+        oy = self.y[:n].astype(np.int64) - h  # astype tronque vers 0, comme int()
+        return (px < ox + w) & (px + pw > ox) & (py < oy + h) & (py + ph > oy)
+
+    def _keep(self, mask):
+        if mask.all():
+            return
+        kept = int(np.count_nonzero(mask))
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            column[:kept] = column[:self.count][mask]
+        self.count = kept
+
+    def _entity(self, i):
+        """Ligne i sous forme d'Obstacle / Medal (objets ramassés)."""
+        return self.pool.acquire(**{self._kind_attr: self.kinds[self.kind[i]], "lane": int(self.lane[i]),
+                                    "y": float(self.y[i]), "width": int(self.width[i]),
+                                    "height": int(self.height[i])})
+
+
+def make_store(pool, kind_attr, kinds):
+    """Stockage selon settings.ENTITY_BACKEND ; listes si numpy manque."""
+    global _warned
+    if settings.ENTITY_BACKEND == "numpy":
+        if np is not None:
+            return EntityArrays(pool, kind_attr, kinds)
+        if not _warned:
+            _warned = True
+            logger.warning("ENTITY_BACKEND = numpy, mais numpy n'est pas installé : listes utilisées")
+    return LaneIndex(pool)
@@ -1,17 +1,24 @@
 import random
 
 from game.core import settings
-from game.models.entities import Medal, Obstacle
+from game.core.replay import new_seed
+from game.models.entities import MEDAL_POOL, OBSTACLE_POOL, MedalKind, ObstacleKind
+from game.models.entity_store import make_store
 
 
 class World:
-    def __init__(self):
-        self.obstacles = []
-        self.medals = []
+    def __init__(self, seed=None):
+        # Aléas propres à la partie : rejouable avec la même graine
+        self.seed = new_seed() if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self._obstacles = make_store(OBSTACLE_POOL, "obstacle_type", ObstacleKind)
+        self._medals = make_store(MEDAL_POOL, "kind", MedalKind)
         self.score = 0
         self.medal_score = 0
         self.distance = 0.0
         self.speed = settings.BASE_SCROLL_SPEED
+        self.scroll = 0.0          # Défilement total du fond (px)
+        self.prev_scroll = 0.0
 
         # Timers pour les spawns
         self.time_since_spawn = 0.0
@@ -24,7 +31,35 @@ class World:
         self.next_icicle = settings.ICICLE_SPAWN_INTERVAL
 
     def reset(self):
-        self.__init__()
+        self.__init__(self.seed)
+
+    # Obstacles et médailles : LaneIndex ou EntityArrays (settings.ENTITY_BACKEND).
+    # Itérables pour le rendu ; l'affectation recopie dans le stockage.
+
+    @property
+    def obstacles(self):
+        return self._obstacles
+
+    @obstacles.setter
+    def obstacles(self, entities):
+        self._obstacles.replace(entities)
+
+    @property
+    def medals(self):
+        return self._medals
+
+    @medals.setter
+    def medals(self, entities):
+        self._medals.replace(entities)
+
+    def scroll_by(self, dt_ms):
+        """Fait défiler le fond à la vitesse courante (px/s)."""
+        self.prev_scroll = self.scroll
+        self.scroll += self.speed * dt_ms / 1000.0
+
+    def scroll_at(self, alpha):
+        """Défilement interpolé entre les deux dernières ticks."""
+        return self.prev_scroll + (self.scroll - self.prev_scroll) * alpha
 
     def update(self, dt_ms):
         self.distance += dt_ms * 0.001
@@ -39,7 +74,7 @@ class World:
         if self.time_since_spawn >= self.next_spawn:
             self.spawn_obstacle("tree")
             self.time_since_spawn = 0.0
-            variation = random.randint(-settings.SPAWN_VARIATION, settings.SPAWN_VARIATION)
+            variation = self.rng.randint(-settings.SPAWN_VARIATION, settings.SPAWN_VARIATION)
             self.next_spawn = max(220, settings.SPAWN_INTERVAL + variation)
 
         # Spawn des glaçons (moins fréquent)
@@ -47,7 +82,7 @@ class World:
         if self.time_since_icicle >= self.next_icicle:
             self.spawn_obstacle("icicle")
             self.time_since_icicle = 0.0
-            variation = random.randint(-settings.ICICLE_SPAWN_VARIATION, settings.ICICLE_SPAWN_VARIATION)
+            variation = self.rng.randint(-settings.ICICLE_SPAWN_VARIATION, settings.ICICLE_SPAWN_VARIATION)
             self.next_icicle = max(1500, settings.ICICLE_SPAWN_INTERVAL + variation)
 
         # Spawn des médailles
@@ -55,55 +90,55 @@ class World:
         if self.time_since_medal >= self.next_medal:
             self.spawn_medal()
             self.time_since_medal = 0.0
-            variation = random.randint(-settings.MEDAL_SPAWN_VARIATION, settings.MEDAL_SPAWN_VARIATION)
+            variation = self.rng.randint(-settings.MEDAL_SPAWN_VARIATION, settings.MEDAL_SPAWN_VARIATION)
             self.next_medal = max(400, settings.MEDAL_SPAWN_INTERVAL + variation)
 
-        # Mise à jour des positions
-        for obstacle in self.obstacles:
-            obstacle.update(self.speed)
-        for medal in self.medals:
-            medal.update(self.speed)
+        self.advance(dt_ms)
+
+    def advance(self, dt_ms):
+        """Fait descendre obstacles et médailles, puis retire ceux sortis de l'écran."""
+        self._obstacles.advance(self.speed, dt_ms)
+        self._medals.advance(self.speed, dt_ms)
+        self._obstacles.cull(settings.HEIGHT + 40)
+        self._medals.cull(settings.HEIGHT + 40)
+
+    def score_passed(self, line_y):
+        """+1 par obstacle qui vient de passer sous line_y (évité)."""
+        self.score += self._obstacles.mark_passed(line_y)
+
+    def hits_obstacle(self, rect):
+        return self._obstacles.hits(rect)
+
+    def take_medals(self, rect):
+        """Retire et retourne les médailles touchées par rect (à rendre avec recycle_medals)."""
+        return self._medals.take_hits(rect)
 
-        # Nettoyer les objets hors écran
-        self.obstacles = [o for o in self.obstacles if o.y - o.height < settings.HEIGHT + 40]
-        self.medals = [m for m in self.medals if m.y - m.height < settings.HEIGHT + 40]
+    def recycle_medals(self, medals):
+        self._medals.recycle(medals)
 
     def spawn_obstacle(self, obstacle_type="tree"):
-        lane = random.randint(0, settings.LANES - 1)
-        y = -random.randint(40, 200)
+        lane = self.rng.randint(0, settings.LANES - 1)
+        y = -self.rng.randint(40, 200)
         if not self._is_obstacle_spawn_clear(lane, y):
             return
-        self.obstacles.append(Obstacle(lane=lane, y=y, obstacle_type=obstacle_type))
+        self._obstacles.spawn(lane=lane, y=y, obstacle_type=obstacle_type)
 
     def _is_obstacle_spawn_clear(self, lane, y):
         # Eviter les murs infranchissables
-        min_gap = settings.OBSTACLE_MIN_GAP
-        for obstacle in self.obstacles:
-            if abs(obstacle.y - y) < min_gap and abs(obstacle.lane - lane) <= 1:
-                return False
-        for medal in self.medals:
-            if abs(medal.y - y) < settings.MEDAL_MIN_GAP and abs(medal.lane - lane) <= 1:
-                return False
-        return True
+        return not (self._obstacles.near(lane, y, settings.OBSTACLE_MIN_GAP)
+                    or self._medals.near(lane, y, settings.MEDAL_MIN_GAP))
 
     def spawn_medal(self):
-        lane = random.randint(0, settings.LANES - 1)
-        y = -random.randint(60, 240)
+        lane = self.rng.randint(0, settings.LANES - 1)
+        y = -self.rng.randint(60, 240)
         if not self._is_medal_lane_clear(lane, y):
             return
         kinds = list(settings.MEDAL_WEIGHTS.keys())
         weights = list(settings.MEDAL_WEIGHTS.values())
-        kind = random.choices(kinds, weights=weights, k=1)[0]
-        self.medals.append(Medal(kind=kind, lane=lane, y=y))
+        kind = self.rng.choices(kinds, weights=weights, k=1)[0]
+        self._medals.spawn(kind=kind, lane=lane, y=y)
 
     def _is_medal_lane_clear(self, lane, y):
         min_gap = settings.MEDAL_MIN_GAP
-        # Permet ne pas faire apparaitre au dessus d'un obstacle
-        for obstacle in self.obstacles:
-            if abs(obstacle.y - y) < min_gap and abs(obstacle.lane - lane) <= 1:
-                return False
-        # Permet de ne pas faire apparaitre plusieurs médailles côte à côte
-        for medal in self.medals:
-            if abs(medal.y - y) < min_gap and abs(medal.lane - lane) <= 1:
-                return False
-        return True
+        # Ni au dessus d'un obstacle, ni plusieurs médailles côte à côte
+        return not (self._obstacles.near(lane, y, min_gap) or self._medals.near(lane, y, min_gap))
@@ -1,6 +1,8 @@
 import pygame
 
 from game.core import settings
+from game.core.assets import AssetStore
+from game.core.loader import AssetLoader
 
 
 class MusicManager:
@@ -40,20 +42,22 @@ class SoundManager:
     _coin_sound = None
     _initialized = False
 
+    @staticmethod
+    def preload():
+        AssetLoader.queue_sounds("audio", [settings.SOUND_COIN, settings.SOUND_SHOTGUN])
+
     @classmethod
     def init(cls):
         if cls._initialized:
             return
 
         if settings.SOUND_COIN.exists():
-            cls._coin_sound = pygame.mixer.Sound(str(settings.SOUND_COIN))
-            cls._coin_sound.set_volume(0.6)
+            cls._coin_sound = AssetStore.sound(settings.SOUND_COIN)
         else:
             # Fallback sur .wav si .mp3 pas trouvé
-            coin_wav = settings.ASSETS_DIR / "coin.wav"
-            if coin_wav.exists():
-                cls._coin_sound = pygame.mixer.Sound(str(coin_wav))
-                cls._coin_sound.set_volume(0.6)
+            cls._coin_sound = AssetStore.sound(settings.ASSETS_DIR / "coin.wav")
+        if cls._coin_sound:
+            cls._coin_sound.set_volume(0.6)
 
         cls._initialized = True
 
@@ -1,6 +1,66 @@
-﻿class Scene:
+import time
+
+from game.core.prewarm import Prewarmer
+
+
+class Scene:
+    # Scènes qui suivent probablement celle-ci ("module:Classe"), préparées
+    # pendant le temps libre des frames (voir Prewarmer)
+    successors = ()
+
+    # Renseignés par create() : durée de la création et instance préparée ou non
+    create_ms = None
+    prepared = False
+
     def __init__(self, game):
         self.game = game
+        self.full_redraw = True
+
+    @classmethod
+    def create(cls, game, *args, **kwargs):
+        """Nouvelle scène : l'instance préparée par le Prewarmer si elle existe.
+
+        Elle est remise à neuf par reset(*args, **kwargs) ; sinon la scène
+        est construite normalement.
+        """
+        start = time.perf_counter()
+        scene = Prewarmer.take(cls, game)
+        if scene is None:
+            scene = cls(game, *args, **kwargs)
+        else:
+            scene.reset(*args, **kwargs)
+            scene.full_redraw = True
+            scene.prepared = True
+        scene.create_ms = (time.perf_counter() - start) * 1000
+        return scene
+
+    @classmethod
+    def prewarm(cls, game, surface):
+        """Remplit les caches dont la première frame de la scène aura besoin.
+
+        Générateur : chaque yield rend la main jusqu'à une prochaine frame
+        assez calme. surface : brouillon hors écran, de la taille de l'écran.
+        Peut retourner une instance prête, reprise par create().
+        """
+        yield from ()
+
+    def reset(self, *args, **kwargs):
+        """Etat d'une nouvelle partie, sur une instance préparée (voir create).
+
+        Par défaut, la scène est reconstruite entièrement.
+        """
+        self.__init__(self.game, *args, **kwargs)
+
+    def enter(self):
+        """Appelé par Game.change_scene quand la scène devient active (musique, sons...)."""
+
+    def can_prewarm(self):
+        """False pendant les moments où une frame plus longue se verrait."""
+        return True
+
+    def invalidate(self):
+        """Force un rendu complet à la prochaine frame (nouvel écran, F11...)."""
+        self.full_redraw = True
 
     def handle_event(self, event):
         pass
@@ -9,4 +69,9 @@
         pass
 
     def render(self, screen):
+        """Dessine la scène.
+
+        Retourne None si tout l'écran a pu changer, sinon la liste des
+        rectangles modifiés ([] : rien n'a changé, rien à présenter).
+        """
         pass
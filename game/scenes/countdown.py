@@ -2,15 +2,22 @@ import pygame
 
 from game.core import settings
 from game.scenes.base import Scene
+from game.views.overlays import Overlays
 from game.views.renderer import Renderer
 
 
 class CountdownScene(Scene):
     """Compte à rebours avant le début de la partie (3, 2, 1, GO)."""
 
+    successors = ("game.scenes.ski:SkiScene",)
+
     def __init__(self, game, with_start=False, next_scene_callback=None, player=None, world=None):
         super().__init__(game)
         self.renderer = Renderer()
+        self.reset(with_start, next_scene_callback, player, world)
+
+    def reset(self, with_start=False, next_scene_callback=None, player=None, world=None):
+        self.renderer.sync_background()
         self.with_start = with_start
         self.next_scene_callback = next_scene_callback
         self.player = player
@@ -24,6 +31,15 @@ class CountdownScene(Scene):
         self.current_step = 0
         self.step_timer = 0
 
+    @classmethod
+    def prewarm(cls, game, surface):
+        scene = cls(game, with_start=True)
+        for step in range(len(scene.steps)):
+            scene.current_step = step
+            scene.render(surface)
+            yield
+        return scene
+
     def handle_event(self, event):
         pass  # Pas d'input pendant le countdown
 
@@ -40,15 +56,13 @@ class CountdownScene(Scene):
                     self.next_scene_callback()
                 else:
                     from game.scenes.ski import SkiScene
-                    self.game.change_scene(SkiScene(self.game))
+                    self.game.change_scene(SkiScene.create(self.game))
 
     def render(self, screen):
         self.renderer.draw_background(screen, 0)
 
         # Overlay sombre
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        screen.blit(overlay, (0, 0))
+        Overlays.darken(screen, 100)
 
         if self.current_step < len(self.steps):
             step = self.steps[self.current_step]
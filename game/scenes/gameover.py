@@ -10,15 +10,23 @@ from game.scenes.audio import MusicManager
 class GameOverScene(Scene):
     """Ecran de fin de partie."""
 
+    successors = ("game.scenes.countdown:CountdownScene",)
+
     def __init__(self, game, score, medal_score=0, distance=0):
         super().__init__(game)
+        self.renderer = Renderer()
+        self.reset(score, medal_score, distance)
+
+    def reset(self, score, medal_score=0, distance=0):
+        self.renderer.sync_background()
         self.score = score
         self.medal_score = medal_score
         self.distance = distance
         self.input = InputController()
-        self.renderer = Renderer()
         self.animation_time = 0
         self.can_restart = False
+        self._backdrop = None
+        self._prompt_rects = []
 
         # Charger et sauvegarder le meilleur score
         self.best_score = self._load_best_score()
@@ -26,6 +34,14 @@ class GameOverScene(Scene):
             self._save_best_score(score)
             self.best_score = score
 
+    @classmethod
+    def prewarm(cls, game, surface):
+        scene = cls(game, 0)  # Score nul : le meilleur score n'est pas réécrit
+        scene.animation_time = 1.5
+        yield
+        scene.render(surface)
+        return scene
+
     def _load_best_score(self):
         score_file = settings.ASSETS_DIR / "best_score.txt"
         try:
@@ -37,6 +53,8 @@ class GameOverScene(Scene):
         return 0
 
     def _save_best_score(self, score):
+        if not settings.SAVE_BEST_SCORE:
+            return
         score_file = settings.ASSETS_DIR / "best_score.txt"
         try:
             score_file.write_text(str(score))
@@ -50,7 +68,7 @@ class GameOverScene(Scene):
             if event.key == pygame.K_m:
                 from game.scenes.menu import MenuScene
                 MusicManager.play_menu_music()
-                self.game.change_scene(MenuScene(self.game))
+                self.game.change_scene(MenuScene.create(self.game))
 
     def update(self, dt):
         self.animation_time += dt / 1000
@@ -63,12 +81,26 @@ class GameOverScene(Scene):
             from game.scenes.countdown import CountdownScene
             Renderer.reset_background_index()
             MusicManager.play_game_music()
-            self.game.change_scene(CountdownScene(self.game, with_start=True))
+            self.game.change_scene(CountdownScene.create(self.game, with_start=True))
 
     def render(self, screen):
-        self.renderer.draw_background(screen)
         progress = min(1.0, self.animation_time / 1.5)
-        self.renderer.draw_game_over(
-            screen, self.score, self.medal_score,
-            self.distance, self.best_score, progress
-        )
+        if progress < 1.0 or self.full_redraw or self._backdrop is None:
+            self.renderer.draw_background(screen)
+            self.renderer.draw_game_over(
+                screen, self.score, self.medal_score,
+                self.distance, self.best_score, progress, prompts=False
+            )
+            if progress < 1.0:
+                return None
+            # Animation terminée : seul le texte clignotant change encore
+            self._backdrop = screen.copy()
+            self.full_redraw = False
+            self._prompt_rects = self.renderer.draw_game_over_prompts(screen)
+            return None
+
+        dirty = self._prompt_rects
+        for rect in dirty:
+            screen.blit(self._backdrop, rect, rect)
+        self._prompt_rects = self.renderer.draw_game_over_prompts(screen)
+        return dirty + self._prompt_rects
@@ -0,0 +1,61 @@
+import pygame
+
+from game.core import settings
+from game.core.fonts import FontRegistry
+from game.core.loader import AssetLoader
+from game.scenes.base import Scene
+from game.scenes.audio import SoundManager
+from game.views.renderer import Renderer
+from game.views.text import TextCache
+from game.hockey.renderer import HockeyRenderer
+from game.hockey.sound import HockeySound
+
+
+class LoadingScene(Scene):
+    """Ecran de chargement affiché au lancement.
+
+    Seules les images du menu sont demandées avant la première frame ; le
+    reste (ski, tir, hockey, sons) est mis en file d'attente juste après et
+    continue de se charger en arrière-plan. Le menu s'ouvre dès que ses
+    images sont prêtes.
+    """
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.font = FontRegistry.get("consolas", 32)
+        self.font_tiny = FontRegistry.get("consolas", 24)
+
+        Renderer.preload("menu")
+        self.rest_queued = False
+        game.defer(self._queue_rest)
+
+    def _queue_rest(self):
+        Renderer.preload("ski", "shooting", "hockey")
+        HockeyRenderer.preload()
+        SoundManager.preload()
+        HockeySound.preload()
+        self.rest_queued = True
+
+    def update(self, dt):
+        if self.rest_queued and AssetLoader.is_ready("menu"):
+            from game.scenes.menu import MenuScene
+            self.game.change_scene(MenuScene.create(self.game))
+
+    def render(self, screen):
+        screen.fill(settings.BG_COLOR)
+
+        progress = AssetLoader.progress("menu")
+        bar = pygame.Rect(0, 0, 600, 24)
+        bar.center = (settings.WIDTH // 2, settings.HEIGHT // 2 + 40)
+        pygame.draw.rect(screen, (40, 52, 76), bar, border_radius=12)
+        if progress > 0:
+            fill = bar.copy()
+            fill.width = max(24, int(bar.width * progress))
+            pygame.draw.rect(screen, (100, 180, 255), fill, border_radius=12)
+        pygame.draw.rect(screen, (120, 160, 220), bar, 2, border_radius=12)
+
+        title = TextCache.render(self.font, f"Chargement... {int(progress * 100)}%", (240, 240, 250))
+        screen.blit(title, (settings.WIDTH // 2 - title.get_width() // 2, bar.top - 60))
+
+        total = TextCache.render(self.font_tiny, f"Assets: {int(AssetLoader.progress() * 100)}%", (150, 160, 180))
+        screen.blit(total, (settings.WIDTH // 2 - total.get_width() // 2, bar.bottom + 20))
@@ -10,11 +10,13 @@ from game.scenes.audio import MusicManager, SoundManager
 class MenuScene(Scene):
     """Menu principal du jeu."""
 
+    successors = ("game.scenes.countdown:CountdownScene", "game.hockey.scene:HockeyScene")
+
     def __init__(self, game):
         super().__init__(game)
         self.input = InputController()
         self.renderer = Renderer()
-        MusicManager.play_menu_music()
+        self._drawn_hover = None
 
         # Taille des boutons (configurable dans settings.py)
         btn_width = settings.MENU_BUTTON_WIDTH
@@ -33,6 +35,13 @@ class MenuScene(Scene):
         self.hockey_button.center = (center_x, self.settings_button.centery - btn_height - spacing)
         self.biathlon_button.center = (center_x, self.hockey_button.centery - btn_height - spacing)
 
+    def reset(self):
+        self.input = InputController()
+        self._drawn_hover = None
+
+    def enter(self):
+        MusicManager.play_menu_music()
+
     def handle_event(self, event):
         self.input.handle_event(event)
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -44,7 +53,7 @@ class MenuScene(Scene):
         if self.biathlon_button.collidepoint(pos):
             self._start_biathlon()
         elif self.hockey_button.collidepoint(pos):
-            self.game.change_scene(HockeyScene(self.game))
+            self.game.change_scene(HockeyScene.create(self.game))
         elif self.settings_button.collidepoint(pos):
             pass
         elif self.quit_button.collidepoint(pos):
@@ -56,7 +65,7 @@ class MenuScene(Scene):
         Renderer.reset_background_index()
         MusicManager.play_game_music()
         SoundManager.init()
-        self.game.change_scene(CountdownScene(self.game, with_start=True))
+        self.game.change_scene(CountdownScene.create(self.game, with_start=True))
 
     def update(self, dt):
         left, right, jump, start = self.input.consume()
@@ -77,8 +86,21 @@ class MenuScene(Scene):
             if rect.collidepoint(mouse_pos):
                 hovered_index = i
                 break
+        # Rien ne bouge tant que le survol ne change pas
+        if not self.full_redraw and hovered_index == self._drawn_hover:
+            return []
+
         buttons = [
             (rect, i == hovered_index, label)
             for i, (rect, label) in enumerate(button_list)
         ]
         self.renderer.draw_menu(screen, buttons)
+
+        previous, self._drawn_hover = self._drawn_hover, hovered_index
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+        return [
+            Renderer.menu_button_bounds(button_list[i][0])
+            for i in (previous, hovered_index) if i >= 0
+        ]
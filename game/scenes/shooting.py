@@ -1,19 +1,37 @@
 import pygame
 
 from game.core import settings
+from game.core.assets import AssetStore
+from game.core.pool import swap_remove
+from game.core.replay import Replay
 from game.controllers.input import InputController
-from game.models.entities import Target, Sight, TargetState
+from game.models.entities import FLOATING_TEXT_POOL, FloatingText, Player, Target, Sight, TargetState
+from game.models.world import World
 from game.scenes.base import Scene
 from game.views.renderer import Renderer
+from game.views.glyphs import GlyphAtlas
+from game.views.text import TextCache
 
 
 class ShootingScene(Scene):
     """Phase de tir - toucher les 5 cibles."""
 
+    successors = ("game.scenes.ski:SkiScene", "game.scenes.gameover:GameOverScene")
+
     def __init__(self, game, player, world):
         super().__init__(game)
-        self.input = InputController()
         self.renderer = Renderer()
+
+        # Son du tir
+        self.shotgun_sound = AssetStore.sound(settings.SOUND_SHOTGUN)
+        if self.shotgun_sound:
+            self.shotgun_sound.set_volume(0.5)
+
+        self.reset(player, world)
+
+    def reset(self, player, world):
+        self.input = InputController()
+        self.renderer.sync_background()
         self.player = player
         self.world = world
 
@@ -45,17 +63,18 @@ class ShootingScene(Scene):
         self.flash_alpha = 0
         self.gun_recoil = 0
 
-        # Son du tir
-        self.shotgun_sound = None
-        if settings.SOUND_SHOTGUN.exists():
-            self.shotgun_sound = pygame.mixer.Sound(str(settings.SOUND_SHOTGUN))
-            self.shotgun_sound.set_volume(0.5)
+    @classmethod
+    def prewarm(cls, game, surface):
+        scene = cls(game, Player(), World())
+        yield
+        scene.render(surface)
+        return scene
 
     def handle_event(self, event):
         self.input.handle_event(event)
 
     def update(self, dt):
-        _, _, jump, _ = self.input.consume()
+        _, _, jump, _ = Replay.inputs(self.input.consume())
 
         self._update_effects(dt)
 
@@ -63,6 +82,7 @@ class ShootingScene(Scene):
             self.shot_cooldown -= dt
 
         if self.phase_complete:
+            self.sight.save_previous()  # Viseur arrêté : le rendu ne doit plus interpoler
             self.transition_timer += dt
             if self.transition_timer >= 1500:
                 self._finish_phase()
@@ -78,7 +98,7 @@ class ShootingScene(Scene):
                 self.flash_color = (255, 0, 0)
                 self.flash_alpha = 150
 
-        self.sight.update()
+        self.sight.update(dt)
 
         # Tir
         if jump and self.shot_cooldown <= 0 and self.current_target_index < len(self.targets):
@@ -92,7 +112,8 @@ class ShootingScene(Scene):
         # Pénalité si raté
         if self.time_expired or self.targets_hit < settings.MIN_TARGETS_TO_HIT:
             if self.player.take_damage():
-                self.game.change_scene(GameOverScene(
+                Replay.end_run()
+                self.game.change_scene(GameOverScene.create(
                     self.game, self.world.score, self.world.medal_score, self.world.distance
                 ))
                 return
@@ -101,16 +122,15 @@ class ShootingScene(Scene):
             self.player.lives += 1
 
         self.renderer.next_background()
-        self.game.change_scene(SkiScene(self.game, self.player, self.world, from_shooting=True))
+        self.game.change_scene(SkiScene.create(self.game, self.player, self.world, from_shooting=True))
 
     def _update_effects(self, dt):
         if self.flash_alpha > 0:
             self.flash_alpha -= dt * 0.3
 
         for t in self.floating_texts:
-            t['y'] -= dt * 0.05
-            t['alpha'] -= dt * 0.15
-        self.floating_texts = [t for t in self.floating_texts if t['alpha'] > 0]
+            t.update(dt)
+        swap_remove(self.floating_texts, FloatingText.faded, FLOATING_TEXT_POOL)
 
         if self.gun_recoil > 0:
             self.gun_recoil -= dt * 0.15
@@ -131,14 +151,9 @@ class ShootingScene(Scene):
             target.state = TargetState.HIT
             self.targets_hit += 1
             self.world.score += settings.TARGET_HIT_BONUS
-            self.floating_texts.append({
-                'text': f"+{settings.TARGET_HIT_BONUS}",
-                'x': tx + tw // 2,
-                'y': ty - 20,
-                'color': (80, 220, 80),
-                'alpha': 255,
-                'scale': 1.2
-            })
+            self.floating_texts.append(FLOATING_TEXT_POOL.acquire(
+                f"+{settings.TARGET_HIT_BONUS}", tx + tw // 2, ty - 20, (80, 220, 80), scale=1.2
+            ))
             self.flash_color = (0, 255, 0)
             self.flash_alpha = 80
         else:
@@ -161,9 +176,9 @@ class ShootingScene(Scene):
         self.renderer.draw_targets(screen, self.targets)
 
         if not self.phase_complete:
-            self.renderer.draw_sight(screen, self.sight)
+            self.renderer.draw_sight(screen, self.sight, self.game.alpha)
 
-        self.renderer.draw_gun(screen, self.sight, self.gun_recoil)
+        self.renderer.draw_gun(screen, self.sight, self.gun_recoil, self.game.alpha)
         self.renderer.draw_shooting_ui(
             screen, self.shots_remaining, self.targets_hit,
             self.world.score, self.player.lives
@@ -177,8 +192,8 @@ class ShootingScene(Scene):
             color = (255, 200, 60)
         else:
             color = (255, 60, 60)
-        timer_text = self.renderer.font_big.render(f"{seconds:.1f}s", True, color)
-        screen.blit(timer_text, (30, 80))  # En haut à gauche, sous le score
+        timer_glyphs = GlyphAtlas.get(self.renderer.font_big, color)
+        timer_glyphs.blit(screen, f"{seconds:.1f}s", (30, 80))  # En haut à gauche, sous le score
 
         self.renderer.draw_floating_text(screen, self.floating_texts)
         if self.flash_alpha > 0:
@@ -198,5 +213,5 @@ class ShootingScene(Scene):
             else:
                 msg = f"Rate ! {self.targets_hit}/{settings.NUM_TARGETS} (-1 vie)"
                 color = (200, 60, 60)
-            text = self.renderer.font_big.render(msg, True, color)
+            text = TextCache.render(self.renderer.font_big, msg, color)
             screen.blit(text, (settings.WIDTH // 2 - text.get_width() // 2, settings.HEIGHT - 180))
@@ -1,27 +1,49 @@
 import pygame
 
 from game.core import settings
+from game.core.pool import swap_remove
+from game.core.replay import Replay
 from game.controllers.input import InputController
-from game.models.entities import Player
+from game.models.entities import FLOATING_TEXT_POOL, FloatingText, Player
 from game.models.world import World
 from game.scenes.base import Scene
 from game.views.renderer import Renderer
+from game.views.overlays import Overlays
+from game.views.text import TextCache
 from game.scenes.audio import MusicManager, SoundManager
 
 
 class SkiScene(Scene):
     """Phase de ski - éviter les obstacles et ramasser les médailles."""
 
+    successors = ("game.scenes.shooting:ShootingScene", "game.scenes.gameover:GameOverScene")
+
     def __init__(self, game, player=None, world=None, from_shooting=False):
         super().__init__(game)
-        self.input = InputController()
         self.renderer = Renderer()
+
+        # Menu pause
+        self.pause_buttons = [
+            pygame.Rect(0, 0, 350, 80),
+            pygame.Rect(0, 0, 350, 80),
+            pygame.Rect(0, 0, 350, 80),
+        ]
+        self.pause_buttons[0].center = (settings.WIDTH // 2, settings.HEIGHT // 2 - 100)
+        self.pause_buttons[1].center = (settings.WIDTH // 2, settings.HEIGHT // 2)
+        self.pause_buttons[2].center = (settings.WIDTH // 2, settings.HEIGHT // 2 + 100)
+
+        self.reset(player, world, from_shooting)
+
+    def reset(self, player=None, world=None, from_shooting=False):
+        self.input = InputController()
+        self.renderer.sync_background()
         self.player = player if player else Player()
         self.world = world if world else World()
         self.paused = False
         self.time_to_shooting = settings.SHOOTING_INTERVAL
 
         self.from_shooting = from_shooting
+        self._run_started = from_shooting  # Au retour du tir, la partie continue
         self.obstacle_spawn_delay = settings.OBSTACLE_SPAWN_DELAY if from_shooting else 0
 
         # Vider les obstacles si on revient du tir
@@ -40,16 +62,20 @@ class SkiScene(Scene):
         self.flash_alpha = 0
         self.floating_texts = []
 
-        # Menu pause
         self.pause_selected = 0
-        self.pause_buttons = [
-            pygame.Rect(0, 0, 350, 80),
-            pygame.Rect(0, 0, 350, 80),
-            pygame.Rect(0, 0, 350, 80),
-        ]
-        self.pause_buttons[0].center = (settings.WIDTH // 2, settings.HEIGHT // 2 - 100)
-        self.pause_buttons[1].center = (settings.WIDTH // 2, settings.HEIGHT // 2)
-        self.pause_buttons[2].center = (settings.WIDTH // 2, settings.HEIGHT // 2 + 100)
+        self._pause_backdrop = None
+        self._pause_drawn = None
+
+    @classmethod
+    def prewarm(cls, game, surface):
+        scene = cls(game)
+        yield
+        scene.render(surface)
+        return scene
+
+    def can_prewarm(self):
+        # Pendant la course, seulement en pause ou pendant le 3-2-1 avant le tir
+        return self.paused or self.pre_shooting_preparation or self.pre_shooting_countdown
 
     def handle_event(self, event):
         self.input.handle_event(event)
@@ -84,17 +110,33 @@ class SkiScene(Scene):
         if action == 0:
             self.paused = False
         elif action == 1:
+            Replay.end_run()
             Renderer.reset_background_index()
             MusicManager.play_menu_music()
-            self.game.change_scene(MenuScene(self.game))
+            self.game.change_scene(MenuScene.create(self.game))
         elif action == 2:
             self.game.running = False
 
+    @staticmethod
+    def replay_state(world, player):
+        """Etat de la partie contrôlé par Replay (ordre des objets indifférent)."""
+        return (
+            world.score, world.medal_score, world.distance, world.speed,
+            sorted((o.lane, o.y, o.passed) for o in world.obstacles),
+            sorted((m.kind.value, m.lane, m.y) for m in world.medals),
+            player.x, player.y, player.lives, player.invincible_timer,
+        )
+
     def update(self, dt):
         if self.paused:
             return
 
-        left, right, jump, _ = self.input.consume()
+        if not self._run_started:
+            self._run_started = True
+            world, player = self.world, self.player
+            Replay.start_run("ski", world.seed, lambda: self.replay_state(world, player))
+        left, right, jump, _ = Replay.inputs(self.input.consume())
+        self.world.scroll_by(dt)
 
         # Phase de préparation (piste vide avant le tir)
         if self.pre_shooting_preparation:
@@ -127,10 +169,7 @@ class SkiScene(Scene):
             return
 
         # Score quand on évite un obstacle
-        for obstacle in self.world.obstacles:
-            if not obstacle.passed and obstacle.y > self.player.y:
-                obstacle.passed = True
-                self.world.score += 1
+        self.world.score_passed(self.player.y)
 
         self._handle_medal_pickups()
 
@@ -149,13 +188,7 @@ class SkiScene(Scene):
                 settings.MAX_SCROLL_SPEED,
                 settings.BASE_SCROLL_SPEED + self.world.distance * settings.SPEED_GROWTH
             )
-            for obstacle in self.world.obstacles:
-                obstacle.update(self.world.speed)
-            for medal in self.world.medals:
-                medal.update(self.world.speed)
-            # Nettoyer les objets hors écran
-            self.world.obstacles = [o for o in self.world.obstacles if o.y - o.height < settings.HEIGHT + 40]
-            self.world.medals = [m for m in self.world.medals if m.y - m.height < settings.HEIGHT + 40]
+            self.world.advance(dt)
         else:
             self.world.update(dt)
 
@@ -178,9 +211,7 @@ class SkiScene(Scene):
             settings.BASE_SCROLL_SPEED + self.world.distance * settings.SPEED_GROWTH
         )
 
-        for medal in self.world.medals:
-            medal.update(self.world.speed)
-        self.world.medals = [m for m in self.world.medals if m.y - m.height < settings.HEIGHT + 40]
+        self.world.advance(dt)  # Piste vide d'obstacles : seules les médailles bougent
 
         self._handle_medal_pickups()
         self._update_effects(dt)
@@ -204,9 +235,7 @@ class SkiScene(Scene):
         self.player.update(dt)
 
         self.world.distance += dt * 0.001
-        for medal in self.world.medals:
-            medal.update(self.world.speed)
-        self.world.medals = [m for m in self.world.medals if m.y - m.height < settings.HEIGHT + 40]
+        self.world.advance(dt)  # Piste vide d'obstacles : seules les médailles bougent
 
         self._handle_medal_pickups()
         self._update_effects(dt)
@@ -216,11 +245,12 @@ class SkiScene(Scene):
             self.countdown_step -= 1
             if self.countdown_step <= 0:
                 from game.scenes.shooting import ShootingScene
-                self.game.change_scene(ShootingScene(self.game, self.player, self.world))
+                self.game.change_scene(ShootingScene.create(self.game, self.player, self.world))
 
     def _game_over(self):
         from game.scenes.gameover import GameOverScene
-        self.game.change_scene(GameOverScene(
+        Replay.end_run()
+        self.game.change_scene(GameOverScene.create(
             self.game, self.world.score, self.world.medal_score, self.world.distance
         ))
 
@@ -233,61 +263,50 @@ class SkiScene(Scene):
 
         # Animation des textes flottants
         for t in self.floating_texts:
-            t['y'] -= dt * 0.05
-            t['alpha'] -= dt * 0.15
-        self.floating_texts = [t for t in self.floating_texts if t['alpha'] > 0]
+            t.update(dt)
+        swap_remove(self.floating_texts, FloatingText.faded, FLOATING_TEXT_POOL)
 
     def _check_collisions(self):
         if self.player.is_invincible():
             return False
-
-        px, py, pw, ph = self.player.rect
-        for obstacle in self.world.obstacles:
-            ox, oy, ow, oh = obstacle.rect
-            # Test AABB classique
-            if px < ox + ow and px + pw > ox and py < oy + oh and py + ph > oy:
-                return True
-        return False
+        return self.world.hits_obstacle(self.player.rect)
 
     def _handle_medal_pickups(self):
-        px, py, pw, ph = self.player.rect
-        remaining = []
-
-        for medal in self.world.medals:
+        picked = self.world.take_medals(self.player.rect)
+        for medal in picked:
             mx, my, mw, mh = medal.rect
-            if px < mx + mw and px + pw > mx and py < my + mh and py + ph > my:
-                # Médaille ramassée
-                points = settings.MEDAL_POINTS.get(medal.kind, 1)
-                self.world.score += points
-                self.world.medal_score += points
-
-                # Couleur selon le type
-                if medal.kind == "gold":
-                    color = (255, 215, 0)
-                elif medal.kind == "silver":
-                    color = (200, 200, 200)
-                else:
-                    color = (205, 127, 50)
-
-                self.floating_texts.append({
-                    'text': f"+{points}",
-                    'x': mx + mw // 2,
-                    'y': my,
-                    'color': color,
-                    'alpha': 255,
-                    'scale': 1.0
-                })
-                SoundManager.play_coin()
+            # Médaille ramassée
+            points = settings.MEDAL_POINTS.get(medal.kind, 1)
+            self.world.score += points
+            self.world.medal_score += points
+
+            # Couleur selon le type
+            if medal.kind == "gold":
+                color = (255, 215, 0)
+            elif medal.kind == "silver":
+                color = (200, 200, 200)
             else:
-                remaining.append(medal)
+                color = (205, 127, 50)
 
-        self.world.medals = remaining
+            self.floating_texts.append(FLOATING_TEXT_POOL.acquire(f"+{points}", mx + mw // 2, my, color))
+            SoundManager.play_coin()
+        if picked:
+            self.world.recycle_medals(picked)
 
     def render(self, screen):
-        self.renderer.draw_background(screen, self.world.speed)
-        self.renderer.draw_obstacles(screen, self.world.obstacles)
-        self.renderer.draw_medals(screen, self.world.medals)
-        self.renderer.draw_player_blinking(screen, self.player)
+        # En pause le jeu est figé : seuls les boutons survolés changent
+        if self.paused and self._pause_backdrop is not None and not self.full_redraw:
+            if self._pause_hover() == self._pause_drawn:
+                return []
+            screen.blit(self._pause_backdrop, (0, 0))
+            self._render_pause_menu(screen)
+            return [btn.copy() for btn in self.pause_buttons]
+
+        alpha = self.game.alpha
+        self.renderer.draw_background(screen, self.world.scroll_at(alpha))
+        self.renderer.draw_obstacles(screen, self.world.obstacles, alpha)
+        self.renderer.draw_medals(screen, self.world.medals, alpha)
+        self.renderer.draw_player_blinking(screen, self.player, alpha)
         self.renderer.draw_ski_ui(
             screen, self.world.score, self.world.medal_score,
             self.player.lives, self.time_to_shooting
@@ -299,38 +318,44 @@ class SkiScene(Scene):
 
         # Countdown avant tir
         if self.pre_shooting_countdown:
-            overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 100))
-            screen.blit(overlay, (0, 0))
+            Overlays.darken(screen, 100)
             self.renderer.draw_countdown(screen, self.countdown_step)
 
         # Menu pause
+        self._pause_backdrop = None
         if self.paused:
+            self._pause_backdrop = screen.copy()
             self._render_pause_menu(screen)
+        self.full_redraw = False
+        return None
+
+    def _pause_hover(self):
+        mouse_pos = pygame.mouse.get_pos()
+        return tuple(
+            btn.collidepoint(mouse_pos) or i == self.pause_selected
+            for i, btn in enumerate(self.pause_buttons)
+        )
 
     def _render_pause_menu(self, screen):
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        Overlays.darken(screen, 180)
 
-        title = self.renderer.font_big.render("PAUSE", True, (255, 255, 255))
+        title = TextCache.render(self.renderer.font_big, "PAUSE", (255, 255, 255))
         screen.blit(title, (settings.WIDTH // 2 - title.get_width() // 2, settings.HEIGHT // 2 - 200))
 
         labels = ["Reprendre", "Menu Principal", "Quitter"]
-        mouse_pos = pygame.mouse.get_pos()
+        self._pause_drawn = self._pause_hover()
 
-        for i, (btn, label) in enumerate(zip(self.pause_buttons, labels)):
-            hovered = btn.collidepoint(mouse_pos) or i == self.pause_selected
+        for btn, label, hovered in zip(self.pause_buttons, labels, self._pause_drawn):
             color = (80, 140, 200) if hovered else (50, 60, 80)
             border_color = (120, 180, 255) if hovered else (100, 110, 130)
 
             pygame.draw.rect(screen, color, btn, border_radius=12)
             pygame.draw.rect(screen, border_color, btn, 3, border_radius=12)
 
-            text = self.renderer.font_medium.render(label, True, (255, 255, 255))
+            text = TextCache.render(self.renderer.font_medium, label, (255, 255, 255))
             screen.blit(text, (btn.centerx - text.get_width() // 2, btn.centery - text.get_height() // 2))
 
-        hint = self.renderer.font_tiny.render("Fleches + Entree ou cliquez", True, (150, 150, 160))
+        hint = TextCache.render(self.renderer.font_tiny, "Fleches + Entree ou cliquez", (150, 150, 160))
         screen.blit(hint, (settings.WIDTH // 2 - hint.get_width() // 2, settings.HEIGHT // 2 + 180))
 
 
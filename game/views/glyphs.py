@@ -0,0 +1,75 @@
+import pygame
+
+
+class GlyphAtlas:
+    """Glyphes pré-rendus pour les compteurs numériques (score, timers...).
+
+    Tous les caractères de CHARSET sont rasterisés une fois dans une seule
+    surface ; un nombre est ensuite composé en blittant les sous-rectangles.
+    L'avance de chaque paire de caractères (crénage compris) est mesurée
+    une fois avec font.size, pour retomber sur la mise en page de font.render.
+    Un atlas par (police, couleur), obtenu via GlyphAtlas.get().
+    """
+
+    CHARSET = "0123456789 .,:-+/%sm"
+
+    _atlases = {}
+
+    def __init__(self, font, color):
+        self.color = tuple(color)
+        self.height = font.get_height()
+        self._glyphs = {}
+        self._advances = {}
+
+        glyphs = [(char, font.render(char, True, color)) for char in self.CHARSET]
+        width = sum(surface.get_width() for _, surface in glyphs)
+        self.surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+
+        x = 0
+        for char, glyph in glyphs:
+            # BLEND_RGBA_MAX sur un fond transparent = copie exacte des pixels
+            self.surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._glyphs[char] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+
+        # Position du 2e caractère dans "ab" = largeur("ab") - largeur("b")
+        for a in self.CHARSET:
+            for b in self.CHARSET:
+                self._advances[a, b] = font.size(a + b)[0] - self._glyphs[b].width
+
+    @classmethod
+    def get(cls, font, color):
+        key = (font, tuple(color))
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = cls._atlases[key] = cls(font, color)
+        return atlas
+
+    def supports(self, text):
+        return all(char in self._glyphs for char in text)
+
+    def width(self, text):
+        if not text:
+            return 0
+        advances = self._advances
+        return sum(advances[a, b] for a, b in zip(text, text[1:])) + self._glyphs[text[-1]].width
+
+    def blit(self, screen, text, pos):
+        """Dessine text à pos (coin haut gauche), retourne le rectangle touché."""
+        x, y = pos
+        previous = None
+        for char in text:
+            if previous is not None:
+                x += self._advances[previous, char]
+            screen.blit(self.surface, (x, y), self._glyphs[char])
+            previous = char
+        return pygame.Rect(pos[0], y, self.width(text), self.height)
+
+    def render(self, text):
+        """Retourne une nouvelle surface contenant text (pour le HUD retenu)."""
+        surface = pygame.Surface((max(1, self.width(text)), self.height), pygame.SRCALPHA)
+        # Fond de la couleur du texte, transparent : les bords antialiasés restent justes
+        surface.fill((*self.color, 0))
+        self.blit(surface, text, (0, 0))
+        return surface
@@ -0,0 +1,46 @@
+from game.core import settings
+
+
+class HudWidget:
+    """Elément dynamique du HUD, redessiné seulement quand sa valeur change.
+
+    build(value) retourne la surface de l'élément ; elle est réutilisée
+    tant que la valeur passée à update() reste identique.
+    """
+
+    def __init__(self, build):
+        self._build = build
+        self._value = None
+        self._surface = None
+        self.dirty = True
+        self.redraws = 0
+
+    def update(self, value):
+        if self._surface is None or value != self._value:
+            self._value = value
+            self.dirty = True
+
+    def surface(self):
+        if self.dirty:
+            self._surface = self._build(self._value)
+            self.dirty = False
+            self.redraws += 1
+        return self._surface
+
+
+class HudLayers:
+    """Calques statiques du HUD (fonds, dégradés, bordures), construits une fois par résolution."""
+
+    _layers = {}
+
+    @classmethod
+    def get(cls, name, build):
+        key = (name, settings.WIDTH, settings.HEIGHT)
+        layer = cls._layers.get(key)
+        if layer is None:
+            layer = cls._layers[key] = build()
+        return layer
+
+    @classmethod
+    def clear(cls):
+        cls._layers.clear()
@@ -4,7 +4,61 @@ import pygame
 import math
 
 from game.core import settings
-from game.models.entities import lane_x, TargetState
+from game.core.assets import AssetStore
+from game.core.fonts import FontRegistry
+from game.core.loader import AssetLoader
+from game.core.profiler import Profiler
+from game.core.quality import QualityGovernor
+from game.models.entities import lane_x, ObstacleKind, TargetState
+from game.views.glyphs import GlyphAtlas
+from game.views.hud import HudLayers, HudWidget
+from game.views.overlays import Overlays
+from game.views.sprites import SpriteCache
+from game.views.text import TextCache
+
+
+# Images du Renderer : attribut -> (groupe de préchargement, chemin, taille, mode)
+# Voir AssetStore.image pour le format de la taille et du mode.
+IMAGE_ASSETS = {
+    # Menu
+    "menu_image": ("menu", settings.MENU_BG_IMG, (settings.WIDTH, settings.HEIGHT), "opaque"),
+    "menu_button_image": ("menu", settings.MENU_BUTTON_IMG, None, "alpha"),
+    "button_biathlon_img": ("menu", settings.BUTTON_BIATHLON_IMG, None, "alpha"),
+    "button_hockey_img": ("menu", settings.BUTTON_HOCKEY_IMG, None, "alpha"),
+    "button_quit_img": ("menu", settings.BUTTON_QUIT_IMG, None, "alpha"),
+    "button_settings_img": ("menu", settings.BUTTON_SETTINGS_IMG, None, "alpha"),
+    "button_leaderboard_img": ("menu", settings.BUTTON_LEADERBOARD_IMG, None, "alpha"),
+    # Ski
+    "player_image": ("ski", settings.PLAYER_IMG, (None, settings.PLAYER_RENDER_HEIGHT), "alpha"),
+    "obstacle_image": ("ski", settings.OBSTACLE_IMG, settings.OBSTACLE_SIZE, "alpha"),
+    "icicle_image": ("ski", settings.ICICLE_IMG, settings.ICICLE_SIZE, "alpha"),
+    "heart_image": ("ski", settings.HEART_IMG, settings.HEART_SIZE, "alpha"),
+    # Phase tir
+    "shooting_bg_image": ("shooting", settings.SHOOTING_BG_IMG, (settings.WIDTH, settings.HEIGHT), "opaque"),
+    "target_image": ("shooting", settings.TARGET_IMG, settings.TARGET_SIZE, "alpha"),
+    "sight_image": ("shooting", settings.SIGHT_IMG, settings.SIGHT_SIZE, "alpha"),
+    "gun_image": ("shooting", settings.GUN_IMG, (settings.GUN_WIDTH, None), "alpha"),
+    # Hockey
+    "hockey_player_image": ("hockey", settings.PLAYER_IMG, None, "alpha"),
+}
+
+MEDAL_ASSETS = {
+    "bronze": (settings.MEDAL_BRONZE_IMG, settings.MEDAL_SIZE, "alpha"),
+    "silver": (settings.MEDAL_SILVER_IMG, settings.MEDAL_SIZE, "alpha"),
+    "gold": (settings.MEDAL_GOLD_IMG, settings.MEDAL_SIZE, "alpha"),
+}
+
+# Taille du compteur pour 1920x1080
+COUNTDOWN_ASSETS = {
+    3: (settings.COUNTDOWN_3_IMG, (500, 350), "alpha"),
+    2: (settings.COUNTDOWN_2_IMG, (500, 350), "alpha"),
+    1: (settings.COUNTDOWN_1_IMG, (500, 350), "alpha"),
+    "start": (settings.COUNTDOWN_START_IMG, (500, 350), "alpha"),
+}
+
+
+def _background_specs():
+    return [(path, (settings.WIDTH, None), "opaque") for path in settings.BACKGROUND_IMAGES]
 
 
 class Renderer:
@@ -13,66 +67,61 @@ class Renderer:
 
     def __init__(self):
         # Polices adaptées pour 1920x1080
-        self.font_big = pygame.font.SysFont("consolas", 56)
-        self.font_medium = pygame.font.SysFont("consolas", 42)
-        self.font_small = pygame.font.SysFont("consolas", 32)
-        self.font_tiny = pygame.font.SysFont("consolas", 24)
-        self.player_image = self._load_player_image()
-        self.hockey_player_image = self._load_hockey_player_image()
-        self.obstacle_image = self._load_image(settings.OBSTACLE_IMG, settings.OBSTACLE_SIZE)
-        self.icicle_image = self._load_image(settings.ICICLE_IMG, settings.ICICLE_SIZE)
-
-        # Système de maps
-        self.background_images = self._load_all_backgrounds()
-        self.background_image = self.background_images[Renderer._current_bg_index] if self.background_images else None
-
-        self.menu_image = self._load_menu_background()
-        self.menu_button_image = self._load_menu_button()
-        self._menu_button_cache = {}
+        self.font_big = FontRegistry.get("consolas", 56)
+        self.font_medium = FontRegistry.get("consolas", 42)
+        self.font_small = FontRegistry.get("consolas", 32)
+        self.font_tiny = FontRegistry.get("consolas", 24)
+
+        # Les images sont chargées à leur première utilisation (voir __getattr__)
         self._bg_offset = 0.0
-        self._bg_height = self.background_image.get_height() if self.background_image else 0
-        self._player_rot_cache = {}
-        self.medal_images = {
-            "bronze": self._load_image(settings.MEDAL_BRONZE_IMG, settings.MEDAL_SIZE),
-            "silver": self._load_image(settings.MEDAL_SILVER_IMG, settings.MEDAL_SIZE),
-            "gold": self._load_image(settings.MEDAL_GOLD_IMG, settings.MEDAL_SIZE),
-        }
-
-        # Images phase tir
-        self.shooting_bg_image = self._load_fullscreen_image(settings.SHOOTING_BG_IMG)
-        self.target_image = self._load_image(settings.TARGET_IMG, settings.TARGET_SIZE)
         self.target_hit_image = None
         self.target_miss_image = None
-        self.sight_image = self._load_image(settings.SIGHT_IMG, settings.SIGHT_SIZE)
-        self.gun_image = self._load_gun_image()
-
-        # Images compteur
-        self.countdown_images = {
-            3: self._load_countdown_image(settings.COUNTDOWN_3_IMG),
-            2: self._load_countdown_image(settings.COUNTDOWN_2_IMG),
-            1: self._load_countdown_image(settings.COUNTDOWN_1_IMG),
-            "start": self._load_countdown_image(settings.COUNTDOWN_START_IMG),
-        }
-
-        # Images boutons menu
-        self.button_biathlon_img = self._load_button_image(settings.BUTTON_BIATHLON_IMG)
-        self.button_hockey_img = self._load_button_image(settings.BUTTON_HOCKEY_IMG)
-        self.button_quit_img = self._load_button_image(settings.BUTTON_QUIT_IMG)
-        self.button_settings_img = self._load_button_image(settings.BUTTON_SETTINGS_IMG)
-        self.button_leaderboard_img = self._load_button_image(settings.BUTTON_LEADERBOARD_IMG)
-
-        # Image cœur
-        self.heart_image = self._load_image(settings.HEART_IMG, settings.HEART_SIZE) if settings.HEART_IMG.exists() else None
+
+        # HUD retenu : chaque élément n'est redessiné que si sa valeur change
+        self._hud_score = HudWidget(self._build_score)
+        self._hud_medals = HudWidget(self._build_medals)
+        self._hud_lives = HudWidget(self._build_lives)
+
+    def __getattr__(self, name):
+        # Appelé uniquement si l'attribut n'existe pas encore : l'image est
+        # récupérée dans l'AssetStore puis mémorisée sur l'instance.
+        if name in IMAGE_ASSETS:
+            _, path, size, mode = IMAGE_ASSETS[name]
+            value = AssetStore.image(path, size, mode)
+        elif name == "medal_images":
+            value = {kind: AssetStore.image(*spec) for kind, spec in MEDAL_ASSETS.items()}
+        elif name == "countdown_images":
+            value = {step: AssetStore.image(*spec) for step, spec in COUNTDOWN_ASSETS.items()}
+        elif name == "background_images":
+            value = self._load_all_backgrounds()
+        elif name == "background_image":
+            value = self.background_images[Renderer._current_bg_index] if self.background_images else None
+        elif name == "_bg_height":
+            value = self.background_image.get_height() if self.background_image else 0
+        else:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        setattr(self, name, value)
+        return value
+
+    @staticmethod
+    def preload(*groups):
+        """Lance le chargement en arrière-plan des images des groupes demandés
+        (par défaut tous, menu en premier)."""
+        specs = {}
+        for group, path, size, mode in IMAGE_ASSETS.values():
+            specs.setdefault(group, []).append((path, size, mode))
+        for group in groups or ("menu", "ski", "shooting", "hockey"):
+            group_specs = specs[group]
+            if group == "ski":
+                group_specs = group_specs + list(MEDAL_ASSETS.values()) + list(COUNTDOWN_ASSETS.values()) + _background_specs()
+            AssetLoader.queue_images(group, group_specs)
 
     def _load_all_backgrounds(self):
         """Charge tous les fonds de piste disponibles"""
         backgrounds = []
-        for bg_path in settings.BACKGROUND_IMAGES:
-            if bg_path.exists():
-                image = pygame.image.load(bg_path).convert()
-                scale = settings.WIDTH / image.get_width()
-                height = max(1, int(image.get_height() * scale))
-                scaled = pygame.transform.smoothscale(image, (settings.WIDTH, height))
+        for spec in _background_specs():
+            scaled = AssetStore.image(*spec)
+            if scaled:
                 backgrounds.append(scaled)
         return backgrounds
 
@@ -85,6 +134,12 @@ class Renderer:
             self._bg_offset = 0.0  # Reset du scroll
         return Renderer._current_bg_index
 
+    def sync_background(self):
+        """Le fond suit de nouveau l'index partagé (instance reprise par Scene.create)."""
+        for name in ("background_image", "_bg_height"):
+            self.__dict__.pop(name, None)  # Relu par __getattr__ au prochain accès
+        self._bg_offset = 0.0
+
     def get_current_map_index(self):
         """Retourne l'index de la map actuelle"""
         return Renderer._current_bg_index
@@ -98,79 +153,11 @@ class Renderer:
         """Remet l'index du fond à 0 (pour nouvelle partie)"""
         cls._current_bg_index = 0
 
-    def _load_fullscreen_image(self, path):
-        if path.exists():
-            image = pygame.image.load(path).convert()
-            return pygame.transform.smoothscale(image, (settings.WIDTH, settings.HEIGHT))
-        return None
-
-    def _load_countdown_image(self, path):
-        if path.exists():
-            image = pygame.image.load(path).convert_alpha()
-            # Taille du compteur pour 1920x1080
-            return pygame.transform.smoothscale(image, (500, 350))
-        return None
-
-    def _load_player_image(self):
-        if settings.PLAYER_IMG.exists():
-            image = pygame.image.load(settings.PLAYER_IMG).convert_alpha()
-            h = settings.PLAYER_RENDER_HEIGHT
-            scale = h / image.get_height()
-            w = int(image.get_width() * scale)
-            return pygame.transform.smoothscale(image, (w, h))
-        return None
-
-    def _load_hockey_player_image(self):
-        if settings.PLAYER_IMG.exists():
-            image = pygame.image.load(settings.PLAYER_IMG).convert_alpha()
-            return image
-        return None
-
-    def _load_image(self, path, size):
-        if path.exists():
-            image = pygame.image.load(path).convert_alpha()
-            return pygame.transform.smoothscale(image, size)
-        return None
-
-    def _load_background(self):
-        if settings.BACKGROUND_IMG.exists():
-            image = pygame.image.load(settings.BACKGROUND_IMG).convert()
-            scale = settings.WIDTH / image.get_width()
-            height = max(1, int(image.get_height() * scale))
-            return pygame.transform.smoothscale(image, (settings.WIDTH, height))
-        return None
-
-    def _load_menu_background(self):
-        if settings.MENU_BG_IMG.exists():
-            image = pygame.image.load(settings.MENU_BG_IMG).convert()
-            return pygame.transform.smoothscale(image, (settings.WIDTH, settings.HEIGHT))
-        return None
-
-    def _load_menu_button(self):
-        if settings.MENU_BUTTON_IMG.exists():
-            return pygame.image.load(settings.MENU_BUTTON_IMG).convert_alpha()
-        return None
-
-    def _load_button_image(self, path):
-        """Charge une image de bouton pour le menu"""
-        if path.exists():
-            return pygame.image.load(path).convert_alpha()
-        return None
-
-    def _load_gun_image(self):
-        """Charge l'image de l'arme pour la phase de tir"""
-        if settings.GUN_IMG.exists():
-            image = pygame.image.load(settings.GUN_IMG).convert_alpha()
-            # Garde le ratio en fonction de la largeur voulue
-            ratio = image.get_height() / image.get_width()
-            new_w = settings.GUN_WIDTH
-            new_h = int(new_w * ratio)
-            return pygame.transform.smoothscale(image, (new_w, new_h))
-        return None
-
-    def draw_background(self, screen, scroll_speed=0.0):
+    def draw_background(self, screen, scroll=None):
+        """scroll : défilement total en px (None : garder la position actuelle)."""
         if self.background_image:
-            self._bg_offset = (self._bg_offset - scroll_speed) % self._bg_height
+            if scroll is not None:
+                self._bg_offset = -scroll % self._bg_height
             y = -self._bg_offset
             screen.blit(self.background_image, (0, y))
             if y + self._bg_height < settings.HEIGHT:
@@ -178,17 +165,14 @@ class Renderer:
         else:
             screen.fill(settings.BG_COLOR)
 
-    def draw_player(self, screen, player):
-        x, y, w, h = player.rect
+    def draw_player(self, screen, player, alpha=1.0):
+        x, y, w, h = player.rect_at(alpha)
         if self.player_image:
             px = x + w // 2 - self.player_image.get_width() // 2
             py = y + h - self.player_image.get_height()
             angle = int(round(player.tilt))
             if abs(angle) > 0:
-                rotated = self._player_rot_cache.get(angle)
-                if rotated is None:
-                    rotated = pygame.transform.rotate(self.player_image, angle)
-                    self._player_rot_cache[angle] = rotated
+                rotated = SpriteCache.get(self.player_image, angle=angle)
                 rect = rotated.get_rect(center=(px + self.player_image.get_width() // 2, py + self.player_image.get_height() // 2))
                 screen.blit(rotated, rect.topleft)
             else:
@@ -197,20 +181,20 @@ class Renderer:
         pygame.draw.rect(screen, settings.PLAYER_COLOR, (x, y, w, h), border_radius=10)
         pygame.draw.rect(screen, (180, 180, 190), (x + 10, y + 16, w - 20, h - 32), border_radius=6)
 
-    def draw_obstacles(self, screen, obstacles):
+    def draw_obstacles(self, screen, obstacles, alpha=1.0):
         for obstacle in obstacles:
-            x, y, w, h = obstacle.rect
+            x, y, w, h = obstacle.rect_at(alpha)
             # Choisir l'image selon le type d'obstacle
-            if obstacle.obstacle_type == "icicle" and self.icicle_image:
+            if obstacle.obstacle_type is ObstacleKind.ICICLE and self.icicle_image:
                 screen.blit(self.icicle_image, (x, y))
             elif self.obstacle_image:
                 screen.blit(self.obstacle_image, (x, y))
             else:
                 pygame.draw.rect(screen, settings.OBSTACLE_COLOR, (x, y, w, h), border_radius=8)
 
-    def draw_medals(self, screen, medals):
+    def draw_medals(self, screen, medals, alpha=1.0):
         for medal in medals:
-            x, y, w, h = medal.rect
+            x, y, w, h = medal.rect_at(alpha)
             image = self.medal_images.get(medal.kind)
             if image:
                 screen.blit(image, (x, y))
@@ -218,13 +202,13 @@ class Renderer:
                 pygame.draw.circle(screen, (240, 210, 80), (x + w // 2, y + h // 2), w // 2)
 
     def draw_ui(self, screen, score, medal_score, speed):
-        score_text = self.font_small.render(f"Score: {score}", True, settings.UI_COLOR)
-        medal_text = self.font_small.render(f"Medals: {medal_score}", True, settings.UI_COLOR)
-        speed_text = self.font_small.render(f"Speed: {speed:.1f}", True, settings.UI_COLOR)
+        score_text = TextCache.render(self.font_small, f"Score: {score}", settings.UI_COLOR)
+        medal_text = TextCache.render(self.font_small, f"Medals: {medal_score}", settings.UI_COLOR)
+        speed_text = TextCache.render(self.font_small, f"Speed: {speed:.1f}", settings.UI_COLOR)
         shadow = settings.UI_SHADOW
-        screen.blit(self.font_small.render(f"Score: {score}", True, shadow), (17, 13))
-        screen.blit(self.font_small.render(f"Medals: {medal_score}", True, shadow), (17, 37))
-        screen.blit(self.font_small.render(f"Speed: {speed:.1f}", True, shadow), (17, 61))
+        screen.blit(TextCache.render(self.font_small, f"Score: {score}", shadow), (17, 13))
+        screen.blit(TextCache.render(self.font_small, f"Medals: {medal_score}", shadow), (17, 37))
+        screen.blit(TextCache.render(self.font_small, f"Speed: {speed:.1f}", shadow), (17, 61))
         screen.blit(score_text, (16, 12))
         screen.blit(medal_text, (16, 36))
         screen.blit(speed_text, (16, 60))
@@ -233,18 +217,7 @@ class Renderer:
         if self.menu_image:
             screen.blit(self.menu_image, (0, 0))
         else:
-            # fond dégradé moderne
-            for y in range(settings.HEIGHT):
-                t = y / max(1, settings.HEIGHT)
-                r = int(14 + 20 * t)
-                g = int(20 + 40 * t)
-                b = int(36 + 80 * t)
-                pygame.draw.line(screen, (r, g, b), (0, y), (settings.WIDTH, y))
-
-            # halo central
-            glow = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (80, 130, 255, 40), (settings.WIDTH // 2, 220), 320)
-            screen.blit(glow, (0, 0))
+            screen.blit(HudLayers.get("menu_fallback", self._build_menu_fallback), (0, 0))
 
         for rect, hovered, label in buttons:
             # Sélectionner l'image de bouton appropriée
@@ -261,45 +234,60 @@ class Renderer:
                 btn_img = self.button_leaderboard_img
             self._draw_modern_button(screen, rect, hovered, label, btn_img)
 
+    @staticmethod
+    def menu_button_bounds(rect):
+        """Zone qu'un bouton du menu peut couvrir (survol agrandi, ombre, halo)."""
+        grown = rect.inflate(max(20, rect.width // 10 + 2), max(20, rect.height // 10 + 2))
+        return grown.union(rect.move(0, 6))
+
+    def _build_menu_fallback(self):
+        """Fond de menu sans image : dégradé + halo, composé une seule fois."""
+        layer = pygame.Surface((settings.WIDTH, settings.HEIGHT)).convert()
+        # fond dégradé moderne
+        for y in range(settings.HEIGHT):
+            t = y / max(1, settings.HEIGHT)
+            r = int(14 + 20 * t)
+            g = int(20 + 40 * t)
+            b = int(36 + 80 * t)
+            pygame.draw.line(layer, (r, g, b), (0, y), (settings.WIDTH, y))
+
+        # halo central
+        glow = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
+        pygame.draw.circle(glow, (80, 130, 255, 40), (settings.WIDTH // 2, 220), 320)
+        layer.blit(glow, (0, 0))
+        return layer
+
     def _draw_glass_button(self, screen, rect, hovered, label):
         if self.menu_button_image:
-            key = (rect.width, rect.height)
-            img = self._menu_button_cache.get(key)
-            if img is None:
-                img = pygame.transform.smoothscale(self.menu_button_image, (rect.width, rect.height))
-                self._menu_button_cache[key] = img
+            img = SpriteCache.get(self.menu_button_image, size=(rect.width, rect.height))
             if hovered:
                 scale = 1.04
                 w = int(rect.width * scale)
                 h = int(rect.height * scale)
-                hover_key = ("hover", w, h)
-                hover_img = self._menu_button_cache.get(hover_key)
-                if hover_img is None:
-                    hover_img = pygame.transform.smoothscale(img, (w, h))
-                    self._menu_button_cache[hover_key] = hover_img
+                hover_img = SpriteCache.get(img, size=(w, h))
                 screen.blit(hover_img, (rect.centerx - w // 2, rect.centery - h // 2))
             else:
                 screen.blit(img, rect.topleft)
         else:
             pygame.draw.rect(screen, (20, 20, 25), rect, border_radius=12)
             pygame.draw.rect(screen, (240, 240, 240), rect, 2, border_radius=12)
-        text = self.font_big.render(label, True, (245, 255, 255))
-        shadow = self.font_big.render(label, True, (20, 40, 60))
+        text = TextCache.render(self.font_big, label, (245, 255, 255))
+        shadow = TextCache.render(self.font_big, label, (20, 40, 60))
         screen.blit(shadow, (rect.centerx - text.get_width() // 2 + 2, rect.centery - text.get_height() // 2 + 2))
         screen.blit(text, (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2))
 
     def _draw_modern_button(self, screen, rect, hovered, label, button_image=None):
         if button_image:
             # Utiliser l'image du bouton
-            scaled = pygame.transform.smoothscale(button_image, (rect.width, rect.height))
             if hovered:
                 # Effet de hover : légèrement plus grand
                 scale = 1.05
                 w = int(rect.width * scale)
                 h = int(rect.height * scale)
-                hover_scaled = pygame.transform.smoothscale(button_image, (w, h))
+                hover_scaled = SpriteCache.get(button_image, size=(w, h))
                 screen.blit(hover_scaled, (rect.centerx - w // 2, rect.centery - h // 2))
             else:
+                scaled = SpriteCache.get(button_image, size=(rect.width, rect.height))
                 screen.blit(scaled, rect.topleft)
         else:
             # Fallback: dessiner un bouton coloré
@@ -323,12 +311,12 @@ class Renderer:
             pygame.draw.rect(screen, base, rect, border_radius=18)
             pygame.draw.rect(screen, border, rect, 3, border_radius=18)
 
-            text = self.font_big.render(label, True, (245, 250, 255))
+            text = TextCache.render(self.font_big, label, (245, 250, 255))
             screen.blit(text, (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2))
 
     def draw_title(self, screen, title, subtitle):
-        t = self.font_big.render(title, True, settings.UI_COLOR)
-        s = self.font_small.render(subtitle, True, settings.UI_COLOR)
+        t = TextCache.render(self.font_big, title, settings.UI_COLOR)
+        s = TextCache.render(self.font_small, subtitle, settings.UI_COLOR)
         screen.blit(t, (settings.WIDTH // 2 - t.get_width() // 2, settings.HEIGHT // 2 - 60))
         screen.blit(s, (settings.WIDTH // 2 - s.get_width() // 2, settings.HEIGHT // 2))
 
@@ -357,13 +345,11 @@ class Renderer:
                     screen.blit(self.target_image, (x, y))
                 elif target.state == TargetState.HIT:
                     # Teinter en vert
-                    tinted = self.target_image.copy()
-                    tinted.fill((100, 255, 100, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                    tinted = SpriteCache.get(self.target_image, tint=((100, 255, 100, 0), pygame.BLEND_RGBA_ADD))
                     screen.blit(tinted, (x, y))
                 else:  # MISSED
                     # Teinter en rouge
-                    tinted = self.target_image.copy()
-                    tinted.fill((255, 100, 100, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                    tinted = SpriteCache.get(self.target_image, tint=((255, 100, 100, 0), pygame.BLEND_RGBA_ADD))
                     screen.blit(tinted, (x, y))
             else:
                 # Fallback : dessiner des cercles
@@ -378,10 +364,10 @@ class Renderer:
                 pygame.draw.circle(screen, (255, 255, 255), (cx, cy), int(w * 0.35))
                 pygame.draw.circle(screen, color, (cx, cy), int(w * 0.15))
 
-    def draw_sight(self, screen, sight):
+    def draw_sight(self, screen, sight, alpha=1.0):
         """Dessine le viseur avec l'image"""
-        x = int(sight.x)
-        y = int(sight.y)
+        x, y = sight.lerp(alpha)
+        x, y = int(x), int(y)
 
         if self.sight_image:
             screen.blit(self.sight_image, (x, y))
@@ -395,10 +381,11 @@ class Renderer:
             pygame.draw.circle(screen, settings.SIGHT_COLOR, (cx, cy), size // 2, 3)
             pygame.draw.circle(screen, settings.SIGHT_COLOR, (cx, cy), 4)
 
-    def draw_gun(self, screen, sight, recoil_offset=0):
+    def draw_gun(self, screen, sight, recoil_offset=0, alpha=1.0):
         """Dessine l'arme qui suit le viseur avec effet de recul"""
         if self.gun_image:
-            gun_x = int(sight.x + sight.width // 2 - self.gun_image.get_width() // 2)
+            sight_x, _ = sight.lerp(alpha)
+            gun_x = int(sight_x + sight.width // 2 - self.gun_image.get_width() // 2)
             gun_y = settings.HEIGHT - self.gun_image.get_height() - settings.GUN_Y_OFFSET - int(recoil_offset)
             screen.blit(self.gun_image, (gun_x, gun_y))
 
@@ -411,12 +398,18 @@ class Renderer:
         # Essayer d'abord l'image
         image = self.countdown_images.get(step)
         if image:
-            # Animation de scale
-            scale = 0.8 + 0.4 * (1.0 - progress) if progress < 0.3 else 1.0
+            # Animation de scale (plus de filtrage en qualité réduite, aucune en minimal)
+            tier = QualityGovernor.tier
+            scale = 0.8 + 0.4 * (1.0 - progress) if progress < 0.3 and tier < QualityGovernor.MINIMAL else 1.0
             w = int(image.get_width() * scale)
             h = int(image.get_height() * scale)
             if w > 0 and h > 0:
-                scaled = pygame.transform.smoothscale(image, (w, h))
+                if scale == 1.0:
+                    scaled = image.copy() if progress > 0.8 else image
+                elif tier >= QualityGovernor.NO_GLOW:
+                    scaled = pygame.transform.scale(image, (w, h))
+                else:
+                    scaled = pygame.transform.smoothscale(image, (w, h))
                 # Fondu si fin de l'étape
                 if progress > 0.8:
                     alpha = int(255 * (1.0 - (progress - 0.8) * 5))
@@ -433,7 +426,8 @@ class Renderer:
         ring_surf = pygame.Surface((ring_radius * 2 + 40, ring_radius * 2 + 40), pygame.SRCALPHA)
 
         # Halo extérieur
-        for i in range(3):
+        glow_allowed = QualityGovernor.tier < QualityGovernor.NO_GLOW
+        for i in range(3 if glow_allowed else 0):
             alpha = 60 - i * 20
             pygame.draw.circle(ring_surf, (100, 150, 255, alpha),
                              (ring_radius + 20, ring_radius + 20), ring_radius + 10 - i * 5, 4)
@@ -471,68 +465,84 @@ class Renderer:
             glow = (100, 200, 255, 100)
 
         # Halo du texte
-        glow_surf = pygame.Surface((300, 200), pygame.SRCALPHA)
-        glow_font = pygame.font.SysFont("consolas", font_size, bold=True)
-        glow_text = glow_font.render(text, True, glow[:3])
-        glow_text.set_alpha(glow[3])
-        for ox, oy in [(-3, 0), (3, 0), (0, -3), (0, 3)]:
+        font = FontRegistry.animated("consolas", font_size, bold=True)
+        glow_text = TextCache.render(font, text, glow[:3], alpha=glow[3])
+        for ox, oy in [(-3, 0), (3, 0), (0, -3), (0, 3)] if glow_allowed else ():
             screen.blit(glow_text, (cx - glow_text.get_width() // 2 + ox,
                                     cy - glow_text.get_height() // 2 + oy))
 
-        # Texte principal
-        font = pygame.font.SysFont("consolas", font_size, bold=True)
+        # Texte principal (même police que le halo)
         # Ombre
-        shadow = font.render(text, True, (0, 0, 0))
+        shadow = TextCache.render(font, text, (0, 0, 0))
         screen.blit(shadow, (cx - shadow.get_width() // 2 + 4, cy - shadow.get_height() // 2 + 4))
         # Texte
-        rendered = font.render(text, True, color)
+        rendered = TextCache.render(font, text, color)
         screen.blit(rendered, (cx - rendered.get_width() // 2, cy - rendered.get_height() // 2))
 
     def draw_shooting_ui(self, screen, shots_remaining, targets_hit, score, lives):
         """UI pour la phase de tir"""
         # Tirs restants
-        shots_text = self.font_big.render(f"Tirs: {shots_remaining}", True, settings.UI_COLOR)
+        shots_text = TextCache.render(self.font_big, f"Tirs: {shots_remaining}", settings.UI_COLOR)
         screen.blit(shots_text, (settings.WIDTH // 2 - shots_text.get_width() // 2, 30))
 
         # Cibles touchées
-        hit_text = self.font_small.render(f"Touchées: {targets_hit}/{settings.NUM_TARGETS}", True, settings.UI_COLOR)
+        hit_text = TextCache.render(self.font_small, f"Touchées: {targets_hit}/{settings.NUM_TARGETS}", settings.UI_COLOR)
         screen.blit(hit_text, (settings.WIDTH // 2 - hit_text.get_width() // 2, 100))
 
         # Score (gauche)
-        score_text = self.font_small.render(f"Score: {score}", True, settings.UI_COLOR)
+        score_text = TextCache.render(self.font_small, f"Score: {score}", settings.UI_COLOR)
         screen.blit(score_text, (30, 20))
 
         # Vies (droite)
         self.draw_lives(screen, lives)
 
         # Instruction
-        instruction = self.font_small.render("ESPACE pour tirer", True, settings.UI_COLOR)
+        instruction = TextCache.render(self.font_small, "ESPACE pour tirer", settings.UI_COLOR)
         screen.blit(instruction, (settings.WIDTH // 2 - instruction.get_width() // 2, settings.HEIGHT - 80))
 
     def draw_lives(self, screen, lives):
         """Affiche les vies (cœurs) avec image"""
+        self._hud_lives.update(lives)
+        screen.blit(self._hud_lives.surface(), self._lives_origin())
+
+    @staticmethod
+    def _lives_origin():
+        heart_size = settings.HEART_SIZE[0]
+        return (settings.WIDTH - 40 - (heart_size + 12) * 5, settings.HEART_Y)
+
+    def _build_lives(self, lives):
+        """Surface des cœurs pour un nombre de vies donné (voir draw_lives)"""
         heart_size = settings.HEART_SIZE[0]  # Largeur du cœur
-        heart_y = settings.HEART_Y  # Position Y
         max_display = 5
-        start_x = settings.WIDTH - 40 - (heart_size + 12) * min(max_display, max(0, lives + 1))
+        ox, heart_y = self._lives_origin()
+        surface = pygame.Surface(((heart_size + 12) * max_display, heart_size + 2), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        start_x = settings.WIDTH - 40 - (heart_size + 12) * min(max_display, max(0, lives + 1)) - ox
 
+        # BLEND_RGBA_MAX sur un fond transparent = copie exacte (les cœurs ne se chevauchent pas)
         for i in range(max(0, lives + 1)):
             if i >= max_display:
                 break
             x = start_x + i * (heart_size + 12)
             if self.heart_image:
-                screen.blit(self.heart_image, (x, heart_y))
+                surface.blit(self.heart_image, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
             else:
-                self._draw_heart(screen, x, heart_y, heart_size, (220, 60, 60))
+                self._draw_heart(surface, x, 0, heart_size, (220, 60, 60))
 
         if lives < 0:
             # Cœur vide ou grisé quand plus de vies
+            x = settings.WIDTH - 40 - heart_size - ox
             if self.heart_image:
-                gray_heart = self.heart_image.copy()
-                gray_heart.fill((100, 100, 100, 180), special_flags=pygame.BLEND_RGBA_MULT)
-                screen.blit(gray_heart, (settings.WIDTH - 40 - heart_size, heart_y))
+                gray_heart = HudLayers.get("gray_heart", self._build_gray_heart)
+                surface.blit(gray_heart, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
             else:
-                self._draw_heart(screen, settings.WIDTH - 40 - heart_size, heart_y, heart_size, (150, 150, 160), filled=False)
+                self._draw_heart(surface, x, 0, heart_size, (150, 150, 160), filled=False)
+        return surface
+
+    def _build_gray_heart(self):
+        gray_heart = self.heart_image.copy()
+        gray_heart.fill((100, 100, 100, 180), special_flags=pygame.BLEND_RGBA_MULT)
+        return gray_heart
 
     def _draw_heart(self, screen, x, y, size, color, filled=True):
         """Dessine un cœur (fallback si pas d'image)"""
@@ -550,6 +560,19 @@ class Renderer:
 
     def draw_ski_ui(self, screen, score, medal_score, lives, time_to_shooting):
         """UI moderne pour la phase ski"""
+        # Panel gauche (fond, bordures, icônes) : calque statique
+        screen.blit(HudLayers.get("ski_panel", self._build_ski_panel), (20, 15))
+
+        # Valeurs : redessinées seulement quand elles changent
+        self._hud_score.update(score)
+        screen.blit(self._hud_score.surface(), (60, 22))
+        self._hud_medals.update(medal_score)
+        screen.blit(self._hud_medals.surface(), (60, 67))
+
+        # Vies (droite)
+        self.draw_lives(screen, lives)
+
+    def _build_ski_panel(self):
         # Panel gauche avec fond semi-transparent
         panel_width = 280
         panel_height = 120
@@ -564,24 +587,18 @@ class Renderer:
         pygame.draw.rect(panel, (100, 140, 200, 120), (0, 0, panel_width, panel_height), 2, border_radius=12)
         pygame.draw.line(panel, (150, 180, 220, 80), (10, 2), (panel_width - 10, 2), 1)
 
-        screen.blit(panel, (20, 15))
-
-        # Score avec icône
+        # Icônes score et médailles (positions relatives au panel)
         score_icon = "◆"
-        score_label = self.font_tiny.render(score_icon, True, (100, 180, 255))
-        screen.blit(score_label, (35, 30))
-        score_value = self.font_medium.render(f"{score:,}".replace(",", " "), True, (255, 255, 255))
-        screen.blit(score_value, (60, 22))
-
-        # Médailles avec icône
+        panel.blit(TextCache.render(self.font_tiny, score_icon, (100, 180, 255)), (15, 15))
         medal_icon = "★"
-        medal_label = self.font_tiny.render(medal_icon, True, (255, 215, 0))
-        screen.blit(medal_label, (35, 75))
-        medal_value = self.font_medium.render(str(medal_score), True, (255, 220, 100))
-        screen.blit(medal_value, (60, 67))
+        panel.blit(TextCache.render(self.font_tiny, medal_icon, (255, 215, 0)), (15, 60))
+        return panel
 
-        # Vies (droite)
-        self.draw_lives(screen, lives)
+    def _build_score(self, score):
+        return GlyphAtlas.get(self.font_medium, (255, 255, 255)).render(f"{score:,}".replace(",", " "))
+
+    def _build_medals(self, medal_score):
+        return GlyphAtlas.get(self.font_medium, (255, 220, 100)).render(str(medal_score))
 
     def draw_circular_timer(self, screen, time_remaining, total_time):
         """Compteur circulaire moderne avec effets visuels"""
@@ -635,22 +652,24 @@ class Renderer:
         # Texte au centre avec style
         seconds = max(0, int(time_remaining / 1000))
         # Ombre du texte
-        shadow_text = self.font_medium.render(f"{seconds}", True, (0, 0, 0))
-        screen.blit(shadow_text, (cx - shadow_text.get_width() // 2 + 2, cy - shadow_text.get_height() // 2 + 2))
+        text = str(seconds)
+        shadow_glyphs = GlyphAtlas.get(self.font_medium, (0, 0, 0))
+        tx = cx - shadow_glyphs.width(text) // 2
+        ty = cy - shadow_glyphs.height // 2
+        shadow_glyphs.blit(screen, text, (tx + 2, ty + 2))
         # Texte principal
-        timer_text = self.font_medium.render(f"{seconds}", True, (255, 255, 255))
-        screen.blit(timer_text, (cx - timer_text.get_width() // 2, cy - timer_text.get_height() // 2))
+        GlyphAtlas.get(self.font_medium, (255, 255, 255)).blit(screen, text, (tx, ty))
 
         # Label "TIR" sous le compteur
-        label = self.font_tiny.render("TIR", True, (150, 160, 180))
+        label = TextCache.render(self.font_tiny, "TIR", (150, 160, 180))
         screen.blit(label, (cx - label.get_width() // 2, cy + radius + 8))
 
-    def draw_player_blinking(self, screen, player):
+    def draw_player_blinking(self, screen, player, alpha=1.0):
         """Dessine le joueur avec effet clignotant si invincible"""
         if player.is_invincible():
             if int(pygame.time.get_ticks() / 100) % 2 == 0:
                 return  # Ne pas dessiner (effet clignotant)
-        self.draw_player(screen, player)
+        self.draw_player(screen, player, alpha)
 
     # Hockey
 
@@ -680,14 +699,14 @@ class Renderer:
         pygame.draw.rect(screen, settings.HOCKEY_GOAL_COLOR,
                          (rink_rect.right, goal_top, 12, goal_h))
 
-    def draw_hockey_player(self, screen, player, color, use_sprite=False):
-        x, y, w, h = player.rect
+    def draw_hockey_player(self, screen, player, color, use_sprite=False, alpha=1.0):
+        x, y, w, h = player.rect_at(alpha)
         if use_sprite and self.hockey_player_image:
             img = self.hockey_player_image
             scale = h / img.get_height()
             new_w = max(1, int(img.get_width() * scale))
             new_h = max(1, int(img.get_height() * scale))
-            sprite = pygame.transform.smoothscale(img, (new_w, new_h))
+            sprite = SpriteCache.get(img, size=(new_w, new_h))
             sx = x + w // 2 - new_w // 2
             sy = y + h // 2 - new_h // 2
             screen.blit(sprite, (sx, sy))
@@ -696,7 +715,7 @@ class Renderer:
         pygame.draw.rect(screen, (30, 30, 30), (x, y, w, h), 3, border_radius=18)
 
     def draw_hockey_puck(self, screen, puck, trail=None):
-        if trail:
+        if trail and QualityGovernor.tier < QualityGovernor.NO_TRAIL:
             for i, (tx, ty) in enumerate(trail):
                 alpha = max(0, 200 - i * 12)
                 radius = max(2, puck.radius - i // 3)
@@ -711,32 +730,30 @@ class Renderer:
         pygame.draw.circle(screen, (30, 30, 30), (int(puck.x), int(puck.y)), puck.radius, 3)
 
     def draw_hockey_ui(self, screen, player_score, ai_score, time_left_ms):
-        score_text = self.font_medium.render(f"JOUEUR {player_score}  -  {ai_score} IA", True, (245, 245, 250))
+        score_text = TextCache.render(self.font_medium, f"JOUEUR {player_score}  -  {ai_score} IA", (245, 245, 250))
         screen.blit(score_text, (settings.WIDTH // 2 - score_text.get_width() // 2, 30))
 
-        subtitle = self.font_small.render("Premier à 3 buts", True, (200, 210, 220))
+        subtitle = TextCache.render(self.font_small, "Premier à 3 buts", (200, 210, 220))
         screen.blit(subtitle, (settings.WIDTH // 2 - subtitle.get_width() // 2, 80))
 
-        hint = self.font_tiny.render("ZQSD / FLÈCHES pour bouger - M pour menu", True, (200, 200, 210))
+        hint = TextCache.render(self.font_tiny, "ZQSD / FLÈCHES pour bouger - M pour menu", (200, 200, 210))
         screen.blit(hint, (settings.WIDTH // 2 - hint.get_width() // 2, settings.HEIGHT - 60))
 
     def draw_hockey_goal_text(self, screen, text):
-        msg = self.font_big.render(text, True, (255, 215, 0))
+        msg = TextCache.render(self.font_big, text, (255, 215, 0))
         screen.blit(msg, (settings.WIDTH // 2 - msg.get_width() // 2, settings.HEIGHT // 2 - 40))
 
     def draw_hockey_over(self, screen, result_text, player_score, ai_score):
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        Overlays.darken(screen, 180)
 
-        title = self.font_big.render(result_text, True, (255, 215, 0))
+        title = TextCache.render(self.font_big, result_text, (255, 215, 0))
         screen.blit(title, (settings.WIDTH // 2 - title.get_width() // 2, settings.HEIGHT // 2 - 120))
 
-        score = self.font_medium.render(f"JOUEUR {player_score}  -  {ai_score} IA", True, (240, 240, 245))
+        score = TextCache.render(self.font_medium, f"JOUEUR {player_score}  -  {ai_score} IA", (240, 240, 245))
         screen.blit(score, (settings.WIDTH // 2 - score.get_width() // 2, settings.HEIGHT // 2 - 30))
 
-        replay = self.font_small.render("ENTER pour rejouer", True, (200, 200, 210))
-        menu = self.font_small.render("M pour menu", True, (200, 200, 210))
+        replay = TextCache.render(self.font_small, "ENTER pour rejouer", (200, 200, 210))
+        menu = TextCache.render(self.font_small, "M pour menu", (200, 200, 210))
         screen.blit(replay, (settings.WIDTH // 2 - replay.get_width() // 2, settings.HEIGHT // 2 + 60))
         screen.blit(menu, (settings.WIDTH // 2 - menu.get_width() // 2, settings.HEIGHT // 2 + 110))
 
@@ -745,30 +762,34 @@ class Renderer:
     def draw_flash(self, screen, color, alpha):
         if alpha <= 0:
             return
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((*color, min(255, int(alpha))))
-        screen.blit(overlay, (0, 0))
+        if QualityGovernor.tier < QualityGovernor.MINIMAL:
+            Overlays.fill(screen, (*color, alpha))
+            return
+        # Qualité minimale : le flash ne colore que les bords de l'écran
+        band = settings.HEIGHT // 12
+        for rect in ((0, 0, settings.WIDTH, band),
+                     (0, settings.HEIGHT - band, settings.WIDTH, band),
+                     (0, band, band, settings.HEIGHT - 2 * band),
+                     (settings.WIDTH - band, band, band, settings.HEIGHT - 2 * band)):
+            Overlays.fill(screen, (*color, alpha), rect)
 
     def draw_floating_text(self, screen, texts):
         """Dessine des textes flottants animés
-        texts: liste de dicts {text, x, y, color, alpha, scale}
+        texts: liste de FloatingText
         """
         for t in texts:
-            if t['alpha'] <= 0:
+            if t.alpha <= 0:
                 continue
-            font_size = int(24 * t.get('scale', 1.0))
-            font = pygame.font.SysFont("consolas", font_size, bold=True)
-            text_surface = font.render(t['text'], True, t['color'])
-            text_surface.set_alpha(int(t['alpha']))
-            screen.blit(text_surface, (int(t['x']) - text_surface.get_width() // 2, int(t['y'])))
+            font = FontRegistry.animated("consolas", 24 * t.scale, bold=True)
+            text_surface = TextCache.render(font, t.text, t.color, alpha=int(t.alpha))
+            screen.blit(text_surface, (int(t.x) - text_surface.get_width() // 2, int(t.y)))
 
     # Game Over
 
-    def draw_game_over(self, screen, score, medal_score, distance, best_score, animation_progress):
+    def draw_game_over(self, screen, score, medal_score, distance, best_score, animation_progress,
+                       prompts=True):
         # Fond semi-transparent
-        overlay = pygame.Surface((settings.WIDTH, settings.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        Overlays.darken(screen, 180)
 
         # Animation de zoom pour le titre
         title_scale = min(1.0, animation_progress * 2)
@@ -777,10 +798,10 @@ class Renderer:
         # Titre "GAME OVER"
         title_size = int(48 * title_scale)
         if title_size > 0:
-            title_font = pygame.font.SysFont("consolas", title_size, bold=True)
-            title = title_font.render("GAME OVER", True, (255, 80, 80))
+            title_font = FontRegistry.animated("consolas", title_size, bold=True)
+            title = TextCache.render(title_font, "GAME OVER", (255, 80, 80))
             # Ombre
-            shadow = title_font.render("GAME OVER", True, (80, 20, 20))
+            shadow = TextCache.render(title_font, "GAME OVER", (80, 20, 20))
             screen.blit(shadow, (settings.WIDTH // 2 - title.get_width() // 2 + 3, title_y + 3))
             screen.blit(title, (settings.WIDTH // 2 - title.get_width() // 2, title_y))
 
@@ -804,34 +825,37 @@ class Renderer:
         if animation_progress > 0.9 and best_score > 0:
             best_alpha = min(255, int((animation_progress - 0.9) * 1000))
             if score >= best_score:
-                best_text = self.font_medium.render("NOUVEAU RECORD !", True, (255, 215, 0))
+                best_text = TextCache.render(self.font_medium, "NOUVEAU RECORD !", (255, 215, 0), alpha=best_alpha)
             else:
-                best_text = self.font_small.render(f"Meilleur: {best_score}", True, (180, 180, 180))
-            best_text.set_alpha(best_alpha)
+                best_text = TextCache.render(self.font_small, f"Meilleur: {best_score}", (180, 180, 180), alpha=best_alpha)
             screen.blit(best_text, (settings.WIDTH // 2 - best_text.get_width() // 2, settings.HEIGHT // 2 + 130))
 
         # Instructions
-        if animation_progress >= 1.0:
-            pulse = 0.8 + 0.2 * math.sin(pygame.time.get_ticks() / 200)
+        if animation_progress >= 1.0 and prompts:
+            self.draw_game_over_prompts(screen)
 
-            # Rejouer
-            replay = self.font_small.render("ESPACE pour rejouer", True, (200, 200, 200))
-            replay.set_alpha(int(255 * pulse))
-            screen.blit(replay, (settings.WIDTH // 2 - replay.get_width() // 2, settings.HEIGHT - 80))
+    def draw_game_over_prompts(self, screen):
+        """Instructions clignotantes de l'écran de fin ; retourne les zones dessinées."""
+        pulse = 0.8 + 0.2 * math.sin(pygame.time.get_ticks() / 200)
 
-            # Menu
-            menu = self.font_small.render("M pour menu", True, (200, 200, 200))
-            menu.set_alpha(int(255 * pulse))
-            screen.blit(menu, (settings.WIDTH // 2 - menu.get_width() // 2, settings.HEIGHT - 35))
+        # Rejouer
+        replay = TextCache.render(self.font_small, "ESPACE pour rejouer", (200, 200, 200), alpha=int(255 * pulse))
+        replay_rect = screen.blit(replay, (settings.WIDTH // 2 - replay.get_width() // 2, settings.HEIGHT - 80))
+
+        # Menu
+        menu = TextCache.render(self.font_small, "M pour menu", (200, 200, 200), alpha=int(255 * pulse))
+        menu_rect = screen.blit(menu, (settings.WIDTH // 2 - menu.get_width() // 2, settings.HEIGHT - 35))
+        return [replay_rect, menu_rect]
 
     def _draw_stat_box(self, screen, cx, cy, label, value, color, alpha):
         """Dessine une boîte de statistique"""
         # Label
-        label_text = self.font_tiny.render(label, True, (150, 150, 150))
-        label_text.set_alpha(alpha)
+        label_text = TextCache.render(self.font_tiny, label, (150, 150, 150), alpha=alpha)
         screen.blit(label_text, (cx - label_text.get_width() // 2, cy - 12))
 
         # Valeur
-        value_text = self.font_medium.render(value, True, color)
-        value_text.set_alpha(alpha)
+        value_text = TextCache.render(self.font_medium, value, color, alpha=alpha)
         screen.blit(value_text, (cx - value_text.get_width() // 2, cy + 5))
+
+
+Profiler.register(Renderer)
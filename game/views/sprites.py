@@ -0,0 +1,48 @@
+import pygame
+
+from game.core import settings
+from game.core.cache import LRUCache
+
+
+class SpriteCache:
+    """Sprites transformés (échelle, rotation, teinte), partagés par tous les renderers.
+
+    Clé : (identité de la surface source, taille, angle, teinte). Le cache
+    est borné en octets (SPRITE_CACHE_BYTES), les entrées les moins
+    récemment utilisées sont évincées.
+    Les surfaces retournées sont partagées : ne pas les modifier.
+    """
+
+    _cache = LRUCache(max_cost=settings.SPRITE_CACHE_BYTES)
+
+    @classmethod
+    def get(cls, surface, size=None, angle=0, tint=None):
+        """tint : None ou (couleur RGBA, special_flags) appliqué par fill()."""
+        key = (id(surface), size, angle, tint)
+        entry = cls._cache.get(key)
+        # La source est gardée dans l'entrée : un id réutilisé ne peut pas
+        # renvoyer le sprite d'une autre surface.
+        if entry is not None and entry[0] is surface:
+            return entry[1]
+
+        result = surface
+        if size is not None and size != surface.get_size():
+            result = pygame.transform.smoothscale(result, size)
+        if angle:
+            result = pygame.transform.rotate(result, angle)
+        if tint is not None:
+            color, flags = tint
+            result = result.copy()
+            result.fill(color, special_flags=flags)
+
+        w, h = result.get_size()
+        cls._cache.put(key, (surface, result), cost=w * h * 4)
+        return result
+
+    @classmethod
+    def stats(cls):
+        return cls._cache.stats()
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
@@ -0,0 +1,31 @@
+from game.core import settings
+from game.core.cache import LRUCache
+
+
+class TextCache:
+    """Surfaces de texte déjà rendues, partagées par tous les renderers.
+
+    Clé : (police, texte, couleur, antialias). Un texte n'est rasterisé
+    qu'à sa première apparition ou quand il change.
+    Les surfaces sont partagées : ne pas les modifier, passer par alpha.
+    """
+
+    _cache = LRUCache(max_items=settings.TEXT_CACHE_SIZE)
+
+    @classmethod
+    def render(cls, font, text, color, antialias=True, alpha=None):
+        key = (font, text, tuple(color), antialias)
+        surface = cls._cache.get(key)
+        if surface is None:
+            surface = cls._cache.put(key, font.render(text, antialias, color))
+        # L'alpha est réappliqué à chaque appel car la surface est partagée
+        surface.set_alpha(255 if alpha is None else alpha)
+        return surface
+
+    @classmethod
+    def stats(cls):
+        return cls._cache.stats()
+
+    @classmethod
+    def clear(cls):
+        cls._cache.clear()
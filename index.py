@@ -1,9 +1,78 @@
-﻿from game.core.game import Game
+﻿import argparse
+import logging
 
+from game.core.startup import StartupTrace  # En premier : origine du chronométrage
 
-def main():
-    Game().run()
+from game.core import settings
+from game.core.game import Game
+from game.core.gcstats import GCMonitor
+from game.core.headless import SCENES, run_headless, run_replay
+from game.core.latency import LatencyMonitor
+from game.core.pacing import STRATEGIES
+from game.core.replay import Replay
+
+StartupTrace.mark("imports")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Winter Sprint Milano")
+    parser.add_argument("--headless", action="store_true",
+                        help="sans fenêtre ni son, horloge virtuelle, affiche le débit")
+    parser.add_argument("--scene", choices=SCENES, default="ski",
+                        help="scène simulée en mode headless")
+    parser.add_argument("--frames", type=int, help="nombre de frames à simuler")
+    parser.add_argument("--runs", type=int, help="nombre de parties complètes à simuler")
+    parser.add_argument("--no-render", action="store_true",
+                        help="simulation seule, sans rendu")
+    parser.add_argument("--no-bot", action="store_true",
+                        help="aucune entrée (par défaut un bot joue)")
+    parser.add_argument("--trace-startup", action="store_true",
+                        help="affiche la durée de chaque phase du démarrage")
+    parser.add_argument("--pacing", choices=STRATEGIES,
+                        help="attente entre frames (par défaut settings.FRAME_PACING)")
+    parser.add_argument("--entity-backend", choices=("lists", "numpy"),
+                        help="stockage des obstacles / médailles (par défaut settings.ENTITY_BACKEND)")
+    parser.add_argument("--measure-latency", action="store_true",
+                        help="histogrammes de latence entrée -> image et de jitter à la fermeture")
+    parser.add_argument("--gc-stats", action="store_true",
+                        help="compte les pauses du ramasse-miettes et les affiche à la fermeture")
+    parser.add_argument("--seed", type=int,
+                        help="graine de chaque partie (par défaut tirée au hasard)")
+    parser.add_argument("--record", action="store_true",
+                        help="enregistre chaque partie dans replays/ (graine, entrées, sommes de contrôle)")
+    parser.add_argument("--replay", metavar="FICHIER",
+                        help="rejoue un enregistrement sans rendu et vérifie ses sommes de contrôle")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    StartupTrace.enabled = args.trace_startup
+    if args.pacing:
+        settings.FRAME_PACING = args.pacing
+    if args.entity_backend:
+        settings.ENTITY_BACKEND = args.entity_backend
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s", datefmt="%H:%M:%S")
+    if args.gc_stats:
+        GCMonitor.install()
+    if args.seed is not None:
+        settings.RUN_SEED = args.seed
+    if args.replay:
+        raise SystemExit(0 if run_replay(args.replay) else 1)
+    if args.record:
+        Replay.mode = "record"
+    if args.headless:
+        run_headless(args.scene, frames=args.frames, runs=args.runs,
+                     render=not args.no_render, bot=not args.no_bot)
+        return
+    LatencyMonitor.enabled = args.measure_latency
+    game = Game()
+    game.run()
+    if args.measure_latency:
+        print(LatencyMonitor.report(game.pacing))
+    if args.gc_stats:
+        print(GCMonitor.report())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()